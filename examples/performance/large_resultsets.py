@@ -90,6 +90,17 @@ def test_orm_columns(n):
         pass
 
 
+@Profiler.profile
+def test_orm_columns_plain_tuples(n):
+    """Load individual columns into plain tuples using the ORM."""
+
+    sess = Session(engine)
+    for row in sess.query(
+        Customer.id, Customer.name,
+            Customer.description).plain_tuples().yield_per(10000).limit(n):
+        pass
+
+
 @Profiler.profile
 def test_core_fetchall(n):
     """Load Core result rows using fetchall."""
@@ -129,6 +140,20 @@ def test_core_fetchmany(n):
                 data = row['id'], row['name'], row['description']
 
 
+@Profiler.profile
+def test_core_fetch_columns(n):
+    """Load Core result columns using Core / fetch_columns."""
+
+    with engine.connect() as conn:
+        result = conn.execute(Customer.__table__.select().limit(n))
+        while True:
+            ids, names, descriptions = result.fetch_columns(10000)
+            if not ids:
+                break
+            for data in zip(ids, names, descriptions):
+                pass
+
+
 @Profiler.profile
 def test_dbapi_fetchall_plus_append_objects(n):
     """Load rows using DBAPI fetchall(), generate an object for each row."""
@@ -626,6 +626,60 @@ static PyTypeObject DecimalResultProcessorType = {
     0,                                          /* tp_new */
 };
 
+static PyObject *
+process_column(PyObject *self, PyObject *args)
+{
+    PyObject *processor, *values, *fast, *result, *value, *processed;
+    PyCFunction cfunc = NULL;
+    PyObject *cself = NULL;
+    Py_ssize_t i, size;
+
+    if (!PyArg_UnpackTuple(args, "process_column", 2, 2,
+                           &processor, &values))
+        return NULL;
+
+    fast = PySequence_Fast(values, "process_column expects a sequence");
+    if (fast == NULL)
+        return NULL;
+
+    /* Call single-argument C functions, such as the processors of this
+     * module, directly rather than building an argument tuple for each
+     * value. */
+    if (PyCFunction_Check(processor) &&
+            PyCFunction_GET_FLAGS(processor) == METH_O) {
+        cfunc = PyCFunction_GET_FUNCTION(processor);
+        cself = PyCFunction_GET_SELF(processor);
+    }
+
+    size = PySequence_Fast_GET_SIZE(fast);
+    result = PyList_New(size);
+    if (result == NULL) {
+        Py_DECREF(fast);
+        return NULL;
+    }
+
+    for (i = 0; i < size; i++) {
+        value = PySequence_Fast_GET_ITEM(fast, i);
+        if (processor == Py_None) {
+            Py_INCREF(value);
+            processed = value;
+        } else if (cfunc != NULL) {
+            processed = cfunc(cself, value);
+        } else {
+            processed = PyObject_CallFunctionObjArgs(processor, value, NULL);
+        }
+        if (processed == NULL) {
+            Py_DECREF(result);
+            Py_DECREF(fast);
+            return NULL;
+        }
+        PyList_SET_ITEM(result, i, processed);
+    }
+
+    Py_DECREF(fast);
+    return result;
+}
+
 static PyMethodDef module_methods[] = {
     {"int_to_boolean", int_to_boolean, METH_O,
      "Convert an integer to a boolean."},
@@ -639,6 +693,9 @@ static PyMethodDef module_methods[] = {
      "Convert an ISO string to a datetime.time object."},
     {"str_to_date", str_to_date, METH_O,
      "Convert an ISO string to a datetime.date object."},
+    {"process_column", process_column, METH_VARARGS,
+     "Apply a result processor to each value of a sequence, "
+     "returning a list."},
     {NULL, NULL, 0, NULL}        /* Sentinel */
 };
 
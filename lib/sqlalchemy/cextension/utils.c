@@ -175,9 +175,195 @@ distill_params(PyObject *self, PyObject *args)
 	}
 }
 
+static void
+raise_argument_error(Py_ssize_t num, Py_ssize_t length, Py_ssize_t size)
+{
+	PyObject *exc_module, *argument_error, *message;
+
+	exc_module = PyImport_ImportModule("sqlalchemy.exc");
+	if (exc_module == NULL) {
+		return;
+	}
+	argument_error = PyObject_GetAttrString(exc_module, "ArgumentError");
+	Py_DECREF(exc_module);
+	if (argument_error == NULL) {
+		return;
+	}
+#if PY_MAJOR_VERSION >= 3
+	message = PyUnicode_FromFormat(
+#else
+	message = PyString_FromFormat(
+#endif
+		"Positional parameter set %zd contains %zd values; expected %zd",
+		num, length, size);
+	if (message != NULL) {
+		PyErr_SetObject(argument_error, message);
+		Py_DECREF(message);
+	}
+	Py_DECREF(argument_error);
+}
+
+/*
+    Given a list of positional parameter sets, return a list of
+    DBAPI parameter structures, applying bind processors.
+
+    Each entry of indexes refers to the position within each row of
+    the value for a DBAPI parameter, or is -1 for a parameter taking
+    its value from defaults.  When names is not None, each parameter
+    structure is a dictionary keyed on those names; otherwise the
+    values are passed to sequence_format.
+
+ */
+static PyObject *
+process_tuples(PyObject *self, PyObject *args)
+{
+	PyObject *rows, *indexes, *processors, *defaults, *names;
+	PyObject *sequence_format;
+	PyObject *rows_fast = NULL, *result = NULL;
+	PyObject *row, *row_fast, *value, *processed, *param, *converted;
+	PyObject *processor;
+	Py_ssize_t size, nslots, nrows, num, i, idx, length;
+	Py_ssize_t *slot_indexes = NULL;
+	int as_tuple;
+
+	if (!PyArg_ParseTuple(args, "OO!O!O!OnO:_process_tuples",
+			&rows, &PyTuple_Type, &indexes, &PyTuple_Type, &processors,
+			&PyTuple_Type, &defaults, &names, &size, &sequence_format)) {
+		return NULL;
+	}
+
+	nslots = PyTuple_GET_SIZE(indexes);
+	if (PyTuple_GET_SIZE(processors) != nslots ||
+			PyTuple_GET_SIZE(defaults) != nslots ||
+			(names != Py_None && (!PyTuple_Check(names) ||
+				PyTuple_GET_SIZE(names) != nslots))) {
+		PyErr_SetString(PyExc_ValueError,
+			"indexes, processors, defaults and names must be "
+			"tuples of the same length");
+		return NULL;
+	}
+
+	slot_indexes = PyMem_New(Py_ssize_t, nslots ? nslots : 1);
+	if (slot_indexes == NULL) {
+		return PyErr_NoMemory();
+	}
+	for (i = 0; i < nslots; i++) {
+		slot_indexes[i] = PyNumber_AsSsize_t(
+			PyTuple_GET_ITEM(indexes, i), PyExc_OverflowError);
+		if (slot_indexes[i] == -1 && PyErr_Occurred()) {
+			goto error;
+		}
+		if (slot_indexes[i] >= size) {
+			PyErr_SetString(PyExc_ValueError, "index out of range");
+			goto error;
+		}
+	}
+	as_tuple = sequence_format == (PyObject *)&PyTuple_Type;
+
+	rows_fast = PySequence_Fast(rows, "rows must be a sequence");
+	if (rows_fast == NULL) {
+		goto error;
+	}
+	nrows = PySequence_Fast_GET_SIZE(rows_fast);
+	result = PyList_New(nrows);
+	if (result == NULL) {
+		goto error;
+	}
+
+	for (num = 0; num < nrows; num++) {
+		row = PySequence_Fast_GET_ITEM(rows_fast, num);
+		row_fast = PySequence_Fast(row, "parameter set must be a sequence");
+		if (row_fast == NULL) {
+			goto error;
+		}
+		length = PySequence_Fast_GET_SIZE(row_fast);
+		if (length != size) {
+			Py_DECREF(row_fast);
+			raise_argument_error(num, length, size);
+			goto error;
+		}
+
+		if (names == Py_None) {
+			param = PyTuple_New(nslots);
+		}
+		else {
+			param = PyDict_New();
+		}
+		if (param == NULL) {
+			Py_DECREF(row_fast);
+			goto error;
+		}
+
+		for (i = 0; i < nslots; i++) {
+			idx = slot_indexes[i];
+			if (idx < 0) {
+				value = PyTuple_GET_ITEM(defaults, i);
+				Py_INCREF(value);
+			}
+			else {
+				value = PySequence_Fast_GET_ITEM(row_fast, idx);
+				processor = PyTuple_GET_ITEM(processors, i);
+				if (processor != Py_None) {
+					processed = PyObject_CallFunctionObjArgs(
+						processor, value, NULL);
+					if (processed == NULL) {
+						Py_DECREF(param);
+						Py_DECREF(row_fast);
+						goto error;
+					}
+					value = processed;
+				}
+				else {
+					Py_INCREF(value);
+				}
+			}
+
+			if (names == Py_None) {
+				/* steals the reference to value */
+				PyTuple_SET_ITEM(param, i, value);
+			}
+			else {
+				if (PyDict_SetItem(
+						param, PyTuple_GET_ITEM(names, i), value) == -1) {
+					Py_DECREF(value);
+					Py_DECREF(param);
+					Py_DECREF(row_fast);
+					goto error;
+				}
+				Py_DECREF(value);
+			}
+		}
+		Py_DECREF(row_fast);
+
+		if (names == Py_None && !as_tuple) {
+			converted = PyObject_CallFunctionObjArgs(
+				sequence_format, param, NULL);
+			Py_DECREF(param);
+			if (converted == NULL) {
+				goto error;
+			}
+			param = converted;
+		}
+		/* steals the reference to param */
+		PyList_SET_ITEM(result, num, param);
+	}
+
+	Py_DECREF(rows_fast);
+	PyMem_Free(slot_indexes);
+	return result;
+
+error:
+	Py_XDECREF(result);
+	Py_XDECREF(rows_fast);
+	PyMem_Free(slot_indexes);
+	return NULL;
+}
+
 static PyMethodDef module_methods[] = {
     {"_distill_params", distill_params, METH_VARARGS,
      "Distill an execute() parameter structure."},
+    {"_process_tuples", process_tuples, METH_VARARGS,
+     "Convert positional parameter sets into DBAPI parameters."},
     {NULL, NULL, 0, NULL}        /* Sentinel */
 };
 
@@ -49,6 +49,9 @@ def _is_dev_environment():
 
 class MySQLDialect_gaerdbms(MySQLDialect_mysqldb):
 
+    # the rdbms DBAPI has no server side cursor
+    supports_server_side_cursors = False
+
     @classmethod
     def dbapi(cls):
 
@@ -19,7 +19,9 @@ MySQL-Python Compatibility
 
 The pymysql DBAPI is a pure Python port of the MySQL-python (MySQLdb) driver,
 and targets 100% compatibility.   Most behavioral notes for MySQL-python apply
-to the pymysql driver as well.
+to the pymysql driver as well, including support for
+:ref:`server side cursors <mysqldb_server_side_cursors>` using pymysql's
+``SSCursor``.
 
 """
 
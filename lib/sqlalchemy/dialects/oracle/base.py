@@ -1046,6 +1046,13 @@ class OracleDialect(default.DefaultDialect):
                 name = unicode(name)
         return name
 
+    def fetch_sequence_values(self, connection, sequence, count):
+        return [
+            row[0] for row in connection.execute(
+                sql.select([sequence.next_value()]).suffix_with(
+                    "CONNECT BY LEVEL <= %d" % count))
+        ]
+
     def _get_default_schema_name(self, connection):
         return self.normalize_name(
             connection.execute('SELECT USER FROM DUAL').scalar())
@@ -1791,6 +1791,7 @@ class PGDialect(default.DefaultDialect):
     supports_default_values = True
     supports_empty_insert = False
     supports_multivalues_insert = True
+    insert_executemany_returning = True
     default_paramstyle = 'pyformat'
     ischema_names = ischema_names
     colspecs = colspecs
@@ -1919,6 +1920,25 @@ class PGDialect(default.DefaultDialect):
             sql.text("SELECT gid FROM pg_prepared_xacts"))
         return [row[0] for row in resultset]
 
+    def copy_from(self, connection, table, rows, columns=None,
+                  chunk_size=1000):
+        """Load rows into a table using ``COPY FROM STDIN``.
+
+        See :func:`.postgresql.copy_from` for a description of the
+        arguments; this method is used by the ORM when
+        ``use_copy=True`` is passed to :meth:`.Session.bulk_insert_mappings`.
+
+        """
+        from .bulk import copy_from
+        return copy_from(connection, table, rows, columns, chunk_size)
+
+    def fetch_sequence_values(self, connection, sequence, count):
+        return [
+            row[0] for row in connection.execute(
+                sql.select([sequence.next_value()]).select_from(
+                    sql.func.generate_series(1, count)))
+        ]
+
     def _get_default_schema_name(self, connection):
         return connection.scalar("select current_schema()")
 
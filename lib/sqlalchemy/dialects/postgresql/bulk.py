@@ -0,0 +1,320 @@
+# postgresql/bulk.py
+# Copyright (C) 2005-2014 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+import binascii
+import datetime
+import decimal
+import itertools
+
+from .hstore import _serialize_hstore
+from ... import exc, util
+from ... import types as sqltypes
+from ...engine import Engine
+
+__all__ = ('copy_from', )
+
+
+def copy_from(connection, table, rows, columns=None, chunk_size=1000):
+    """Load rows into a table using PostgreSQL's ``COPY FROM STDIN``.
+
+    E.g.::
+
+        from sqlalchemy.dialects.postgresql import copy_from
+
+        with engine.begin() as conn:
+            copy_from(
+                conn, users,
+                ({"id": i, "name": "user %d" % i} for i in range(1000000))
+            )
+
+    ``COPY`` is typically much faster than INSERT, even when INSERT is
+    run as an "executemany" or with multiple VALUES.  Rows are read from
+    the given iterable ``chunk_size`` at a time and streamed to the
+    server as they are encoded, so that the full set of rows need not be
+    present in memory.  Each value is passed through the bind processor
+    of its column's type, as would occur for an INSERT, and is then
+    rendered in the text format of ``COPY``; this includes values for
+    the :class:`.JSON`, :class:`.HSTORE`, :class:`.ARRAY` and range
+    types.
+
+    Server-side defaults and sequences apply to those columns of the table
+    which are not named; Python-side column defaults are **not** invoked.
+
+    Requires a dialect which supports ``COPY``, currently psycopg2.
+
+    :param connection: a :class:`.Connection` or :class:`.Engine`.  If
+     no transaction is in progress, the ``COPY`` takes place within a
+     transaction of its own which is committed when it completes.
+
+    :param table: the :class:`.Table` to be loaded.
+
+    :param rows: an iterable of rows, each of which is either a dictionary
+     keyed on :attr:`.Column.key`, or a tuple of values in the same order
+     as the columns being loaded.
+
+    :param columns: optional sequence of :class:`.Column` objects or
+     column keys to be loaded.  If omitted, the columns are the keys
+     of the first row when rows are dictionaries, else all columns of the
+     table.
+
+    :param chunk_size: the number of rows to encode at a time.
+
+    :return: the number of rows loaded.
+
+    .. versionadded:: 1.0.0
+
+    """
+    if isinstance(connection, Engine):
+        with connection.begin() as conn:
+            return copy_from(conn, table, rows, columns, chunk_size)
+
+    dialect = connection.dialect
+    if not dialect.supports_copy_from:
+        raise exc.InvalidRequestError(
+            "The %s dialect does not support COPY FROM" %
+            dialect.dialect_description)
+
+    rows = iter(rows)
+    try:
+        first = next(rows)
+    except StopIteration:
+        return 0
+    rows = itertools.chain([first], rows)
+    is_dict = isinstance(first, dict)
+
+    if columns is None:
+        if is_dict:
+            columns = [c for c in table.c if c.key in first]
+        else:
+            columns = list(table.c)
+    else:
+        columns = [
+            table.c[c] if isinstance(c, util.string_types) else c
+            for c in columns
+        ]
+
+    preparer = dialect.identifier_preparer
+    statement = "COPY %s (%s) FROM STDIN" % (
+        preparer.format_table(table),
+        ", ".join(preparer.format_column(c) for c in columns)
+    )
+
+    encode = _row_encoder(
+        dialect, columns,
+        [c.key for c in columns] if is_dict else None)
+    stream = _CopyStream(rows, encode, chunk_size)
+
+    if connection.in_transaction():
+        _copy(connection, statement, stream)
+    else:
+        with connection.begin():
+            _copy(connection, statement, stream)
+    return stream.rowcount
+
+
+def _copy(connection, statement, stream):
+    if connection._echo:
+        connection.engine.logger.info(statement)
+    cursor = connection.connection.cursor()
+    try:
+        connection.dialect.do_copy_from(cursor, statement, stream)
+    except Exception as e:
+        connection._handle_dbapi_exception(e, statement, {}, cursor, None)
+    finally:
+        cursor.close()
+
+
+class _CopyStream(object):
+    """File-like object which encodes rows into ``COPY`` text format,
+    ``chunk_size`` rows at a time, as the DBAPI reads from it.
+
+    """
+
+    def __init__(self, rows, encode, chunk_size):
+        self._rows = rows
+        self._encode = encode
+        self.chunk_size = chunk_size
+        self.rowcount = 0
+        self._buf = ''
+        self._pos = 0
+        self._exhausted = False
+
+    def _fill(self):
+        chunk = list(itertools.islice(self._rows, self.chunk_size))
+        if not chunk:
+            self._exhausted = True
+            return False
+        self.rowcount += len(chunk)
+        self._buf = self._buf[self._pos:] + \
+            ''.join([self._encode(row) for row in chunk])
+        self._pos = 0
+        return True
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            while self._fill():
+                pass
+            size = len(self._buf) - self._pos
+        else:
+            while len(self._buf) - self._pos < size and \
+                    not self._exhausted and self._fill():
+                pass
+        data = self._buf[self._pos:self._pos + size]
+        self._pos += len(data)
+        return data
+
+
+def _escape(text):
+    return text.replace('\\', '\\\\').replace('\t', '\\t').\
+        replace('\n', '\\n').replace('\r', '\\r')
+
+
+def _quote(text):
+    return '"%s"' % text.replace('\\', '\\\\').replace('"', '\\"')
+
+
+def _row_encoder(dialect, columns, keys):
+    render = _renderer(dialect)
+    encoders = [_value_encoder(dialect, c.type, render) for c in columns]
+    if keys is not None:
+        pairs = list(zip(keys, encoders))
+
+        def encode(row):
+            return '\t'.join(
+                [encoder(row[key]) for key, encoder in pairs]) + '\n'
+    else:
+        def encode(row):
+            return '\t'.join(
+                [encoder(value) for encoder, value in zip(encoders, row)]) + \
+                '\n'
+    return encode
+
+
+def _value_encoder(dialect, type_, render):
+    """Return a callable rendering a value of the given type as a
+    field of ``COPY`` text format."""
+
+    affinity = type_._type_affinity
+    if affinity is not None and issubclass(affinity, sqltypes._Binary):
+        # the DBAPI's Binary() wrapper is of no use here; apply only
+        # the user-defined processing, if any, and render bytea in hex
+        # format directly
+        if isinstance(type_, sqltypes.TypeDecorator) and \
+                type_._has_bind_processor:
+            process = type_.process_bind_param
+        else:
+            process = None
+
+        def encode(value):
+            if process is not None:
+                value = process(value, dialect)
+            if value is None:
+                return '\\N'
+            return '\\\\x' + _text(binascii.hexlify(value), 'ascii')
+        return encode
+
+    bind = type_._cached_bind_processor(dialect)
+    if bind is not None:
+        def encode(value):
+            value = bind(value)
+            if value is None:
+                return '\\N'
+            return _escape(render(value))
+    else:
+        def encode(value):
+            if value is None:
+                return '\\N'
+            return _escape(render(value))
+    return encode
+
+
+if util.py2k:
+    def _text(value, encoding):
+        if isinstance(value, unicode):
+            return value.encode(encoding)
+        return value
+else:
+    def _text(value, encoding):
+        if isinstance(value, bytes):
+            return value.decode(encoding)
+        return value
+
+
+def _renderer(dialect):
+    """Return a callable rendering a Python value, as produced by a bind
+    processor, in the textual input format of PostgreSQL."""
+
+    encoding = dialect.encoding
+
+    def render_text(value):
+        return _text(value, encoding)
+
+    def render_bool(value):
+        return 't' if value else 'f'
+
+    def render_float(value):
+        if value != value:
+            return 'NaN'
+        elif value == float('inf'):
+            return 'Infinity'
+        elif value == float('-inf'):
+            return '-Infinity'
+        return repr(value)
+
+    def render_iso(value):
+        return value.isoformat()
+
+    def render_interval(value):
+        return '%d days %d seconds %d microseconds' % (
+            value.days, value.seconds, value.microseconds)
+
+    def render_array(value):
+        return '{%s}' % ','.join([
+            'NULL' if elem is None
+            else render_array(elem) if isinstance(elem, (list, tuple))
+            else _quote(render(elem))
+            for elem in value
+        ])
+
+    def render_hstore(value):
+        return _text(_serialize_hstore(value), encoding)
+
+    def render_range(value):
+        if value.isempty:
+            return 'empty'
+        return '%s%s,%s%s' % (
+            '[' if value.lower_inc else '(',
+            '' if value.lower is None else _quote(render(value.lower)),
+            '' if value.upper is None else _quote(render(value.upper)),
+            ']' if value.upper_inc else ')'
+        )
+
+    def render_other(value):
+        if hasattr(value, 'isempty') and hasattr(value, 'lower_inc'):
+            return render_range(value)
+        return _text(util.text_type(value), encoding)
+
+    renderers = {
+        bool: render_bool,
+        float: render_float,
+        list: render_array,
+        tuple: render_array,
+        dict: render_hstore,
+        datetime.datetime: render_iso,
+        datetime.date: render_iso,
+        datetime.time: render_iso,
+        datetime.timedelta: render_interval,
+        decimal.Decimal: str,
+    }
+    for type_ in util.string_types + (util.binary_type, ):
+        renderers[type_] = render_text
+    for type_ in util.int_types:
+        renderers[type_] = str
+
+    def render(value):
+        return renderers.get(type(value), render_other)(value)
+    return render
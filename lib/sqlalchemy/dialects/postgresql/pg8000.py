@@ -26,6 +26,28 @@ It is not necessary, though is also harmless, to pass the "encoding" parameter
 to :func:`.create_engine` when using pg8000.
 
 
+.. _pg8000_server_side_cursors:
+
+Server Side Cursors
+-------------------
+
+pg8000 itself buffers the full result of each statement in client memory.
+The pg8000 dialect supports the ``stream_results`` execution option, as well
+as the ``server_side_cursors`` argument to :func:`.create_engine`, in the
+same way as the psycopg2 dialect.  As pg8000 offers no server side cursor
+of its own, the dialect runs the statement within a PostgreSQL
+``DECLARE CURSOR`` and retrieves rows in successively larger batches
+using ``FETCH``::
+
+    result = conn.execution_options(stream_results=True).\\
+        execute(table.select())
+
+As with any PostgreSQL cursor, the statement must be a SELECT, and it must
+run within a transaction, so server side cursors are not available with the
+``AUTOCOMMIT`` isolation level.
+
+.. versionadded:: 1.0.0
+
 .. _pg8000_isolation_level:
 
 pg8000 Transaction Isolation Level
@@ -88,8 +110,68 @@ class _PGNumericNoBind(_PGNumeric):
         return None
 
 
+_server_side_id = util.counter()
+
+
+class _PG8000ServerSideCursor(object):
+    """Proxy a pg8000 cursor, running statements within a
+    ``DECLARE CURSOR`` and retrieving rows with ``FETCH``.
+
+    pg8000 has no server side cursor of its own; this emulates
+    the "named cursor" of psycopg2 in terms of plain SQL.  As with a
+    named cursor, ``description`` is available once the first rows
+    have been fetched.
+
+    """
+
+    def __init__(self, cursor, ident):
+        self.cursor = cursor
+        self.ident = ident
+        self._declared = False
+
+    @property
+    def rowcount(self):
+        return -1
+
+    def execute(self, statement, parameters=()):
+        self.cursor.execute(
+            "DECLARE %s NO SCROLL CURSOR FOR %s" % (self.ident, statement),
+            parameters)
+        self._declared = True
+
+    def fetchone(self):
+        rows = self.fetchmany(1)
+        if rows:
+            return rows[0]
+        else:
+            return None
+
+    def fetchmany(self, size=None):
+        if size is None:
+            size = self.cursor.arraysize
+        self.cursor.execute(
+            "FETCH FORWARD %d FROM %s" % (size, self.ident))
+        return self.cursor.fetchall()
+
+    def fetchall(self):
+        self.cursor.execute("FETCH FORWARD ALL FROM %s" % self.ident)
+        return self.cursor.fetchall()
+
+    def close(self):
+        if self._declared:
+            self._declared = False
+            self.cursor.execute("CLOSE %s" % self.ident)
+        self.cursor.close()
+
+    def __getattr__(self, key):
+        return getattr(self.cursor, key)
+
+
 class PGExecutionContext_pg8000(PGExecutionContext):
-    pass
+    def create_server_side_cursor(self):
+        ident = "c_%s_%s" % (hex(id(self))[2:],
+                             hex(_server_side_id())[2:])
+        return _PG8000ServerSideCursor(self._dbapi_connection.cursor(), ident)
 
 
 class PGCompiler_pg8000(PGCompiler):
@@ -120,6 +202,7 @@ class PGDialect_pg8000(PGDialect):
 
     default_paramstyle = 'format'
     supports_sane_multi_rowcount = True
+    supports_server_side_cursors = True
     execution_ctx_cls = PGExecutionContext_pg8000
     statement_compiler = PGCompiler_pg8000
     preparer = PGIdentifierPreparer_pg8000
@@ -133,6 +216,10 @@ class PGDialect_pg8000(PGDialect):
         }
     )
 
+    def __init__(self, server_side_cursors=False, **kwargs):
+        PGDialect.__init__(self, **kwargs)
+        self.server_side_cursors = server_side_cursors
+
     def initialize(self, connection):
         if self.dbapi and hasattr(self.dbapi, '__version__'):
             self._dbapi_version = tuple([
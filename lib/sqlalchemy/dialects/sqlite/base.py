@@ -792,6 +792,13 @@ class SQLiteExecutionContext(default.DefaultExecutionContext):
         else:
             return colname, None
 
+    def _result_metadata_key(self, description):
+        return (
+            self._preserve_raw_colnames,
+            super(SQLiteExecutionContext, self)._result_metadata_key(
+                description)
+        )
+
 
 class SQLiteDialect(default.DefaultDialect):
     name = 'sqlite'
@@ -804,6 +811,10 @@ class SQLiteDialect(default.DefaultDialect):
     supports_multivalues_insert = True
     supports_right_nested_joins = False
 
+    # SQLITE_MAX_VARIABLE_NUMBER as compiled by default prior to
+    # SQLite 3.32
+    executemany_values_max_parameters = 999
+
     default_paramstyle = 'qmark'
     execution_ctx_cls = SQLiteExecutionContext
     statement_compiler = SQLiteCompiler
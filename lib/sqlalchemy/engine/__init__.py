@@ -82,6 +82,8 @@ from .result import (
 )
 
 from .util import (
+    CompiledCache,
+    StatementStats,
     connection_memoize
 )
 
@@ -150,6 +152,32 @@ def create_engine(*args, **kwargs):
            By default, result row names match case-sensitively.
            In version 0.7 and prior, all matches were case-insensitive.
 
+    :param compiled_cache_size=0: size of the engine-wide cache of
+        compiled SQL constructs, which is keyed on the structure of each
+        statement executed, so that a newly constructed statement which is
+        equivalent to one already executed doesn't need to be compiled again.
+        The cache is disabled by default, as generating the structural key
+        adds overhead to each execution; pass a size such as ``500`` to
+        enable it.   The cache is then available
+        as :attr:`.Engine.compiled_cache`.
+
+        .. versionadded:: 1.0.0
+
+        .. seealso::
+
+            :ref:`engine_compiled_cache`
+
+    :param collect_statement_stats=False: if True, the :class:`.Engine`
+        aggregates execution time, fetch time and row counts for each
+        distinct statement executed, available via
+        :attr:`.Engine.statement_stats`.
+
+        .. versionadded:: 1.0.0
+
+        .. seealso::
+
+            :ref:`engine_statement_stats`
+
     :param connect_args: a dictionary of options which will be
         passed directly to the DBAPI's ``connect()`` method as
         additional keyword arguments.  See the example
@@ -240,6 +268,28 @@ def create_engine(*args, **kwargs):
         be applied to all connections.  See
         :meth:`~sqlalchemy.engine.Connection.execution_options`
 
+    :param executemany_mode=None: when set to ``'values'``, an INSERT
+        statement invoked with many parameter sets is rewritten into
+        pages of multi-row ``VALUES (...), (...)`` expressions, each page
+        invoked with a single ``cursor.execute()`` call, rather than
+        being passed to ``cursor.executemany()``.  Applies to backends
+        which support multi-row VALUES; an INSERT that includes
+        :meth:`.Insert.returning` delivers the returned rows for every
+        parameter set.  May also be established for an individual
+        statement or connection using the ``executemany_mode``
+        execution option.
+
+        .. versionadded:: 1.0.0
+
+    :param executemany_values_page_size=100: number of parameter sets
+        rendered into each statement when ``executemany_mode='values'``
+        is in use.  The number is reduced where needed so that each
+        statement stays within the maximum number of bound parameters
+        accepted by the database, where the dialect establishes one,
+        such as 999 for SQLite.
+
+        .. versionadded:: 1.0.0
+
     :param implicit_returning=True: When ``True``, a RETURNING-
         compatible construct, if available, will be used to
         fetch newly generated primary key values when a single row
@@ -319,6 +369,27 @@ def create_engine(*args, **kwargs):
         instantiate the pool in this case, you just indicate what type
         of pool to be used.
 
+    :param pool_collect_stats=False: if True, the connection pool collects
+        counters and timings regarding its usage, available from
+        :meth:`.Pool.stats`.
+
+        .. versionadded:: 1.0.0
+
+        .. seealso::
+
+            :ref:`pool_stats`
+
+    :param pool_idle_timeout=None: number of seconds after which an
+        idle connection in a :class:`~sqlalchemy.pool.QueuePool` is
+        closed, as long as more than ``pool_min_size`` connections are
+        held.
+
+        .. versionadded:: 1.0.0
+
+        .. seealso::
+
+            :ref:`pool_min_size`
+
     :param pool_logging_name:  String identifier which will be used within
        the "name" field of logging records generated within the
        "sqlalchemy.pool" logger. Defaults to a hexstring of the object's
@@ -332,6 +403,35 @@ def create_engine(*args, **kwargs):
         of 0 indicates no limit; to disable pooling, set ``poolclass`` to
         :class:`~sqlalchemy.pool.NullPool` instead.
 
+    :param pool_min_size=0: the number of connections a
+        :class:`~sqlalchemy.pool.QueuePool` keeps open at minimum; once
+        the first connection is made, the remainder are opened in a
+        background thread.
+
+        .. versionadded:: 1.0.0
+
+        .. seealso::
+
+            :ref:`pool_min_size`
+
+    :param pool_pre_ping=False: boolean, if True will enable the connection
+        pool "pre-ping" feature that tests connections for liveness upon
+        checkout, transparently replacing those which have been
+        disconnected.
+
+        .. versionadded:: 1.0.0
+
+        .. seealso::
+
+            :ref:`pool_disconnects_pessimistic`
+
+    :param pool_pre_ping_interval=1: when ``pool_pre_ping`` is enabled,
+        connections which were returned to the pool within this number of
+        seconds are not pinged upon checkout.   Set to zero to ping upon
+        every checkout.
+
+        .. versionadded:: 1.0.0
+
     :param pool_recycle=-1: this setting causes the pool to recycle
         connections after the given number of seconds has passed. It
         defaults to -1, or no timeout. For example, setting to 3600
@@ -353,6 +453,17 @@ def create_engine(*args, **kwargs):
         up on getting a connection from the pool. This is only used
         with :class:`~sqlalchemy.pool.QueuePool`.
 
+    :param pool_use_lifo=False: use LIFO (last-in-first-out) when retrieving
+        connections from :class:`.QueuePool` instead of FIFO
+        (first-in-first-out).  Using LIFO, connections which are not needed
+        during non-peak periods remain idle and may expire or be recycled.
+
+        .. versionadded:: 1.0.0
+
+        .. seealso::
+
+            :ref:`pool_use_lifo`
+
     :param strategy='plain': selects alternate engine implementations.
         Currently available are:
 
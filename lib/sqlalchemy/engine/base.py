@@ -12,10 +12,11 @@ from __future__ import with_statement
 
 
 import sys
+import time
 from .. import exc, util, log, interfaces
 from ..sql import util as sql_util
 from .interfaces import Connectable, ExceptionContext
-from .util import _distill_params
+from .util import _distill_params, CompiledCache, StatementStats
 import contextlib
 
 
@@ -234,8 +235,30 @@ class Connection(Connectable):
         :param stream_results: Available on: Connection, statement.
           Indicate to the dialect that results should be
           "streamed" and not pre-buffered, if possible.  This is a limitation
-          of many DBAPIs.  The flag is currently understood only by the
-          psycopg2 dialect.
+          of many DBAPIs.  The flag is currently understood by the
+          psycopg2, pg8000, mysqldb and pymysql dialects, which use a
+          server side cursor for the statement.
+
+          .. versionchanged:: 1.0.0 ``stream_results`` is supported by
+             the pg8000, mysqldb and pymysql dialects in addition to
+             psycopg2.
+
+        :param executemany_mode: Available on: Connection, statement.
+          Establishes the ``executemany_mode`` described at
+          :func:`.create_engine` for an individual connection or statement;
+          a value of ``'values'`` causes an INSERT invoked with many
+          parameter sets to be rendered as pages of multi-row VALUES.
+
+          .. versionadded:: 1.0.0
+
+        :param positional_rows: Available on: Connection, statement.
+          When True, rows of the result are accessible by integer position,
+          slice and iteration only, and not by string name or
+          :class:`.Column`.  The mapping of keys used to target columns in
+          each row is then not built at all, reducing the setup cost of
+          results with many columns.
+
+          .. versionadded:: 1.0.0
 
         """
         c = self._clone()
@@ -789,6 +812,35 @@ class Connection(Connectable):
          To execute a textual SQL statement which uses bound parameters in a
          DBAPI-agnostic way, use the :func:`~.expression.text` construct.
 
+         An :func:`~.expression.insert` or :func:`~.expression.update`
+         construct also accepts a collection of tuples, which for a
+         statement without a :meth:`.ValuesBase.values` clause supply
+         values for the leading columns of the table in order::
+
+             conn.execute(
+                 table.insert(),
+                 [(1, "v1"), (2, "v2"), (3, "v3")]
+             )
+
+         When :meth:`.ValuesBase.values` is present, each tuple instead
+         supplies the :func:`.bindparam` values which the statement
+         requires, in the order in which they are rendered::
+
+             conn.execute(
+                 table.update().
+                 where(table.c.id == bindparam("b_id")).
+                 values(value=bindparam("b_value")),
+                 [("v1", 1), ("v2", 2)]
+             )
+
+         Tuples are converted directly into the parameters passed to the
+         DBAPI, without the intermediary dictionaries otherwise produced
+         for each parameter set, making this the most efficient form for
+         an "executemany" of a large number of rows.
+
+         .. versionadded:: 1.0.0 insert() and update() accept a
+            collection of tuples.
+
         """
         if isinstance(object, util.string_types[0]):
             return self._execute_text(object, multiparams, params)
@@ -869,10 +921,17 @@ class Connection(Connectable):
                     fn(self, elem, multiparams, params)
 
         distilled_params = _distill_params(multiparams, params)
+        positional = False
         if distilled_params:
             # note this is usually dict but we support RowProxy
             # as well; but dict.keys() as an iterable is OK
-            keys = distilled_params[0].keys()
+            try:
+                keys = distilled_params[0].keys()
+            except AttributeError:
+                # a list of tuples for insert() / update()
+                keys = self._positional_column_keys(
+                    elem, distilled_params[0])
+                positional = True
         else:
             keys = []
 
@@ -886,23 +945,83 @@ class Connection(Connectable):
                     dialect=dialect, column_keys=keys,
                     inline=len(distilled_params) > 1)
                 self._execution_options['compiled_cache'][key] = compiled_sql
+        elif self.engine.compiled_cache is not None:
+            compiled_sql = self._compile_w_engine_cache(
+                elem, keys, len(distilled_params) > 1)
         else:
             compiled_sql = elem.compile(
                 dialect=dialect, column_keys=keys,
                 inline=len(distilled_params) > 1)
 
-        ret = self._execute_context(
-            dialect,
-            dialect.execution_ctx_cls._init_compiled,
-            compiled_sql,
-            distilled_params,
-            compiled_sql, distilled_params
-        )
+        if positional:
+            ret = self._execute_context(
+                dialect,
+                dialect.execution_ctx_cls._init_compiled,
+                compiled_sql,
+                distilled_params,
+                compiled_sql, distilled_params, True
+            )
+        else:
+            ret = self._execute_context(
+                dialect,
+                dialect.execution_ctx_cls._init_compiled,
+                compiled_sql,
+                distilled_params,
+                compiled_sql, distilled_params
+            )
         if self._has_events or self.engine._has_events:
             self.dispatch.after_execute(self,
                                         elem, multiparams, params, ret)
         return ret
 
+    def _positional_column_keys(self, elem, row):
+        """Return the column keys with which to compile an INSERT or
+        UPDATE executed with positional parameter sets."""
+
+        try:
+            column_keys = elem._positional_column_keys
+        except AttributeError:
+            raise exc.ArgumentError(
+                "Positional parameter sets are accepted only by "
+                "insert() and update() constructs; use dictionaries "
+                "keyed on parameter names")
+        return column_keys(len(row))
+
+    def _compile_w_engine_cache(self, elem, keys, inline):
+        """Compile a sql.ClauseElement, making use of the
+        engine-wide cache of compiled constructs keyed on statement
+        structure."""
+
+        cache = self.engine.compiled_cache
+        cache_key = elem._generate_cache_key()
+        if cache_key is not None:
+            structure, elements = cache_key
+            key = structure, tuple(sorted(keys)), inline
+            try:
+                entry = cache.get(key)
+            except TypeError:
+                # a plain value within the structure turned out
+                # to be unhashable
+                entry = key = None
+        else:
+            entry = key = None
+
+        if entry is not None:
+            cache.hits += 1
+            compiled_sql, cached_elements = entry
+            return compiled_sql._copy_for_statement(
+                elem, cached_elements, elements)
+
+        compiled_sql = elem.compile(
+            dialect=self.dialect, column_keys=keys, inline=inline)
+        if key is not None and \
+                compiled_sql._can_copy_for_statement(elements):
+            cache.misses += 1
+            cache[key] = compiled_sql, elements
+        else:
+            cache.uncacheable += 1
+        return compiled_sql
+
     def _execute_compiled(self, compiled, multiparams, params):
         """Execute a sql.Compiled object."""
 
@@ -988,6 +1107,11 @@ class Connection(Connectable):
                 "%r",
                 sql_util._repr_params(parameters, batches=10)
             )
+
+        statement_stats = self.engine.statement_stats
+        if statement_stats is not None:
+            start = time.time()
+
         try:
             if context.executemany:
                 for fn in () if not self.dialect._has_events \
@@ -1031,6 +1155,9 @@ class Connection(Connectable):
                 cursor,
                 context)
 
+        if statement_stats is not None:
+            elapsed = time.time() - start
+
         if self._has_events or self.engine._has_events:
             self.dispatch.after_cursor_execute(self, cursor,
                                                statement,
@@ -1046,7 +1173,10 @@ class Connection(Connectable):
 
         # create a resultproxy, get rowcount/implicit RETURNING
         # rows, close cursor if no further results pending
-        result = context.get_result_proxy()
+        if context._executemany_returning_rows is not None:
+            result = context._get_executemany_values_result_proxy()
+        else:
+            result = context.get_result_proxy()
         if context.isinsert:
             if context._is_implicit_returning:
                 context._fetch_implicit_returning(result)
@@ -1067,6 +1197,9 @@ class Connection(Connectable):
             result.rowcount
             result.close(_autoclose_connection=False)
 
+        if statement_stats is not None:
+            statement_stats._executed(statement, result, elapsed)
+
         if context.should_autocommit and self._root.__transaction is None:
             self._root._commit_impl(autocommit=True)
 
@@ -1577,13 +1710,49 @@ class Engine(Connectable, log.Identified):
     _has_events = False
     _connection_cls = Connection
 
+    compiled_cache = None
+    """The :class:`.CompiledCache` used to cache compiled SQL constructs
+    executed by this :class:`.Engine`, keyed on their structure, or
+    ``None`` if caching is disabled, which is the default.
+
+    .. versionadded:: 1.0.0
+
+    .. seealso::
+
+        :ref:`engine_compiled_cache`
+
+    """
+
+    statement_stats = None
+    """The :class:`.StatementStats` collecting execution statistics for
+    each statement executed by this :class:`.Engine`, or ``None``
+    unless the engine was created with ``collect_statement_stats=True``.
+
+    .. versionadded:: 1.0.0
+
+    .. seealso::
+
+        :ref:`engine_statement_stats`
+
+    """
+
     def __init__(self, pool, dialect, url,
                  logging_name=None, echo=None, proxy=None,
-                 execution_options=None
+                 execution_options=None,
+                 compiled_cache_size=0,
+                 collect_statement_stats=False
                  ):
         self.pool = pool
         self.url = url
         self.dialect = dialect
+        if compiled_cache_size:
+            self.compiled_cache = CompiledCache(compiled_cache_size)
+        else:
+            self.compiled_cache = None
+        if collect_statement_stats:
+            self.statement_stats = StatementStats()
+        else:
+            self.statement_stats = None
         self.pool._dialect = dialect
         if logging_name:
             self.logging_name = logging_name
@@ -1996,6 +2165,8 @@ class OptionEngine(Engine):
         self._proxied = proxied
         self.url = proxied.url
         self.dialect = proxied.dialect
+        self.compiled_cache = proxied.compiled_cache
+        self.statement_stats = proxied.statement_stats
         self.logging_name = proxied.logging_name
         self.echo = proxied.echo
         log.instance_logger(self, echoflag=self.echo)
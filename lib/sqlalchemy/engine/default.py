@@ -22,11 +22,17 @@ from .. import exc, util, pool, processors
 import codecs
 import weakref
 from .. import event
+from .util import _process_tuples, _positional_error
 
 AUTOCOMMIT_REGEXP = re.compile(
     r'\s*(?:UPDATE|INSERT|CREATE|DELETE|DROP|ALTER)',
     re.I | re.UNICODE)
 
+# When we're handed literal SQL, ensure it's a SELECT query
+SERVER_SIDE_CURSOR_RE = re.compile(
+    r'\s*SELECT',
+    re.I | re.UNICODE)
+
 
 class DefaultDialect(interfaces.Dialect):
     """Default implementation of Dialect"""
@@ -109,6 +115,25 @@ class DefaultDialect(interfaces.Dialect):
     supports_empty_insert = True
     supports_multivalues_insert = False
 
+    executemany_mode = None
+    executemany_values_page_size = 100
+
+    executemany_values_max_parameters = None
+    """maximum number of bound parameters the database accepts within
+    a single statement, to which the number of parameter sets rendered
+    into each statement by ``executemany_mode='values'`` is limited.
+    """
+
+    insert_executemany_returning = False
+    """dialect can deliver the rows of an INSERT..RETURNING for every
+    parameter set of an executemany, using ``executemany_mode='values'``.
+    """
+
+    supports_server_side_cursors = False
+    server_side_cursors = False
+
+    supports_copy_from = False
+
     server_version_info = None
 
     construct_arguments = None
@@ -163,7 +188,9 @@ class DefaultDialect(interfaces.Dialect):
                  supports_right_nested_joins=None,
                  case_sensitive=True,
                  supports_native_boolean=None,
-                 label_length=None, **kwargs):
+                 label_length=None,
+                 executemany_mode=None,
+                 executemany_values_page_size=None, **kwargs):
 
         if not getattr(self, 'ported_sqla_06', True):
             util.warn(
@@ -199,6 +226,15 @@ class DefaultDialect(interfaces.Dialect):
                 (label_length, self.max_identifier_length))
         self.label_length = label_length
 
+        if executemany_mode not in (None, 'values'):
+            raise exc.ArgumentError(
+                "Invalid value '%s' for executemany_mode; "
+                "expected None or 'values'" % (executemany_mode, ))
+        if executemany_mode is not None:
+            self.executemany_mode = executemany_mode
+        if executemany_values_page_size is not None:
+            self.executemany_values_page_size = executemany_values_page_size
+
         if self.description_encoding == 'use_encoding':
             self._description_decoder = \
                 processors.to_unicode_processor_factory(
@@ -411,6 +447,26 @@ class DefaultDialect(interfaces.Dialect):
     def do_close(self, dbapi_connection):
         dbapi_connection.close()
 
+    @util.memoized_property
+    def _dialect_specific_select_one(self):
+        return str(expression.select([1]).compile(dialect=self))
+
+    def do_ping(self, dbapi_connection):
+        cursor = None
+        try:
+            cursor = dbapi_connection.cursor()
+            try:
+                cursor.execute(self._dialect_specific_select_one)
+            finally:
+                cursor.close()
+        except self.dbapi.Error as err:
+            if self.is_disconnect(err, dbapi_connection, cursor):
+                return False
+            else:
+                raise
+        else:
+            return True
+
     def create_xid(self):
         """Create a random two-phase transaction ID.
 
@@ -429,8 +485,116 @@ class DefaultDialect(interfaces.Dialect):
     def do_release_savepoint(self, connection, name):
         connection.execute(expression.ReleaseSavepointClause(name))
 
+    def fetch_sequence_values(self, connection, sequence, count):
+        """Return a list of ``count`` new values from the given
+        :class:`.Sequence`.
+
+        Used by the ORM when ``sequence_prefetch`` is set on a
+        :func:`.mapper`.  The default implementation invokes the sequence
+        once per value; dialects which can return many values from one
+        statement override this.
+
+        """
+        return [connection.scalar(sequence) for i in range(count)]
+
     def do_executemany(self, cursor, statement, parameters, context=None):
-        cursor.executemany(statement, parameters)
+        if context is not None and context._executemany_values:
+            self._do_executemany_values(
+                cursor, statement, parameters, context)
+        else:
+            cursor.executemany(statement, parameters)
+
+    def _split_insert_values(self, statement, context):
+        """Split an INSERT statement around its single-row VALUES clause.
+
+        Returns a tuple of ``(head, values_expr, tail)`` where ``head``
+        ends with the ``VALUES`` keyword and ``values_expr`` is the
+        contents of its parenthesized row, or ``None`` if the statement
+        no longer contains the clause rendered by the compiler, e.g. when
+        rewritten by a ``before_cursor_execute`` event.
+
+        """
+        values_expr = context.compiled.insert_single_values_expr
+        if not self.supports_unicode_statements:
+            values_expr = values_expr.encode(self.encoding)
+        values_clause = " VALUES (%s)" % values_expr
+        idx = statement.find(values_clause)
+        if idx == -1:
+            return None
+        return statement[:idx] + " VALUES ", values_expr, \
+            statement[idx + len(values_clause):]
+
+    def _do_executemany_values(self, cursor, statement, parameters, context):
+        """Execute an INSERT against many parameter sets by rewriting its
+        VALUES clause into pages of multiple rows each.
+
+        Used when ``executemany_mode='values'`` is in effect; a RETURNING
+        clause is delivered for every row across all pages.
+
+        """
+        split = self._split_insert_values(statement, context)
+        if split is None:
+            cursor.executemany(statement, parameters)
+            return
+        head, values_expr, tail = split
+        compiled = context.compiled
+
+        page_size = self.executemany_values_page_size
+        max_params = self.executemany_values_max_parameters
+        if max_params is not None and parameters[0]:
+            page_size = max(
+                1, min(page_size, max_params // len(parameters[0])))
+        returning = context._is_explicit_returning
+        rowcount = 0
+        rows = []
+
+        if self.positional:
+            def render_page(page):
+                text = head + \
+                    ", ".join(["(%s)" % values_expr] * len(page)) + tail
+                params = []
+                for param in page:
+                    params.extend(param)
+                return text, self.execute_sequence_format(params)
+        else:
+            names = sorted(
+                parameters[0], key=lambda name: len(name), reverse=True)
+            bindtemplate = compiled.bindtemplate
+            placeholders = dict(
+                (bindtemplate % {'name': name}, name) for name in names)
+            placeholder_re = re.compile(
+                r"(%s)(?!\w)" % "|".join(
+                    re.escape(bindtemplate % {'name': name})
+                    for name in names))
+
+            def render_page(page):
+                groups = []
+                params = dict(page[0])
+                for num, param in enumerate(page):
+                    groups.append(
+                        "(%s)" % placeholder_re.sub(
+                            lambda m: bindtemplate % {
+                                'name': "%s_m%d" % (
+                                    placeholders[m.group(1)], num)},
+                            values_expr)
+                    )
+                    for name, value in param.items():
+                        params["%s_m%d" % (name, num)] = value
+                return head + ", ".join(groups) + tail, params
+
+        for start in range(0, len(parameters), page_size):
+            text, params = render_page(
+                parameters[start:start + page_size])
+            cursor.execute(text, params)
+            if returning:
+                rows.extend(cursor.fetchall())
+            if rowcount != -1:
+                rowcount = -1 if cursor.rowcount == -1 \
+                    else rowcount + cursor.rowcount
+
+        context._executemany_rowcount = rowcount
+        if returning:
+            context._executemany_returning_rows = rows
 
     def do_execute(self, cursor, statement, parameters, context=None):
         cursor.execute(statement, parameters)
@@ -460,13 +624,31 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
     postfetch_cols = None
     prefetch_cols = None
     returning_cols = None
+    returned_defaults = None
     _is_implicit_returning = False
     _is_explicit_returning = False
 
+    _executemany_values = False
+    _executemany_rowcount = None
+    _executemany_returning_rows = None
+
     # a hook for SQLite's translation of
     # result column names
     _translate_colname = None
 
+    _is_server_side = False
+
+    @util.memoized_property
+    def compiled_parameters(self):
+        # established here only when positional parameter sets were
+        # converted directly into DBAPI parameters
+        compiled = self.compiled
+        keys = compiled._positional_keys
+        return [
+            compiled.construct_params(dict(zip(keys, row)), _group_number=grp)
+            for grp, row in enumerate(self._positional_parameters)
+        ]
+
     @classmethod
     def _init_ddl(cls, dialect, connection, dbapi_connection, compiled_ddl):
         """Initialize execution context for a DDLElement construct."""
@@ -502,8 +684,14 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
 
     @classmethod
     def _init_compiled(cls, dialect, connection, dbapi_connection,
-                       compiled, parameters):
-        """Initialize execution context for a Compiled construct."""
+                       compiled, parameters, positional=False):
+        """Initialize execution context for a Compiled construct.
+
+        If ``positional`` is True, ``parameters`` is a list of tuples
+        corresponding to the ``_positional_keys`` of the compiled
+        construct.
+
+        """
 
         self = cls.__new__(cls)
         self.root_connection = connection
@@ -536,12 +724,28 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         self.isupdate = compiled.isupdate
         self.isdelete = compiled.isdelete
 
+        if positional:
+            plan = compiled._positional_plan
+            if plan is not None and not compiled.prefetch:
+                # compiled_parameters are produced on demand
+                self._positional_parameters = parameters
+            else:
+                keys = compiled._positional_keys
+                plan = None
+                for grp, row in enumerate(parameters):
+                    if len(row) != len(keys):
+                        raise _positional_error(grp, len(row), len(keys))
+                parameters = [dict(zip(keys, row)) for row in parameters]
+        else:
+            plan = None
+
         if not parameters:
             self.compiled_parameters = [compiled.construct_params()]
         else:
-            self.compiled_parameters = \
-                [compiled.construct_params(m, _group_number=grp) for
-                 grp, m in enumerate(parameters)]
+            if plan is None:
+                self.compiled_parameters = \
+                    [compiled.construct_params(m, _group_number=grp) for
+                     grp, m in enumerate(parameters)]
 
             self.executemany = len(parameters) > 1
 
@@ -559,13 +763,29 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
                     else:
                         self._process_executesingle_defaults()
 
+            self._executemany_values = self.executemany and \
+                self.isinsert and \
+                self.execution_options.get(
+                    'executemany_mode', dialect.executemany_mode) == \
+                'values' and \
+                dialect.supports_multivalues_insert and \
+                dialect.paramstyle != 'numeric' and \
+                compiled.insert_single_values_expr is not None
+
         processors = compiled._bind_processors
 
         # Convert the dictionary of bind parameter values
         # into a dict or list to be sent to the DBAPI's
         # execute() or executemany() method.
-        parameters = []
-        if dialect.positional:
+        if plan is not None:
+            # positional parameter sets are converted directly
+            indexes, processors, defaults, names = plan
+            parameters = _process_tuples(
+                parameters, indexes, processors, defaults, names,
+                len(compiled._positional_keys),
+                dialect.execute_sequence_format)
+        elif dialect.positional:
+            parameters = []
             for compiled_params in self.compiled_parameters:
                 param = []
                 for key in self.compiled.positiontup:
@@ -575,6 +795,7 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
                         param.append(compiled_params[key])
                 parameters.append(dialect.execute_sequence_format(param))
         else:
+            parameters = []
             encode = not dialect.supports_unicode_statements
             for compiled_params in self.compiled_parameters:
 
@@ -737,7 +958,49 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         return AUTOCOMMIT_REGEXP.match(statement)
 
     def create_cursor(self):
-        return self._dbapi_connection.cursor()
+        if self.dialect.supports_server_side_cursors and \
+                self._use_server_side_cursor():
+            self._is_server_side = True
+            return self.create_server_side_cursor()
+        else:
+            self._is_server_side = False
+            return self._dbapi_connection.cursor()
+
+    def _use_server_side_cursor(self):
+        if self.dialect.server_side_cursors:
+            # TODO: coverage for server side cursors + select.for_update()
+            use_server_side = \
+                self.execution_options.get('stream_results', True) and (
+                    (self.compiled and isinstance(self.compiled.statement,
+                                                  expression.Selectable)
+                     or
+                     (
+                        (not self.compiled or
+                         isinstance(self.compiled.statement,
+                                    expression.TextClause))
+                        and self.statement and SERVER_SIDE_CURSOR_RE.match(
+                            self.statement))
+                     )
+                )
+        else:
+            use_server_side = \
+                self.execution_options.get('stream_results', False)
+
+        return use_server_side
+
+    def create_server_side_cursor(self):
+        """Return a new DBAPI cursor which leaves result rows on the
+        server, to be fetched as needed.
+
+        Called by :meth:`.create_cursor` in place of the plain
+        ``connection.cursor()`` when the ``stream_results`` execution
+        option, or the ``server_side_cursors`` dialect flag, is in effect.
+        Dialects which set ``supports_server_side_cursors`` must implement
+        this method; results are then delivered by a
+        :class:`.BufferedRowResultProxy`.
+
+        """
+        raise NotImplementedError()
 
     def pre_exec(self):
         pass
@@ -755,6 +1018,16 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         """
         return type_._cached_result_processor(self.dialect, coltype)
 
+    def _result_metadata_key(self, description):
+        """Return a hashable key for the given cursor.description.
+
+        The :class:`.ResultMetaData` built for a result is memoized on the
+        :class:`.Compiled` under this key; dialects whose result handling
+        depends on per-execution state should include that state here.
+
+        """
+        return tuple((rec[0], rec[1]) for rec in description)
+
     def get_lastrowid(self):
         """return self.cursor.lastrowid, or equivalent, after an INSERT.
 
@@ -787,10 +1060,19 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         pass
 
     def get_result_proxy(self):
-        return result.ResultProxy(self)
+        if self._is_server_side:
+            return result.BufferedRowResultProxy(self)
+        else:
+            return result.ResultProxy(self)
+
+    def _get_executemany_values_result_proxy(self):
+        return result.FullyBufferedResultProxy(
+            self, self._executemany_returning_rows)
 
     @property
     def rowcount(self):
+        if self._executemany_rowcount is not None:
+            return self._executemany_rowcount
         return self.cursor.rowcount
 
     def supports_sane_rowcount(self):
@@ -510,6 +510,21 @@ class Dialect(object):
 
         raise NotImplementedError()
 
+    def do_ping(self, dbapi_connection):
+        """ping the DBAPI connection and return True if the connection is
+        usable.
+
+        This hook is called by the :class:`.Pool` upon checkout when the
+        :paramref:`.Pool.pre_ping` flag is set.  A DBAPI error which
+        :meth:`.Dialect.is_disconnect` reports as a disconnect situation
+        results in a return value of False; other errors are raised.
+
+        .. versionadded:: 1.0.0
+
+        """
+
+        raise NotImplementedError()
+
     def create_xid(self):
         """Create a two-phase transaction ID.
 
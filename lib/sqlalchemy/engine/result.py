@@ -11,8 +11,10 @@ and :class:`.RowProxy."""
 
 from .. import exc, util
 from ..sql import expression, sqltypes
+from ..processors import process_column
 import collections
 import operator
+import time
 
 # This reconstructor is necessary so that pickles with the C extension or
 # without use the same Binary format.
@@ -186,7 +188,14 @@ class ResultMetaData(object):
     """Handle cursor.description, applying additional info from an execution
     context."""
 
-    def __init__(self, parent, metadata):
+    _lazy_keymap_threshold = 50
+    """number of columns above which the keymap is populated with
+    string and column keys only upon first access of such a key."""
+
+    _pending = None
+    _positional_only = False
+
+    def __init__(self, parent, metadata, positional_only=False):
         self._processors = processors = []
 
         # We do not strictly need to store the processor in the key mapping,
@@ -200,6 +209,19 @@ class ResultMetaData(object):
         translate_colname = context._translate_colname
         self.case_sensitive = dialect.case_sensitive
 
+        if positional_only:
+            self._positional_only = lazy = True
+        elif metadata[self._lazy_keymap_threshold:]:
+            # wide results are often accessed by position or by only a
+            # few keys; defer the keymap until a key is first requested.
+            # the slice is tested rather than len() to save on callcounts
+            # for the common case of narrow results.
+            self._pending = pending = []
+            self._lock = util.threading.Lock()
+            lazy = True
+        else:
+            lazy = False
+
         # high precedence key values.
         primary_keymap = {}
 
@@ -230,6 +252,15 @@ class ResultMetaData(object):
             processor = context.get_result_processor(type_, colname, coltype)
 
             processors.append(processor)
+
+            if lazy:
+                self.keys.append(colname)
+                if not positional_only:
+                    pending.append(
+                        (obj, name,
+                         untranslated if translate_colname else None))
+                continue
+
             rec = (processor, obj, i)
 
             # indexes as keys. This is only needed for the Python version of
@@ -268,6 +299,55 @@ class ResultMetaData(object):
         # high precedence keymap.
         keymap.update(primary_keymap)
 
+    def _populate_keymap(self):
+        """Populate the keymap of a wide result set, deferred by the
+        constructor until a key was first requested.
+
+        The metadata may be shared among many result sets by way of
+        the compiled object, so the entries are assembled separately
+        and ``_pending`` is only reset once the keymap is complete.
+
+        """
+
+        with self._lock:
+            pending = self._pending
+            if pending is None:
+                return
+            processors = self._processors
+            keymap = {}
+            primary_keymap = {}
+
+            for i, (obj, name, untranslated) in enumerate(pending):
+                rec = (processors[i], obj, i)
+                primary_keymap[i] = rec
+                if not self.case_sensitive:
+                    name = name.lower()
+                if primary_keymap.setdefault(name, rec) is not rec:
+                    primary_keymap[name] = rec = (None, obj, None)
+                if obj:
+                    for o in obj:
+                        keymap[o] = rec
+                if untranslated:
+                    keymap[untranslated] = rec
+
+            keymap.update(primary_keymap)
+            self._keymap.update(keymap)
+            self._pending = None
+
+    def _positional_key(self, key, raiseerr):
+        if isinstance(key, util.int_types) and \
+                0 <= key < len(self._processors):
+            # used only by the Python version of RowProxy
+            return (self._processors[key], None, key)
+        elif raiseerr:
+            raise exc.InvalidRequestError(
+                "Rows of this result are accessible by integer position "
+                "only, as the 'positional_rows' execution option is "
+                "in effect; can't locate key %s" %
+                expression._string_or_unprintable(key))
+        else:
+            return None
+
     @util.pending_deprecation("0.8", "sqlite dialect uses "
                               "_translate_colname() now")
     def _set_keymap_synonym(self, name, origname):
@@ -278,6 +358,8 @@ class ResultMetaData(object):
         row.
 
         """
+        if self._pending is not None:
+            self._populate_keymap()
         rec = (processor, obj, i) = self._keymap[origname if
                                                  self.case_sensitive
                                                  else origname.lower()]
@@ -286,6 +368,20 @@ class ResultMetaData(object):
 
     def _key_fallback(self, key, raiseerr=True):
         map = self._keymap
+        if self._positional_only:
+            result = self._positional_key(key, raiseerr)
+            if result is not None:
+                map[key] = result
+            return result
+        elif self._pending is not None:
+            if isinstance(key, util.int_types):
+                result = self._positional_key(key, False)
+                if result is not None:
+                    map[key] = result
+                    return result
+            self._populate_keymap()
+            if key in map:
+                return map[key]
         result = None
         if isinstance(key, util.string_types):
             result = map.get(key if self.case_sensitive else key.lower())
@@ -337,7 +433,7 @@ class ResultMetaData(object):
         else:
             return self._key_fallback(key, False) is not None
 
-    def _getter(self, key):
+    def _index_for_key(self, key):
         if key in self._keymap:
             processor, obj, index = self._keymap[key]
         else:
@@ -351,9 +447,17 @@ class ResultMetaData(object):
                 "Ambiguous column name '%s' in result set! "
                 "try 'use_labels' option on select statement." % key)
 
+        return index
+
+    def _getter(self, key):
+        index = self._index_for_key(key)
+        if index is None:
+            return None
         return operator.itemgetter(index)
 
     def __getstate__(self):
+        if self._pending is not None:
+            self._populate_keymap()
         return {
             '_pickled_keymap': dict(
                 (key, index)
@@ -362,6 +466,7 @@ class ResultMetaData(object):
             ),
             'keys': self.keys,
             "case_sensitive": self.case_sensitive,
+            "positional_only": self._positional_only
         }
 
     def __setstate__(self, state):
@@ -375,6 +480,7 @@ class ResultMetaData(object):
             keymap[key] = (None, None, index)
         self.keys = state['keys']
         self.case_sensitive = state['case_sensitive']
+        self._positional_only = state.get('positional_only', False)
         self._echo = False
 
 
@@ -403,6 +509,7 @@ class ResultProxy(object):
     out_parameters = None
     _can_close_connection = False
     _metadata = None
+    _stats_record = None
 
     def __init__(self, context):
         self.context = context
@@ -423,13 +530,29 @@ class ResultProxy(object):
     def _init_metadata(self):
         metadata = self._cursor_description()
         if metadata is not None:
-            if self.context.compiled and \
-                    'compiled_cache' in self.context.execution_options:
-                if self.context.compiled._cached_metadata:
-                    self._metadata = self.context.compiled._cached_metadata
-                else:
-                    self._metadata = self.context.compiled._cached_metadata = \
+            compiled = self.context.compiled
+            if 'positional_rows' in self.context.execution_options and \
+                    self.context.execution_options['positional_rows']:
+                # no keymap at all; not shared with keyed results
+                self._metadata = ResultMetaData(
+                    self, metadata, positional_only=True)
+            elif compiled is not None:
+                # memoize the keymap and processors on the Compiled,
+                # keyed to the cursor.description they were built from,
+                # so that repeated executions of the same statement
+                # skip the setup entirely.
+                cache = compiled._cached_metadata
+                if cache is None:
+                    cache = compiled._cached_metadata = {}
+                key = self.context._result_metadata_key(metadata)
+                try:
+                    self._metadata = cache[key]
+                except KeyError:
+                    self._metadata = cache[key] = \
                         ResultMetaData(self, metadata)
+                except TypeError:
+                    # unhashable type codes in cursor.description
+                    self._metadata = ResultMetaData(self, metadata)
             else:
                 self._metadata = ResultMetaData(self, metadata)
             if self._echo:
@@ -565,6 +688,9 @@ class ResultProxy(object):
 
         if not self.closed:
             self.closed = True
+            if self._stats_record is not None:
+                self._stats_record.fetch_time.add(
+                    time.time() - self._stats_started)
             self.connection._safe_close_cursor(self.cursor)
             if _autoclose_connection and \
                     self.connection.should_close_with_result:
@@ -792,6 +918,8 @@ class ResultProxy(object):
         metadata = self._metadata
         keymap = metadata._keymap
         processors = metadata._processors
+        if self._stats_record is not None:
+            self._stats_record.rows += len(rows)
         if self._echo:
             log = self.context.engine.logger.debug
             l = []
@@ -834,6 +962,65 @@ class ResultProxy(object):
                 e, None, None,
                 self.cursor, self.context)
 
+    def process_columns(self, rows):
+        """Given a list of raw DBAPI rows, return a list of processed
+        columns, one per result column.
+
+        Each column's result processor is applied across the whole
+        column at once, rather than per cell as with :class:`.RowProxy`.
+
+        """
+        metadata = self._metadata
+        processors = metadata._processors
+        if self._stats_record is not None:
+            self._stats_record.rows += len(rows)
+        if self._echo:
+            log = self.context.engine.logger.debug
+            for row in rows:
+                log("Row %r", row)
+        if rows:
+            columns = zip(*rows)
+        else:
+            columns = [() for proc in processors]
+        return [
+            process_column(proc, column)
+            for proc, column in zip(processors, columns)
+        ]
+
+    def fetch_columns(self, size=None):
+        """Fetch rows and return them column-wise.
+
+        Returns a list with one list of values per result column, in the
+        same order as :meth:`.keys`, each value having been processed by
+        the column's type.  ``size`` limits the number of rows fetched as
+        with :meth:`.fetchmany`; when ``None``, all remaining rows are
+        fetched.  When no more rows remain, the cursor is closed and each
+        column list is empty.
+
+        This method bypasses the construction of :class:`.RowProxy`
+        objects entirely, and is suited towards reading large numbers of
+        rows where the values of each column are consumed together.
+
+        .. versionadded:: 1.0.0
+
+        """
+        if self._metadata is None:
+            self._non_result()
+
+        try:
+            if size is None:
+                rows = self._fetchall_impl()
+            else:
+                rows = self._fetchmany_impl(size)
+            columns = self.process_columns(rows)
+            if size is None or not rows:
+                self.close()
+            return columns
+        except Exception as e:
+            self.connection._handle_dbapi_exception(
+                e, None, None,
+                self.cursor, self.context)
+
     def fetchone(self):
         """Fetch one row, just like DB-API ``cursor.fetchone()``.
 
@@ -897,12 +1084,14 @@ class BufferedRowResultProxy(ResultProxy):
     before ``fetchone()`` is called.  This is to allow the results of
     ``cursor.description`` to be available immediately, when
     interfacing with a DB-API that requires rows to be consumed before
-    this information is available (currently psycopg2, when used with
-    server-side cursors).
+    this information is available (currently psycopg2 and pg8000, when
+    used with server-side cursors).  It is used for all results
+    delivered by a server side cursor, so that rows are retrieved in
+    batches rather than being buffered in full.
 
     The pre-fetching behavior fetches only one row initially, and then
     grows its buffer size by a fixed amount with each successive need
-    for additional rows up to a size of 100.
+    for additional rows up to a size of 1000.
     """
 
     def _init_metadata(self):
@@ -963,13 +1152,23 @@ class FullyBufferedResultProxy(ResultProxy):
     after the database conversation can not be continued,
     such as MSSQL INSERT...OUTPUT after an autocommit.
 
+    Rows which were already fetched from the cursor, such as those
+    gathered from each page of a batched executemany, may be passed
+    as ``initial_buffer``.
+
     """
 
+    def __init__(self, context, initial_buffer=None):
+        self._initial_buffer = initial_buffer
+        super(FullyBufferedResultProxy, self).__init__(context)
+
     def _init_metadata(self):
         super(FullyBufferedResultProxy, self)._init_metadata()
         self.__rowbuffer = self._buffer_rows()
 
     def _buffer_rows(self):
+        if self._initial_buffer is not None:
+            return collections.deque(self._initial_buffer)
         return collections.deque(self.cursor.fetchall())
 
     def _fetchone_impl(self):
@@ -1026,16 +1225,33 @@ class BufferedColumnResultProxy(ResultProxy):
 
     def _init_metadata(self):
         super(BufferedColumnResultProxy, self)._init_metadata()
-        metadata = self._metadata
+        # the metadata may be shared with other results via the
+        # Compiled, so work on a copy of it.
+        orig = self._metadata
+        metadata = self._metadata = orig.__class__.__new__(orig.__class__)
+        metadata.__dict__.update(orig.__dict__)
         # orig_processors will be used to preprocess each row when they are
         # constructed.
-        metadata._orig_processors = metadata._processors
+        metadata._orig_processors = orig._processors
         # replace the all type processors by None processors.
         metadata._processors = [None for _ in range(len(metadata.keys))]
         keymap = {}
-        for k, (func, obj, index) in metadata._keymap.items():
+        for k, (func, obj, index) in orig._keymap.items():
             keymap[k] = (None, obj, index)
-        self._metadata._keymap = keymap
+        metadata._keymap = keymap
+
+    def fetch_columns(self, size=None):
+        # rows must be fully processed before requesting more
+        # from the DBAPI, so the columns are assembled from
+        # processed rows.
+        if size is None:
+            rows = self.fetchall()
+        else:
+            rows = self.fetchmany(size)
+        if rows:
+            return [list(column) for column in zip(*rows)]
+        else:
+            return [[] for key in self._metadata.keys]
 
     def fetchall(self):
         # can't call cursor.fetchall(), since rows must be
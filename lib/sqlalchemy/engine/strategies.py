@@ -103,7 +103,13 @@ class DefaultEngineStrategy(EngineStrategy):
                          'recycle': 'pool_recycle',
                          'events': 'pool_events',
                          'use_threadlocal': 'pool_threadlocal',
-                         'reset_on_return': 'pool_reset_on_return'}
+                         'reset_on_return': 'pool_reset_on_return',
+                         'use_lifo': 'pool_use_lifo',
+                         'pre_ping': 'pool_pre_ping',
+                         'pre_ping_interval': 'pool_pre_ping_interval',
+                         'collect_stats': 'pool_collect_stats',
+                         'min_size': 'pool_min_size',
+                         'idle_timeout': 'pool_idle_timeout'}
             for k in util.get_cls_kwargs(poolclass):
                 tk = translate.get(k, k)
                 if tk in kwargs:
@@ -5,7 +5,9 @@
 # This module is part of SQLAlchemy and is released under
 # the MIT License: http://www.opensource.org/licenses/mit-license.php
 
-from .. import util
+from .. import util, exc
+from ..pool import _Histogram
+import time
 
 
 def connection_memoize(key):
@@ -27,6 +29,12 @@ def connection_memoize(key):
     return decorated
 
 
+def _positional_error(num, length, size):
+    return exc.ArgumentError(
+        "Positional parameter set %d contains %d values; "
+        "expected %d" % (num, length, size))
+
+
 def py_fallback():
     def _distill_params(multiparams, params):
         """Given arguments from the calling form *multiparams, **params,
@@ -67,8 +75,205 @@ def py_fallback():
             else:
                 return [multiparams]
 
+    def _process_tuples(rows, indexes, processors, defaults, names, size,
+                        sequence_format):
+        """Given a list of positional parameter sets, return a list of
+        DBAPI parameter structures, applying bind processors.
+
+        Each entry of ``indexes`` refers to the position within each
+        row of the value for a DBAPI parameter, or is -1 for a parameter
+        taking its value from ``defaults``.  When ``names`` is given,
+        each parameter structure is a dictionary keyed on those names;
+        otherwise the values are passed to ``sequence_format``.
+
+        """
+        slots = list(zip(indexes, processors, defaults))
+        result = []
+        for num, row in enumerate(rows):
+            if len(row) != size:
+                raise _positional_error(num, len(row), size)
+            values = [
+                default if index < 0
+                else row[index] if processor is None
+                else processor(row[index])
+                for index, processor, default in slots
+            ]
+            if names is None:
+                result.append(sequence_format(values))
+            else:
+                result.append(dict(zip(names, values)))
+        return result
+
     return locals()
 try:
-    from sqlalchemy.cutils import _distill_params
+    from sqlalchemy.cutils import _distill_params, _process_tuples
 except ImportError:
     globals().update(py_fallback())
+
+
+class CompiledCache(util.LRUCache):
+    """An LRU cache of compiled SQL constructs, used by :class:`.Engine`
+    to cache compiled statements on their structural cache key.
+
+    In addition to the usual dictionary interface, counters are
+    maintained for cache hits, misses and evictions, as well as for
+    statements which could not be cached because they include
+    an element that doesn't support structural caching.  These
+    are reported by the :meth:`.CompiledCache.stats` method.
+
+    .. versionadded:: 1.0.0
+
+    """
+
+    def __init__(self, capacity=500, threshold=.5):
+        super(CompiledCache, self).__init__(capacity, threshold)
+        self.reset_stats()
+
+    def _manage_size(self):
+        size = len(self)
+        super(CompiledCache, self)._manage_size()
+        self.evictions += size - len(self)
+
+    def reset_stats(self):
+        """Reset all counters to zero."""
+
+        self.hits = self.misses = self.evictions = self.uncacheable = 0
+
+    def stats(self):
+        """Return a dictionary of statistics for this cache.
+
+        The dictionary includes the current ``size`` and ``capacity``
+        of the cache, as well as the number of ``hits``, ``misses``,
+        ``evictions`` and ``uncacheable`` statements counted since the
+        cache was created or :meth:`.CompiledCache.reset_stats` was last
+        called.  Counters are not synchronized between threads and
+        should be treated as approximate.
+
+        """
+        return {
+            'size': len(self),
+            'capacity': self.capacity,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'uncacheable': self.uncacheable
+        }
+
+
+class _StatementTiming(_Histogram):
+    bounds = (
+        .0001, .00025, .0005, .001, .0025, .005, .01, .025, .05,
+        .1, .25, .5, 1, 2.5, 5, 10, 30, 60)
+
+
+class _StatementRecord(object):
+    __slots__ = ('executions', 'rows', 'execute_time', 'fetch_time')
+
+    def __init__(self):
+        self.executions = 0
+        self.rows = 0
+        self.execute_time = _StatementTiming()
+        self.fetch_time = _StatementTiming()
+
+    def as_dict(self, statement):
+        execute_time = self.execute_time
+        return {
+            'statement': statement,
+            'executions': self.executions,
+            'rows': self.rows,
+            'total': execute_time.total,
+            'mean': execute_time.total / execute_time.count,
+            'p50': execute_time.percentile(50),
+            'p99': execute_time.percentile(99),
+            'max': execute_time.max,
+            'fetch_total': self.fetch_time.total,
+            'fetch_p50': self.fetch_time.percentile(50),
+            'fetch_p99': self.fetch_time.percentile(99),
+        }
+
+
+class StatementStats(object):
+    """Aggregate execution statistics for each distinct SQL string
+    executed by an :class:`.Engine`.
+
+    An instance is available as :attr:`.Engine.statement_stats` when the
+    engine is created with ``collect_statement_stats=True``.  For each
+    statement, the number of executions, the time spent in the DBAPI
+    ``execute()`` or ``executemany()`` call, the time taken for the rows
+    of the result to be fetched and the number of rows returned or
+    affected are collected; :meth:`.StatementStats.snapshot` reports
+    them.  At most ``capacity`` statements are tracked, the least
+    recently executed being discarded first.
+
+    .. versionadded:: 1.0.0
+
+    .. seealso::
+
+        :ref:`engine_statement_stats`
+
+    """
+
+    def __init__(self, capacity=1000, threshold=.5):
+        self.capacity = capacity
+        self.threshold = threshold
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Discard all statistics collected so far."""
+
+        self._records = util.LRUCache(self.capacity, self.threshold)
+
+    def __len__(self):
+        return len(self._records)
+
+    def _executed(self, statement, result, elapsed):
+        record = self._records.get(statement)
+        if record is None:
+            record = self._records[statement] = _StatementRecord()
+        record.executions += 1
+        record.execute_time.add(elapsed)
+        if result.closed:
+            # no rows to fetch; count rows affected, if known
+            rowcount = result.context.rowcount
+            if rowcount > 0:
+                record.rows += rowcount
+        else:
+            result._stats_record = record
+            result._stats_started = time.time()
+
+    def snapshot(self, order_by='total', limit=None):
+        """Return a list of dictionaries, one per statement, ordered
+        on the given key in descending order.
+
+        Each dictionary includes the ``statement`` string, the number of
+        ``executions``, the ``total``, ``mean``, ``p50``, ``p99`` and
+        ``max`` time in seconds spent executing the statement, the
+        ``fetch_total``, ``fetch_p50`` and ``fetch_p99`` time in seconds
+        between execution and the closing of the result, and the number of
+        ``rows`` fetched from, or affected by, the statement.  Percentiles
+        are estimated from a fixed set of buckets.  Counters are not
+        synchronized between threads and should be treated as approximate.
+
+        E.g. to view the ten statements with the slowest typical
+        execution time::
+
+            for stat in engine.statement_stats.snapshot("p50", limit=10):
+                print("%(p50).4f %(executions)d %(statement)s" % stat)
+
+        :param order_by: key of the dictionaries to sort on.
+
+        :param limit: if given, the maximum number of dictionaries to
+         return.
+
+        """
+        # read LRUCache entries directly, so as not to disturb
+        # their recently-used counters
+        stats = [
+            record.as_dict(statement)
+            for statement, record, counter in list(
+                dict.values(self._records))
+        ]
+        stats.sort(key=lambda stat: stat[order_by] or 0, reverse=True)
+        if limit is not None:
+            stats = stats[0:limit]
+        return stats
@@ -324,6 +324,27 @@ class PoolEvents(event.Events):
 
         """
 
+    def checkout_wait(self, dbapi_connection, connection_record, wait_time):
+        """Called when a connection has been obtained from the Pool,
+        with the time spent obtaining it.
+
+        :param dbapi_connection: a DBAPI connection.
+
+        :param connection_record: the :class:`._ConnectionRecord` managing the
+         DBAPI connection.
+
+        :param wait_time: the number of seconds spent waiting for a
+         connection to become available, including the time to establish
+         a new DBAPI connection if one was needed.
+
+        .. versionadded:: 1.0.0
+
+        .. seealso::
+
+            :ref:`pool_stats`
+
+        """
+
     def checkin(self, dbapi_connection, connection_record):
         """Called when a connection returns to the pool.
 
@@ -338,6 +359,30 @@ class PoolEvents(event.Events):
 
         """
 
+    def checkin_hold(self, dbapi_connection, connection_record, hold_time):
+        """Called when a connection returns to the pool, with the time it
+        was checked out.
+
+        The event is emitted before the :meth:`.PoolEvents.checkin` event.
+        Like that event, ``dbapi_connection`` may be None if the connection
+        has been invalidated.
+
+        :param dbapi_connection: a DBAPI connection.
+
+        :param connection_record: the :class:`._ConnectionRecord` managing the
+         DBAPI connection.
+
+        :param hold_time: the number of seconds the connection was checked
+         out from the pool.
+
+        .. versionadded:: 1.0.0
+
+        .. seealso::
+
+            :ref:`pool_stats`
+
+        """
+
     def reset(self, dbapi_connection, connection_record):
         """Called before the "reset" action occurs for a pooled connection.
 
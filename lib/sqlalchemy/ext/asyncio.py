@@ -0,0 +1,522 @@
+# ext/asyncio.py
+# Copyright (C) 2005-2014 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+"""asyncio facade for :class:`.Engine` and :class:`.Connection`.
+
+Provides an :class:`.AsyncEngine`, produced by :func:`.create_async_engine`,
+whose connections are checked out from an :class:`.AsyncPool` and whose
+operations return :class:`asyncio.Future` objects, so that they may be
+awaited from within a coroutine::
+
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine("sqlite:////tmp/test.db", pool_size=5)
+
+    async def get_names():
+        async with await engine.connect() as conn:
+            result = await conn.execute(select([users.c.name]))
+            return await result.fetchall()
+
+Statement compilation and execution make use of the existing
+:class:`.Dialect` and :class:`.ExecutionContext` layer, by way of a plain
+:class:`.Connection`.  As DBAPI drivers are blocking, each pooled connection
+is adapted by running all of its DBAPI calls within a single worker thread
+dedicated to that connection; this keeps drivers such as pysqlite, which
+require that a connection is used only from the thread which created it,
+working as is.  The checkout of connections themselves takes place within
+the event loop: when the pool is exhausted, callers wait, without blocking
+the loop, and receive connections in the order in which they asked for
+them.
+
+Requires Python 3.4 or greater.
+
+.. versionadded:: 1.0.0
+
+"""
+from __future__ import absolute_import
+
+import asyncio
+import collections
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from .. import exc
+from ..engine import create_engine
+from ..pool import NullPool
+
+__all__ = ['AsyncEngine', 'AsyncConnection', 'AsyncTransaction',
+           'AsyncResult', 'AsyncPool', 'create_async_engine']
+
+
+def _future(loop):
+    if hasattr(loop, 'create_future'):
+        return loop.create_future()
+    else:
+        return asyncio.Future(loop=loop)
+
+
+def _done_future(loop, result=None):
+    fut = _future(loop)
+    fut.set_result(result)
+    return fut
+
+
+def _chain(loop, future, fn):
+    """Return a new future which receives the result of ``fn`` applied
+    to the result of ``future``."""
+
+    chained = _future(loop)
+
+    def done(fut):
+        if chained.done():
+            return
+        elif fut.cancelled():
+            chained.cancel()
+        elif fut.exception() is not None:
+            chained.set_exception(fut.exception())
+        else:
+            try:
+                chained.set_result(fn(fut.result()))
+            except Exception as err:
+                chained.set_exception(err)
+    future.add_done_callback(done)
+    return chained
+
+
+def create_async_engine(*args, **kwargs):
+    """Create a new :class:`.AsyncEngine` instance.
+
+    Arguments are passed to :func:`.create_engine`, with the exception
+    of the following, which configure the :class:`.AsyncPool`:
+
+    :param pool_size=5: the number of connections to keep open inside
+     the pool.
+
+    :param max_overflow=10: the number of connections which may be
+     opened beyond ``pool_size``; these are closed when returned to the
+     pool.  A value of -1 indicates no limit.
+
+    :param pool_timeout=30: number of seconds to wait for a connection
+     to become available before failing with :class:`.exc.TimeoutError`;
+     ``None`` waits indefinitely.
+
+    :param loop: the event loop, defaults to
+     ``asyncio.get_event_loop()``.
+
+    """
+    pool_kw = {}
+    for key, pool_key in [('pool_size', 'pool_size'),
+                          ('max_overflow', 'max_overflow'),
+                          ('pool_timeout', 'timeout'),
+                          ('loop', 'loop')]:
+        if key in kwargs:
+            pool_kw[pool_key] = kwargs.pop(key)
+
+    # pooling takes place within the AsyncPool; the engine opens a
+    # new DBAPI connection for each pooled entry
+    kwargs['poolclass'] = NullPool
+    engine = create_engine(*args, **kwargs)
+    return AsyncEngine(engine, AsyncPool(engine.connect, **pool_kw))
+
+
+class AsyncPool(object):
+    """A pool of connections which are checked out within an
+    asyncio event loop.
+
+    Each connection is produced by the given ``creator`` callable, which is
+    invoked within a worker thread that is then dedicated to all further
+    operations on that connection.  :meth:`.AsyncPool.acquire` never blocks
+    the event loop; when ``pool_size`` plus ``max_overflow`` connections are
+    checked out, callers are queued and served in first-come first-served
+    order as connections are returned.
+
+    """
+
+    def __init__(self, creator, pool_size=5, max_overflow=10, timeout=30,
+                 loop=None):
+        self._creator = creator
+        self._pool_size = pool_size
+        self._max_overflow = max_overflow
+        self._timeout = timeout
+        self._loop = loop or asyncio.get_event_loop()
+        self._idle = collections.deque()
+        self._waiters = collections.deque()
+        self._count = 0
+
+    def size(self):
+        return self._pool_size
+
+    def checkedin(self):
+        return len(self._idle)
+
+    def overflow(self):
+        return self._count - self._pool_size
+
+    def checkedout(self):
+        return self._count - len(self._idle)
+
+    def waiting(self):
+        return len([w for w in self._waiters if not w.done()])
+
+    def status(self):
+        return "Pool size: %d  Connections in pool: %d "\
+            "Current Overflow: %d Current Checked out "\
+            "connections: %d Waiting: %d" % (
+                self.size(), self.checkedin(), self.overflow(),
+                self.checkedout(), self.waiting())
+
+    def _can_grow(self):
+        return self._max_overflow < 0 or \
+            self._count < self._pool_size + self._max_overflow
+
+    def acquire(self):
+        """Return a future which receives a pooled
+        :class:`._AsyncPoolEntry`."""
+
+        fut = _future(self._loop)
+        if self._idle:
+            fut.set_result(self._idle.popleft())
+        elif self._can_grow():
+            self._create(fut)
+        else:
+            self._waiters.append(fut)
+            if self._timeout is not None:
+                handle = self._loop.call_later(
+                    self._timeout, self._timed_out, fut)
+                fut.add_done_callback(lambda f: handle.cancel())
+        return fut
+
+    def _timed_out(self, fut):
+        if fut.done():
+            return
+        self._waiters.remove(fut)
+        fut.set_exception(exc.TimeoutError(
+            "AsyncPool limit of size %d overflow %d reached, "
+            "connection timed out, timeout %d" %
+            (self.size(), self.overflow(), self._timeout)))
+
+    def _create(self, fut):
+        self._count += 1
+        entry = _AsyncPoolEntry(self)
+
+        def created(f):
+            if f.exception() is not None:
+                self._count -= 1
+                entry._shutdown()
+                if not fut.done():
+                    fut.set_exception(f.exception())
+                self._serve_waiter()
+            else:
+                entry.connection = f.result()
+                if fut.done():
+                    # the caller gave up waiting
+                    self.release(entry)
+                else:
+                    fut.set_result(entry)
+        entry.run(self._creator).add_done_callback(created)
+
+    def _serve_waiter(self):
+        while self._waiters and self._waiters[0].done():
+            self._waiters.popleft()
+        if self._waiters and self._can_grow():
+            self._create(self._waiters.popleft())
+
+    def release(self, entry):
+        """Return a connection to the pool, handing it directly to the
+        longest-waiting caller if any."""
+
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(entry)
+                return
+        if self._count > self._pool_size:
+            self.discard(entry)
+        else:
+            self._idle.append(entry)
+
+    def discard(self, entry):
+        """Close a connection and remove it from the pool.
+
+        Returns a future which completes when the connection is closed.
+
+        """
+        self._count -= 1
+        fut = entry.close()
+        self._serve_waiter()
+        return fut
+
+    def dispose(self):
+        """Close all connections which are currently checked in.
+
+        Returns a future which completes when they are closed.
+
+        """
+        closing = []
+        while self._idle:
+            closing.append(self.discard(self._idle.popleft()))
+        if closing:
+            return asyncio.gather(*closing)
+        else:
+            return _done_future(self._loop)
+
+
+class _AsyncPoolEntry(object):
+    """A connection held by an :class:`.AsyncPool`, along with the worker
+    thread in which all operations upon it take place."""
+
+    __slots__ = 'pool', 'connection', '_executor'
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.connection = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def run(self, fn, *args, **kwargs):
+        return self.pool._loop.run_in_executor(
+            self._executor, functools.partial(fn, *args, **kwargs))
+
+    def close(self):
+        fut = self.run(self.connection.close) \
+            if self.connection is not None \
+            else _done_future(self.pool._loop)
+        fut.add_done_callback(lambda f: self._shutdown())
+        return fut
+
+    def _shutdown(self):
+        self._executor.shutdown(wait=False)
+
+
+class AsyncEngine(object):
+    """An asyncio facade for an :class:`.Engine`.
+
+    Produced by :func:`.create_async_engine`.
+
+    """
+
+    def __init__(self, sync_engine, pool):
+        self.sync_engine = sync_engine
+        self.pool = pool
+        self.dialect = sync_engine.dialect
+        self.url = sync_engine.url
+
+    def __repr__(self):
+        return 'AsyncEngine(%r)' % self.url
+
+    def connect(self):
+        """Return a future which receives a new :class:`.AsyncConnection`,
+        once a connection is available from the pool."""
+
+        acquired = self.pool.acquire()
+        connected = _future(self.pool._loop)
+
+        def done(fut):
+            if fut.cancelled():
+                if not connected.done():
+                    connected.cancel()
+            elif fut.exception() is not None:
+                if not connected.done():
+                    connected.set_exception(fut.exception())
+            elif connected.done():
+                # the caller gave up waiting
+                self.pool.release(fut.result())
+            else:
+                connected.set_result(AsyncConnection(self, fut.result()))
+
+        def cancelled(fut):
+            if fut.cancelled():
+                acquired.cancel()
+        acquired.add_done_callback(done)
+        connected.add_done_callback(cancelled)
+        return connected
+
+    def dispose(self):
+        """Close the connections currently checked in to the pool."""
+
+        return self.pool.dispose()
+
+
+class AsyncConnection(object):
+    """An asyncio facade for a :class:`.Connection`.
+
+    Methods which communicate with the database return futures;
+    :class:`.AsyncConnection` is also an asynchronous context manager
+    which closes the connection on exit.
+
+    """
+
+    def __init__(self, engine, entry):
+        self.engine = engine
+        self.sync_connection = entry.connection
+        self._entry = entry
+        self._loop = entry.pool._loop
+        self._transaction = None
+
+    @property
+    def closed(self):
+        return self._entry is None
+
+    def _run(self, fn, *args, **kwargs):
+        if self._entry is None:
+            raise exc.ResourceClosedError("This Connection is closed")
+        return self._entry.run(fn, *args, **kwargs)
+
+    def execute(self, object, *multiparams, **params):
+        """Execute a SQL statement construct, returning a future which
+        receives an :class:`.AsyncResult`.
+
+        Accepts the same arguments as :meth:`.Connection.execute`.
+
+        """
+        return _chain(
+            self._loop,
+            self._run(
+                self.sync_connection.execute,
+                object, *multiparams, **params),
+            lambda result: AsyncResult(self, result))
+
+    def scalar(self, object, *multiparams, **params):
+        """Execute and return a future which receives the first column
+        of the first row."""
+
+        return self._run(
+            self.sync_connection.scalar, object, *multiparams, **params)
+
+    def begin(self):
+        """Begin a transaction, returning a future which receives an
+        :class:`.AsyncTransaction`."""
+
+        def begun(transaction):
+            self._transaction = AsyncTransaction(self, transaction)
+            return self._transaction
+        return _chain(
+            self._loop, self._run(self.sync_connection.begin), begun)
+
+    def in_transaction(self):
+        return self.sync_connection.in_transaction()
+
+    def close(self):
+        """Release the connection back to the pool.
+
+        Any transaction in progress is rolled back.  Returns a future
+        which completes once the connection has been returned.
+
+        """
+        entry, self._entry = self._entry, None
+        if entry is None:
+            return _done_future(self._loop)
+
+        sync_connection = self.sync_connection
+        transaction, self._transaction = self._transaction, None
+
+        def reset():
+            if transaction is not None and transaction.is_active:
+                transaction.sync_transaction.rollback()
+            sync_connection.engine.dialect.do_rollback(
+                sync_connection.connection)
+
+        released = _future(self._loop)
+
+        def on_reset(fut):
+            if fut.exception() is not None:
+                entry.pool.discard(entry)
+            else:
+                entry.pool.release(entry)
+            released.set_result(None)
+        entry.run(reset).add_done_callback(on_reset)
+        return released
+
+    def __aenter__(self):
+        return _done_future(self._loop, self)
+
+    def __aexit__(self, type_, value, traceback):
+        return self.close()
+
+
+class AsyncTransaction(object):
+    """An asyncio facade for a :class:`.Transaction`."""
+
+    def __init__(self, connection, sync_transaction):
+        self.connection = connection
+        self.sync_transaction = sync_transaction
+
+    @property
+    def is_active(self):
+        return self.sync_transaction.is_active
+
+    def _end(self, fn):
+        def ended(result):
+            if self.connection._transaction is self:
+                self.connection._transaction = None
+        return _chain(
+            self.connection._loop, self.connection._run(fn), ended)
+
+    def commit(self):
+        """Commit the transaction, returning a future."""
+
+        return self._end(self.sync_transaction.commit)
+
+    def rollback(self):
+        """Roll back the transaction, returning a future."""
+
+        return self._end(self.sync_transaction.rollback)
+
+    def __aenter__(self):
+        return _done_future(self.connection._loop, self)
+
+    def __aexit__(self, type_, value, traceback):
+        if type_ is None and self.is_active:
+            return self.commit()
+        elif self.is_active:
+            return self.rollback()
+        else:
+            return _done_future(self.connection._loop)
+
+
+class AsyncResult(object):
+    """An asyncio facade for a :class:`.ResultProxy`.
+
+    Fetch methods return futures; they run in the worker thread of the
+    originating :class:`.AsyncConnection`.
+
+    """
+
+    def __init__(self, connection, result):
+        self.connection = connection
+        self.sync_result = result
+
+    def keys(self):
+        return self.sync_result.keys()
+
+    @property
+    def returns_rows(self):
+        return self.sync_result.returns_rows
+
+    @property
+    def rowcount(self):
+        return self.sync_result.rowcount
+
+    @property
+    def inserted_primary_key(self):
+        return self.sync_result.inserted_primary_key
+
+    def fetchone(self):
+        return self.connection._run(self.sync_result.fetchone)
+
+    def fetchmany(self, size=None):
+        return self.connection._run(self.sync_result.fetchmany, size)
+
+    def fetchall(self):
+        return self.connection._run(self.sync_result.fetchall)
+
+    def first(self):
+        return self.connection._run(self.sync_result.first)
+
+    def scalar(self):
+        return self.connection._run(self.sync_result.scalar)
+
+    def close(self):
+        return self.connection._run(self.sync_result.close)
@@ -413,6 +413,12 @@ def compiles(class_, *specs):
                     lambda *arg, **kw: existing(*arg, **kw))
             setattr(class_, '_compiler_dispatcher', existing)
 
+        # a custom construct may render based on state that isn't
+        # part of the structural cache key it would otherwise inherit
+        if getattr(class_, '_cache_key_traversal', None) is not None and \
+                '_cache_key_traversal' not in class_.__dict__:
+            class_._cache_key_traversal = None
+
         if specs:
             for s in specs:
                 existing.specs[s] = fn
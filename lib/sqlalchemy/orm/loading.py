@@ -20,6 +20,7 @@ from ..sql import util as sql_util
 from .util import _none_set, state_str
 from .. import exc as sa_exc
 import collections
+import operator
 
 _new_runid = util.counter()
 
@@ -28,6 +29,7 @@ def instances(query, cursor, context):
     """Return an ORM result as an iterator."""
 
     context.runid = _new_runid()
+    context.post_load_paths = {}
 
     filter_fns = [ent.filter_fn for ent in query._entities]
     filtered = id in filter_fns
@@ -42,16 +44,23 @@ def instances(query, cursor, context):
             def filter_fn(row):
                 return tuple(fn(x) for x, fn in zip(row, filter_fns))
 
+    plain_tuples = query._plain_tuples and not single_entity
+
     try:
-        (process, labels) = \
-            list(zip(*[
-                query_entity.row_processor(query,
-                                           context, cursor)
-                for query_entity in query._entities
-            ]))
+        column_getter = None
+        if plain_tuples:
+            column_getter = _column_tuple_getter(query, context, cursor)
+
+        if column_getter is None:
+            (process, labels) = \
+                list(zip(*[
+                    query_entity.row_processor(query,
+                                               context, cursor)
+                    for query_entity in query._entities
+                ]))
 
-        if not single_entity:
-            keyed_tuple = util.lightweight_named_tuple('result', labels)
+            if not single_entity and not plain_tuples:
+                keyed_tuple = util.lightweight_named_tuple('result', labels)
 
         while True:
             context.partials = {}
@@ -63,9 +72,14 @@ def instances(query, cursor, context):
             else:
                 fetch = cursor.fetchall()
 
-            if single_entity:
+            if column_getter is not None:
+                rows = list(map(column_getter, fetch))
+            elif single_entity:
                 proc = process[0]
                 rows = [proc(row) for row in fetch]
+            elif plain_tuples:
+                rows = [tuple([proc(row) for proc in process])
+                        for row in fetch]
             else:
                 rows = [keyed_tuple([proc(row) for proc in process])
                         for row in fetch]
@@ -73,8 +87,14 @@ def instances(query, cursor, context):
             if filtered:
                 rows = util.unique_list(rows, filter_fn)
 
-            for row in rows:
-                yield row
+            for post_load in list(context.post_load_paths.values()):
+                post_load.invoke(context)
+
+            if context.partitioned:
+                yield rows
+            else:
+                for row in rows:
+                    yield row
 
             if not query._yield_per:
                 break
@@ -83,6 +103,33 @@ def instances(query, cursor, context):
         util.raise_from_cause(err)
 
 
+@util.dependencies("sqlalchemy.orm.query")
+def _column_tuple_getter(querylib, query, context, cursor):
+    """Return a callable which produces a plain tuple directly from each
+    result row, for a :class:`.Query` which selects only columns;
+    returns None if the columns can't all be located in the result."""
+
+    metadata = cursor._metadata
+    if metadata is None:
+        return None
+
+    indexes = []
+    for query_entity in query._entities:
+        if not isinstance(query_entity, querylib._ColumnEntity):
+            return None
+        index = metadata._index_for_key(
+            query_entity._result_column(query, context))
+        if index is None:
+            return None
+        indexes.append(index)
+
+    if len(indexes) == 1:
+        index = indexes[0]
+        return lambda row: (row[index], )
+    else:
+        return operator.itemgetter(*indexes)
+
+
 @util.dependencies("sqlalchemy.orm.query")
 def merge_result(querylib, query, iterator, load=True):
     """Merge a result into this :class:`.Query` object's Session."""
@@ -459,6 +506,53 @@ def _populate_partial(
     return to_load
 
 
+class PostLoad(object):
+    """Track states which have been loaded along a particular path,
+    for the benefit of a loader which runs once a batch of rows has
+    been processed.
+
+    """
+    __slots__ = 'path', 'loader', 'args', 'states'
+
+    def __init__(self, path, loader, args):
+        self.path = path
+        self.loader = loader
+        self.args = args
+        self.states = util.OrderedDict()
+
+    def add_state(self, state, dict_, row):
+        self.states[state] = (dict_, True)
+
+    def add_existing_state(self, state, dict_, row):
+        # the attribute is already loaded; the loader runs so that
+        # loaders further along the path are applied, but the loaded
+        # value is not replaced
+        if state not in self.states:
+            self.states[state] = (dict_, False)
+
+    def invoke(self, context):
+        if not self.states:
+            return
+        states = [
+            (state, dict_, overwrite)
+            for state, (dict_, overwrite) in self.states.items()
+        ]
+        self.states.clear()
+        self.loader(context, self.path, states, *self.args)
+
+    @classmethod
+    def for_path(cls, context, path, loader, *args):
+        """Return the :class:`.PostLoad` for the given path, establishing
+        it with the given loader callable if not already present."""
+
+        try:
+            return context.post_load_paths[path.path]
+        except KeyError:
+            post_load = context.post_load_paths[path.path] = \
+                cls(path, loader, args)
+            return post_load
+
+
 def _validate_version_id(mapper, state, dict_, row, adapter):
 
     version_id_col = mapper.version_id_col
@@ -108,6 +108,8 @@ class Mapper(InspectionAttr):
                  with_polymorphic=None,
                  allow_partial_pks=True,
                  batch=True,
+                 batch_insert_returning=False,
+                 batch_updates=False,
                  column_prefix=None,
                  include_properties=None,
                  exclude_properties=None,
@@ -115,6 +117,7 @@ class Mapper(InspectionAttr):
                  confirm_deleted_rows=True,
                  eager_defaults=False,
                  legacy_is_orphan=False,
+                 sequence_prefetch=False,
                  _compiled_cache_size=100,
                  ):
         """Return a new :class:`~.Mapper` object.
@@ -198,6 +201,36 @@ class Mapper(InspectionAttr):
            :class:`.MapperEvents` listener requires being called
            in between individual row persistence operations.
 
+        :param batch_insert_returning: Defaults to ``False``.  When
+           ``True``, objects of this mapper whose primary keys are
+           generated by the server are INSERTed within a flush as a single
+           "executemany" with RETURNING, rendered as a multi-row VALUES
+           clause, on backends which support it, currently Postgresql;
+           otherwise, each such object is INSERTed individually in order
+           to retrieve its primary key.  The returned primary keys are
+           matched to the objects in the order of the rows returned, which
+           relies upon the backend returning rows in the order of the
+           VALUES clause; this is the observed behavior of Postgresql, but
+           it is not guaranteed by the database.  The flag is only
+           consulted on the base mapper of an inheritance hierarchy.
+
+           .. versionadded:: 1.0.0
+
+        :param batch_updates: Defaults to ``False``.  When ``True``, the
+           UPDATE statements emitted for objects of this mapper within a
+           flush are grouped by the set of columns being changed, so that
+           each group is sent as a single "executemany" regardless of the
+           order of the objects.  Normally, UPDATE statements are emitted in
+           the order of the objects, and only consecutive objects having the
+           same changed columns are batched; when many objects change
+           differing columns, this may otherwise result in one statement per
+           object.  Setting this flag means that the UPDATE statements for
+           a single table may be emitted in a different order than that of
+           the objects.  The flag is only consulted on the base mapper of an
+           inheritance hierarchy.
+
+           .. versionadded:: 1.0.0
+
         :param column_prefix: A string which will be prepended
            to the mapped attribute name when :class:`.Column`
            objects are automatically assigned as attributes to the
@@ -459,6 +492,24 @@ class Mapper(InspectionAttr):
            This is normally simply the primary key of the ``local_table``, but
            can be overridden here.
 
+        :param sequence_prefetch: Defaults to ``False``.  When ``True``,
+           primary key columns of this mapper's tables which are generated
+           by a :class:`.Sequence` have their values fetched ahead of
+           time within a flush, in one round trip per table for all the
+           objects being inserted, using a set-returning query such as
+           ``SELECT nextval(...) FROM generate_series(...)`` on Postgresql
+           or ``CONNECT BY LEVEL`` on Oracle.  The values are assigned to
+           the objects before the INSERT statements are emitted, so that
+           the INSERTs can be batched into a single "executemany" rather
+           than being emitted one row at a time in order to retrieve each
+           primary key.  This applies also to
+           :meth:`.Session.bulk_save_objects` when primary keys are to
+           be returned.  On backends without such a query, the sequence is
+           invoked once per object.  The flag is only consulted on the base
+           mapper of an inheritance hierarchy.
+
+           .. versionadded:: 1.0.0
+
         :param version_id_col: A :class:`.Column`
            that will be used to keep a running version id of rows
            in the table.  This is used to detect concurrent updates or
@@ -552,7 +603,10 @@ class Mapper(InspectionAttr):
         self._init_properties = properties or {}
         self._delete_orphans = []
         self.batch = batch
+        self.batch_insert_returning = batch_insert_returning
+        self.batch_updates = batch_updates
         self.eager_defaults = eager_defaults
+        self.sequence_prefetch = sequence_prefetch
         self.column_prefix = column_prefix
         self.polymorphic_on = expression._clause_element_as_expr(
             polymorphic_on)
@@ -18,13 +18,16 @@ import operator
 from itertools import groupby, chain
 from .. import sql, util, exc as sa_exc, schema
 from . import attributes, sync, exc as orm_exc, evaluator
-from .base import state_str, _attr_as_key, _entity_descriptor
+from .base import state_str, _attr_as_key, _entity_descriptor, \
+    ONETOMANY, MANYTOONE
 from ..sql import expression
+from ..util import topological
 from . import loading
 
 
 def _bulk_insert(
-        mapper, mappings, session_transaction, isstates, return_defaults):
+        mapper, mappings, session_transaction, isstates, return_defaults,
+        use_copy=False):
     base_mapper = mapper.base_mapper
 
     cached_connections = _cached_connection_dict(base_mapper)
@@ -44,20 +47,47 @@ def _bulk_insert(
         mappings = list(mappings)
 
     connection = session_transaction.connection(base_mapper)
+
+    if use_copy:
+        if return_defaults:
+            raise sa_exc.ArgumentError(
+                "return_defaults is not supported with use_copy")
+        if not connection.dialect.supports_copy_from:
+            raise sa_exc.InvalidRequestError(
+                "The %s dialect does not support COPY FROM" %
+                connection.dialect.dialect_description)
+
     for table, super_mapper in base_mapper._sorted_tables.items():
         if not mapper.isa(super_mapper):
             continue
 
+        if use_copy:
+            _emit_copy_statements(
+                connection, table,
+                _collect_insert_commands(table, (
+                    (None, mapping, mapper, connection)
+                    for mapping in mappings), bulk=True)
+            )
+            continue
+
+        states_to_insert = [
+            (None, mapping, mapper, connection) for mapping in mappings]
+        if return_defaults and base_mapper.sequence_prefetch:
+            sequence_values = _prefetch_sequence_values(
+                table, states_to_insert)
+        else:
+            sequence_values = None
+
         records = (
             (None, state_dict, params, mapper,
                 connection, value_params, has_all_pks, has_all_defaults)
             for
             state, state_dict, params, mp,
             conn, value_params, has_all_pks,
-            has_all_defaults in _collect_insert_commands(table, (
-                (None, mapping, mapper, connection)
-                for mapping in mappings),
-                bulk=True, return_defaults=return_defaults
+            has_all_defaults in _collect_insert_commands(
+                table, states_to_insert,
+                bulk=True, return_defaults=return_defaults,
+                sequence_values=sequence_values
             )
         )
         _emit_insert_statements(base_mapper, None,
@@ -120,6 +150,114 @@ def _bulk_update(mapper, mappings, session_transaction,
                                 bookkeeping=False)
 
 
+def _bulk_save_graph(states, session_transaction, return_defaults,
+                     update_changed_only):
+    """Bulk save the given states along with those related to them
+    along one-to-many and many-to-one relationships.
+
+    Mappers are INSERTed/UPDATEd in dependency order; foreign key
+    values are copied from each parent to its dependent rows using
+    :func:`.sync.populate` just before the dependent rows are sent.
+
+    """
+    states, syncs, dependencies, key_sources = _collect_bulk_graph(states)
+
+    by_base_mapper = util.OrderedDict()
+    for state in states:
+        by_base_mapper.setdefault(
+            state.mapper.base_mapper, util.OrderedDict()).setdefault(
+            (state.mapper, state.key is not None), []).append(state)
+
+    for base_mapper in topological.sort(dependencies, by_base_mapper):
+        for source, source_mapper, dest, dest_mapper, synchronize_pairs \
+                in syncs[base_mapper]:
+            sync.populate(source, source_mapper, dest, dest_mapper,
+                          synchronize_pairs, None, False)
+
+        for (mapper, isupdate), mapper_states in \
+                by_base_mapper[base_mapper].items():
+            if isupdate:
+                if update_changed_only:
+                    # parents are often traversed only to reach their
+                    # new children; skip those with no changed columns
+                    column_keys = set(
+                        prop.key for prop in mapper.column_attrs)
+                    mapper_states = [
+                        state for state in mapper_states
+                        if column_keys.intersection(state.committed_state)]
+                    if not mapper_states:
+                        continue
+                _bulk_update(
+                    mapper, mapper_states, session_transaction,
+                    True, update_changed_only)
+            else:
+                _bulk_insert(
+                    mapper, mapper_states, session_transaction, True,
+                    return_defaults or base_mapper in key_sources)
+
+
+def _collect_bulk_graph(states):
+    """Traverse the one-to-many and many-to-one relationships of the
+    given states which cascade "save-update", using only those values
+    already present in each state's dictionary.
+
+    Returns the full list of states, a dictionary of synchronization
+    records keyed on the base mapper of the dependent state, the set of
+    dependencies between base mappers, and the set of base mappers
+    whose new rows provide key values to other rows.
+
+    """
+    states = list(states)
+    seen = set(states)
+    syncs = util.defaultdict(list)
+    dependencies = set()
+    key_sources = set()
+
+    for state in states:
+        dict_ = state.dict
+        for prop in state.mapper.relationships:
+            if prop.direction not in (ONETOMANY, MANYTOONE) or \
+                    prop.secondary is not None or \
+                    prop.viewonly or not prop.cascade.save_update:
+                continue
+
+            value = dict_.get(prop.key)
+            if value is None:
+                continue
+
+            for related in (value if prop.uselist else (value, )):
+                related_state = attributes.instance_state(related)
+                if related_state not in seen:
+                    seen.add(related_state)
+                    states.append(related_state)
+
+                if prop.direction is MANYTOONE:
+                    source, source_mapper, dest, dest_mapper = \
+                        related_state, prop.mapper, state, prop.parent
+                else:
+                    source, source_mapper, dest, dest_mapper = \
+                        state, prop.parent, related_state, prop.mapper
+
+                dest_base = dest.mapper.base_mapper
+                syncs[dest_base].append(
+                    (source, source_mapper, dest, dest_mapper,
+                     prop.synchronize_pairs))
+
+                if source.key is None:
+                    source_base = source.mapper.base_mapper
+                    if source_base is dest_base:
+                        raise sa_exc.InvalidRequestError(
+                            "Relationship %s links two pending objects of "
+                            "the same mapper hierarchy, which isn't "
+                            "supported by bulk save; use Session.add() "
+                            "and Session.flush() to persist %s"
+                            % (prop, state_str(dest)))
+                    dependencies.add((source_base, dest_base))
+                    key_sources.add(source_base)
+
+    return states, syncs, dependencies, key_sources
+
+
 def save_obj(
         base_mapper, states, uowtransaction, single=False):
     """Issue ``INSERT`` and/or ``UPDATE`` statements for a list
@@ -159,7 +297,14 @@ def save_obj(
     for table, mapper in base_mapper._sorted_tables.items():
         if table not in mapper._pks_by_table:
             continue
-        insert = _collect_insert_commands(table, states_to_insert)
+        if base_mapper.sequence_prefetch:
+            sequence_values = _prefetch_sequence_values(
+                table, states_to_insert)
+        else:
+            sequence_values = None
+
+        insert = _collect_insert_commands(
+            table, states_to_insert, sequence_values=sequence_values)
 
         update = _collect_update_commands(
             uowtransaction, table, states_to_update)
@@ -358,9 +503,49 @@ def _organize_states_for_delete(base_mapper, states, uowtransaction):
             state, dict_, mapper, connection, update_version_id)
 
 
+def _prefetch_sequence_values(table, states_to_insert):
+    """Fetch values ahead of time for the primary key columns of the
+    given table which are generated by a :class:`.Sequence`, for those
+    states which don't yet have a value.
+
+    Returns a dictionary of connection to a list of
+    ``(column, iterator of values)`` tuples, for consumption by
+    _collect_insert_commands().
+
+    """
+    sequence_cols = [
+        col for col in table.primary_key
+        if col.default is not None and col.default.is_sequence]
+    if not sequence_cols:
+        return None
+
+    counts = util.OrderedDict()
+    for state, state_dict, mapper, connection in states_to_insert:
+        if table not in mapper._pks_by_table:
+            continue
+        for col in sequence_cols:
+            propkey = mapper._columntoproperty[col].key
+            if state_dict.get(propkey) is None:
+                counts[(connection, col)] = \
+                    counts.get((connection, col), 0) + 1
+
+    sequence_values = util.defaultdict(list)
+    for (connection, col), count in counts.items():
+        dialect = connection.dialect
+        if not dialect.supports_sequences or \
+                (col.default.optional and dialect.sequences_optional):
+            continue
+        sequence_values[connection].append(
+            (col, iter(
+                dialect.fetch_sequence_values(
+                    connection, col.default, count)))
+        )
+    return sequence_values
+
+
 def _collect_insert_commands(
         table, states_to_insert,
-        bulk=False, return_defaults=False):
+        bulk=False, return_defaults=False, sequence_values=None):
     """Identify sets of values to use in INSERT statements for a
     list of states.
 
@@ -384,6 +569,12 @@ def _collect_insert_commands(
             else:
                 params[col.key] = value
 
+        if sequence_values:
+            for col, values in sequence_values.get(connection, ()):
+                if params.get(col.key) is None:
+                    params[col.key] = state_dict[
+                        mapper._columntoproperty[col].key] = next(values)
+
         if not bulk:
             for colkey in mapper._insert_cols_as_none[table].\
                     difference(params).difference(value_params):
@@ -445,9 +636,12 @@ def _collect_update_commands(
                 set(propkey_to_col).intersection(state_dict)
             )
         else:
+            # committed_state holds only those attributes which have
+            # changed; consult it rather than every mapped column
             params = {}
-            for propkey in set(propkey_to_col).intersection(
-                    state.committed_state):
+            for propkey in [
+                    key for key in state.committed_state
+                    if key in propkey_to_col]:
                 value = state_dict[propkey]
                 col = propkey_to_col[propkey]
 
@@ -483,21 +677,26 @@ def _collect_update_commands(
             for col in pks:
                 propkey = mapper._columntoproperty[col].key
 
-                history = state.manager[propkey].impl.get_history(
-                    state, state_dict, attributes.PASSIVE_OFF)
-
-                if history.added:
-                    if not history.deleted or \
-                            ("pk_cascaded", state, col) in \
-                            uowtransaction.attributes:
-                        pk_params[col._label] = history.added[0]
-                        params.pop(col.key, None)
-                    else:
-                        # else, use the old value to locate the row
-                        pk_params[col._label] = history.deleted[0]
-                        params[col.key] = history.added[0]
+                if propkey not in state.committed_state and \
+                        propkey in state_dict:
+                    # unchanged and loaded; no history needed
+                    pk_params[col._label] = state_dict[propkey]
                 else:
-                    pk_params[col._label] = history.unchanged[0]
+                    history = state.manager[propkey].impl.get_history(
+                        state, state_dict, attributes.PASSIVE_OFF)
+
+                    if history.added:
+                        if not history.deleted or \
+                                ("pk_cascaded", state, col) in \
+                                uowtransaction.attributes:
+                            pk_params[col._label] = history.added[0]
+                            params.pop(col.key, None)
+                        else:
+                            # else, use the old value to locate the row
+                            pk_params[col._label] = history.deleted[0]
+                            params[col.key] = history.added[0]
+                    else:
+                        pk_params[col._label] = history.unchanged[0]
                 if pk_params[col._label] is None:
                     raise orm_exc.FlushError(
                         "Can't update table %s using NULL for primary "
@@ -574,6 +773,25 @@ def _collect_delete_commands(base_mapper, uowtransaction, table,
         yield params, connection
 
 
+def _regroup_update_records(update):
+    """Reorder records collected by _collect_update_commands() so that
+    those sharing a connection and set of parameter keys are adjacent,
+    allowing each such group to be sent as one executemany().
+
+    Groups are returned in the order in which each was first
+    encountered; records within a group retain their order.
+
+    """
+    groups = util.OrderedDict()
+    for rec in update:
+        key = rec[4], frozenset(rec[2]), bool(rec[5])
+        if key in groups:
+            groups[key].append(rec)
+        else:
+            groups[key] = [rec]
+    return chain.from_iterable(groups.values())
+
+
 def _emit_update_statements(base_mapper, uowtransaction,
                             cached_connections, mapper, table, update,
                             bookkeeping=True):
@@ -606,6 +824,9 @@ def _emit_update_statements(base_mapper, uowtransaction,
 
     statement = base_mapper._memo(('update', table), update_stmt)
 
+    if base_mapper.batch_updates:
+        update = _regroup_update_records(update)
+
     for (connection, paramkeys, hasvalue), \
         records in groupby(
             update,
@@ -683,6 +904,20 @@ def _emit_update_statements(base_mapper, uowtransaction,
                       c.dialect.dialect_description)
 
 
+def _emit_copy_statements(connection, table, records):
+    """Emit COPY FROM statements corresponding to value lists collected
+    by _collect_insert_commands(), on behalf of bulk_insert_mappings().
+
+    Consecutive records naming the same set of columns are loaded
+    by a single COPY.
+
+    """
+    for keys, group in groupby(
+            records, lambda rec: tuple(sorted(rec[2]))):
+        connection.dialect.copy_from(
+            connection, table, (rec[2] for rec in group), columns=keys)
+
+
 def _emit_insert_statements(base_mapper, uowtransaction,
                             cached_connections, mapper, table, insert,
                             bookkeeping=True):
@@ -700,6 +935,8 @@ def _emit_insert_statements(base_mapper, uowtransaction,
                 bool(rec[5]),  # whether we have "value" parameters
                 rec[6],
                 rec[7])):
+        records = list(records)
+
         if not bookkeeping or \
                 (
                     has_all_defaults
@@ -707,7 +944,6 @@ def _emit_insert_statements(base_mapper, uowtransaction,
                     or not connection.dialect.implicit_returning
                 ) and has_all_pks and not hasvalue:
 
-            records = list(records)
             multiparams = [rec[2] for rec in records]
 
             c = cached_connections[connection].\
@@ -728,6 +964,17 @@ def _emit_insert_statements(base_mapper, uowtransaction,
                         last_inserted_params,
                         value_params)
 
+        elif base_mapper.batch_insert_returning and \
+                len(records) > 1 and not hasvalue and \
+                (has_all_defaults or not base_mapper.eager_defaults) and \
+                mapper.version_id_generator is not False and \
+                connection.dialect.implicit_returning and \
+                connection.dialect.insert_executemany_returning and \
+                table.implicit_returning:
+            _emit_insert_returning_statement(
+                base_mapper, uowtransaction, cached_connections,
+                mapper, table, connection, records)
+
         else:
             if not has_all_defaults and base_mapper.eager_defaults:
                 statement = statement.return_defaults()
@@ -766,6 +1013,48 @@ def _emit_insert_statements(base_mapper, uowtransaction,
                     value_params)
 
 
+def _emit_insert_returning_statement(base_mapper, uowtransaction,
+                                    cached_connections, mapper, table,
+                                    connection, records):
+    """Emit a single INSERT..RETURNING for many records lacking primary
+    key values, rendered as multi-row VALUES, matching the returned
+    primary keys to states in order."""
+
+    pks = list(mapper._pks_by_table[table])
+
+    def insert_stmt():
+        return table.insert().returning(*pks).\
+            execution_options(executemany_mode='values')
+
+    statement = base_mapper._memo(('insert_returning', table), insert_stmt)
+
+    c = cached_connections[connection].\
+        execute(statement, [rec[2] for rec in records])
+    rows = c.fetchall()
+    if len(rows) != len(records):
+        raise orm_exc.FlushError(
+            "INSERT..RETURNING for table %s returned %d rows; "
+            "expected %d" % (table, len(rows), len(records)))
+
+    for (state, state_dict, params, mapper_rec,
+            conn, value_params, has_all_pks, has_all_defaults), \
+            row, last_inserted_params in \
+            zip(records, rows, c.context.compiled_parameters):
+        for col, pk in zip(pks, row):
+            prop = mapper_rec._columntoproperty[col]
+            if state_dict.get(prop.key) is None:
+                state_dict[prop.key] = pk
+        _postfetch(
+            mapper_rec,
+            uowtransaction,
+            table,
+            state,
+            state_dict,
+            c,
+            last_inserted_params,
+            value_params)
+
+
 def _emit_post_update_statements(base_mapper, uowtransaction,
                                  cached_connections, mapper, table, update):
     """Emit UPDATE statements corresponding to value lists collected
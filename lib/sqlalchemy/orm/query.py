@@ -70,6 +70,7 @@ class Query(object):
     _with_labels = False
     _criterion = None
     _yield_per = None
+    _plain_tuples = False
     _order_by = False
     _group_by = False
     _having = None
@@ -751,8 +752,11 @@ class Query(object):
             Also note that while
             :meth:`~sqlalchemy.orm.query.Query.yield_per` will set the
             ``stream_results`` execution option to True, currently
-            this is only understood by
-            :mod:`~sqlalchemy.dialects.postgresql.psycopg2` dialect
+            this is only understood by the
+            :mod:`~sqlalchemy.dialects.postgresql.psycopg2`,
+            :mod:`~sqlalchemy.dialects.postgresql.pg8000`,
+            :mod:`~sqlalchemy.dialects.mysql.mysqldb` and
+            :mod:`~sqlalchemy.dialects.mysql.pymysql` dialects
             which will stream results using server side cursors
             instead of pre-buffer all rows for this query. Other
             DBAPIs **pre-buffer all rows** before making them
@@ -764,11 +768,115 @@ class Query(object):
 
             :meth:`.Query.enable_eagerloads`
 
+            :meth:`.Query.stream`
+
         """
         self._yield_per = count
         self._execution_options = self._execution_options.union(
             {"stream_results": True})
 
+    def stream(self, partition_size=1000, expunge=True):
+        """Return an iterator which streams the results of this
+        :class:`.Query` as a series of lists, each containing up to
+        ``partition_size`` results.
+
+        E.g.::
+
+            for partition in session.query(User).stream(1000):
+                for user in partition:
+                    export(user)
+
+        The query is invoked with :meth:`.Query.yield_per`, so that the
+        ``stream_results`` execution option is set and a server side cursor
+        is used by those dialects which support one; rows are fetched
+        ``partition_size`` at a time, and each list produced corresponds
+        to one fetch of rows.  As with :meth:`.Query.yield_per`, joined
+        eager loading of collections as well as subquery eager loading
+        are not supported; the ``"selectin"`` loader, which emits its
+        load for each partition, may be used instead.
+
+        :param partition_size: number of rows to fetch for each partition.
+
+        :param expunge: when ``True``, the default, the mapped instances of
+         each partition, as well as those reachable along relationships
+         which cascade ``expunge``, are expunged from the :class:`.Session`
+         once the iteration proceeds to the next partition, so that the
+         identity map does not accumulate the full result.  Changes made
+         to these objects which have not been flushed are discarded along
+         with them.
+
+        .. versionadded:: 1.0.0
+
+        .. seealso::
+
+            :meth:`.Query.yield_per`
+
+        """
+        q = self.yield_per(partition_size)
+        context = q._compile_context()
+        context.statement.use_labels = True
+        context.partitioned = True
+        if q._autoflush and not q._populate_existing:
+            q.session._autoflush()
+        partitions = q._execute_and_instances(context)
+        if expunge:
+            partitions = q._expunge_partitions(partitions)
+        return partitions
+
+    def _expunge_partitions(self, partitions):
+        session = self.session
+        if len(self._entities) == 1 and \
+                self._entities[0].supports_single_entity:
+            if isinstance(self._entities[0], _MapperEntity):
+                def instances(row):
+                    return (row, )
+            else:
+                def instances(row):
+                    return ()
+        else:
+            indexes = [
+                idx for idx, ent in enumerate(self._entities)
+                if isinstance(ent, _MapperEntity)
+            ]
+
+            def instances(row):
+                return [row[idx] for idx in indexes]
+
+        for rows in partitions:
+            yield rows
+            for row in rows:
+                for instance in instances(row):
+                    if instance is not None and \
+                            attributes.instance_state(instance).\
+                            session_id is session.hash_key:
+                        session.expunge(instance)
+
+    @_generative()
+    def plain_tuples(self):
+        """Return rows as plain Python tuples, rather than as
+        :class:`.KeyedTuple` objects.
+
+        When a :class:`.Query` selects more than one entity or any column
+        expressions, each row is normally delivered as a
+        :class:`.KeyedTuple`, which provides access to its elements by
+        name.  With this option, rows are instead plain tuples, which
+        are cheaper to produce; when the :class:`.Query` selects only
+        columns and SQL expressions, rows are built directly from the
+        positions of those columns within the :class:`.ResultProxy`,
+        bypassing the per-entity row processing of the ORM::
+
+            for id, name in session.query(User.id, User.name).\\
+                    plain_tuples().yield_per(10000):
+                ...
+
+        A :class:`.Query` against a single mapped entity continues to
+        return the mapped instances themselves.
+
+        .. versionadded:: 1.0.0
+
+        """
+        self._plain_tuples = True
+
     def get(self, ident):
         """Return an instance based on the given primary key identifier,
         or ``None`` if not found.
@@ -826,7 +934,9 @@ class Query(object):
         :return: The object instance, or ``None``.
 
         """
+        return self._get_impl(ident, loading.load_on_ident)
 
+    def _get_impl(self, ident, fallback_fn):
         # convert composite types to individual args
         if hasattr(ident, '__composite_values__'):
             ident = ident.__composite_values__()
@@ -857,7 +967,7 @@ class Query(object):
                     return None
                 return instance
 
-        return loading.load_on_ident(self, key)
+        return fallback_fn(self, key)
 
     @_generative()
     def correlate(self, *args):
@@ -3643,14 +3753,16 @@ class _ColumnEntity(_QueryEntity):
     def _resolve_expr_against_query_aliases(self, query, expr, context):
         return query._adapt_clause(expr, False, True)
 
-    def row_processor(self, query, context, result):
+    def _result_column(self, query, context):
         column = self._resolve_expr_against_query_aliases(
             query, self.column, context)
 
         if context.adapter:
             column = context.adapter.columns[column]
+        return column
 
-        getter = result._getter(column)
+    def row_processor(self, query, context, result):
+        getter = result._getter(self._result_column(query, context))
         return getter, self._label_name
 
     def setup_context(self, query, context):
@@ -3665,6 +3777,7 @@ class _ColumnEntity(_QueryEntity):
 
 class QueryContext(object):
     multi_row_eager_loaders = False
+    partitioned = False
     adapter = None
     froms = ()
     for_update = None
@@ -3686,6 +3799,7 @@ class QueryContext(object):
 
         self.query = query
         self.session = query.session
+        self.autoflush = query._autoflush
         self.populate_existing = query._populate_existing
         self.invoke_all_eagers = query._invoke_all_eagers
         self.version_check = query._version_check
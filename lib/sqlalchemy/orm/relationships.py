@@ -496,6 +496,13 @@ class RelationshipProperty(StrategizedProperty):
             first accessed, using a separate SELECT statement, or identity map
             fetch for simple many-to-one references.
 
+          * ``batch`` - items should be loaded lazily when the property is
+            first accessed, using a single SELECT statement which loads the
+            property for all objects that were loaded by the same
+            :class:`.Query` as the object being accessed.
+
+            .. versionadded:: 1.0.0
+
           * ``immediate`` - items should be loaded as the parents are loaded,
             using a separate SELECT statement, or identity map fetch for
             simple many-to-one references.
@@ -510,6 +517,13 @@ class RelationshipProperty(StrategizedProperty):
             a subquery of the original statement, for each collection
             requested.
 
+          * ``selectin`` - items should be loaded "eagerly" as the parents
+            are loaded, using one or more additional SQL statements which
+            select the related rows using an IN clause against the
+            primary key identities of the parent objects.
+
+            .. versionadded:: 1.0.0
+
           * ``noload`` - no loading should occur at any time.  This is to
             support "write-only" attributes, or attributes which are
             populated in some manner specific to the application.
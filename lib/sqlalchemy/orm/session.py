@@ -2086,7 +2086,8 @@ class Session(_SessionClassMethods):
                 transaction.rollback(_capture_exception=True)
 
     def bulk_save_objects(
-            self, objects, return_defaults=False, update_changed_only=True):
+            self, objects, return_defaults=False, update_changed_only=True,
+            include_relationships=False):
         """Perform a bulk save of the given list of objects.
 
         The bulk save feature allows mapped objects to be used as the
@@ -2149,6 +2150,22 @@ class Session(_SessionClassMethods):
          When False, all attributes present are rendered into the SET clause
          with the exception of primary key attributes.
 
+        :param include_relationships: when True, objects which are
+         associated with the given objects along one-to-many and
+         many-to-one :func:`.relationship` constructs that cascade
+         "save-update" are also saved, and foreign key attributes are
+         populated from the primary keys of their parent objects.  Mappers
+         are processed in dependency order, and only those rows whose
+         primary keys are needed by other rows are inserted in the
+         manner of ``return_defaults``.  Only values already present on
+         each object are traversed; unloaded attributes aren't loaded,
+         many-to-many relationships and removals from collections are not
+         persisted, and two new objects of the same mapper hierarchy may
+         not depend on each other.  No per-object unit of work
+         bookkeeping is performed.
+
+         .. versionadded:: 1.0.0
+
         .. seealso::
 
             :ref:`bulk_operations`
@@ -2158,6 +2175,12 @@ class Session(_SessionClassMethods):
             :meth:`.Session.bulk_update_mappings`
 
         """
+        if include_relationships:
+            self._bulk_save_graph(
+                (attributes.instance_state(obj) for obj in objects),
+                return_defaults, update_changed_only)
+            return
+
         for (mapper, isupdate), states in itertools.groupby(
             (attributes.instance_state(obj) for obj in objects),
             lambda state: (state.mapper, state.key is not None)
@@ -2166,7 +2189,8 @@ class Session(_SessionClassMethods):
                 mapper, states, isupdate, True,
                 return_defaults, update_changed_only)
 
-    def bulk_insert_mappings(self, mapper, mappings, return_defaults=False):
+    def bulk_insert_mappings(
+            self, mapper, mappings, return_defaults=False, use_copy=False):
         """Perform a bulk insert of the given list of mapping dictionaries.
 
         The bulk insert feature allows plain Python dictionaries to be used as
@@ -2219,6 +2243,16 @@ class Session(_SessionClassMethods):
          reason this flag should be set as the returned default information
          is not used.
 
+        :param use_copy: when True, rows are loaded using the dialect's
+         ``COPY FROM`` facility rather than INSERT, as described at
+         :func:`.postgresql.copy_from`; this is currently supported by the
+         psycopg2 dialect only.  Rows naming the same set of keys are
+         loaded by a single ``COPY``.  Python-side column defaults are
+         not invoked, and this flag may not be combined with
+         :paramref:`.Session.bulk_insert_mappings.return_defaults`.
+
+         .. versionadded:: 1.0.0
+
 
         .. seealso::
 
@@ -2230,7 +2264,8 @@ class Session(_SessionClassMethods):
 
         """
         self._bulk_save_mappings(
-            mapper, mappings, False, False, return_defaults, False)
+            mapper, mappings, False, False, return_defaults, False,
+            use_copy)
 
     def bulk_update_mappings(self, mapper, mappings):
         """Perform a bulk update of the given list of mapping dictionaries.
@@ -2283,7 +2318,7 @@ class Session(_SessionClassMethods):
 
     def _bulk_save_mappings(
             self, mapper, mappings, isupdate, isstates,
-            return_defaults, update_changed_only):
+            return_defaults, update_changed_only, use_copy=False):
         mapper = _class_to_mapper(mapper)
         self._flushing = True
 
@@ -2296,7 +2331,24 @@ class Session(_SessionClassMethods):
                     isstates, update_changed_only)
             else:
                 persistence._bulk_insert(
-                    mapper, mappings, transaction, isstates, return_defaults)
+                    mapper, mappings, transaction, isstates, return_defaults,
+                    use_copy)
+            transaction.commit()
+
+        except:
+            with util.safe_reraise():
+                transaction.rollback(_capture_exception=True)
+        finally:
+            self._flushing = False
+
+    def _bulk_save_graph(self, states, return_defaults, update_changed_only):
+        self._flushing = True
+
+        transaction = self.begin(
+            subtransactions=True)
+        try:
+            persistence._bulk_save_graph(
+                states, transaction, return_defaults, update_changed_only)
             transaction.commit()
 
         except:
@@ -24,6 +24,7 @@ from .interfaces import (
 )
 from .session import _state_session
 import itertools
+import weakref
 
 
 def _register_attribute(
@@ -640,7 +641,7 @@ class LazyLoader(AbstractRelationshipLoader):
             # class-level lazyloader installed.
             set_lazy_callable = InstanceState._row_processor(
                 mapper.class_manager,
-                LoadLazyAttribute(key), key)
+                LoadLazyAttribute(key, self._strategy_keys[0]), key)
 
             populators["new"].append((self.key, set_lazy_callable))
         elif context.populate_existing or mapper.always_refresh:
@@ -661,18 +662,144 @@ class LazyLoader(AbstractRelationshipLoader):
 class LoadLazyAttribute(object):
     """serializable loader object used by LazyLoader"""
 
-    def __init__(self, key):
+    strategy_key = None
+
+    def __init__(self, key, strategy_key=None):
         self.key = key
+        self.strategy_key = strategy_key
 
     def __call__(self, state, passive=attributes.PASSIVE_OFF):
         key = self.key
         instance_mapper = state.manager.mapper
         prop = instance_mapper._props[key]
-        strategy = prop._strategies[LazyLoader]
+        if self.strategy_key is None:
+            strategy = prop._strategies[LazyLoader]
+        else:
+            strategy = prop._get_strategy(self.strategy_key)
 
         return strategy._load_for_state(state, passive)
 
 
+class LoadBatchAttribute(LoadLazyAttribute):
+    """loader object used by BatchLoader, carrying the states loaded
+    alongside the instance by the same :class:`.Query`.
+
+    Pickles as a plain :class:`.LoadLazyAttribute`.
+
+    """
+
+    def __init__(self, key, strategy_key, siblings):
+        super(LoadBatchAttribute, self).__init__(key, strategy_key)
+        self.siblings = siblings
+
+    def __call__(self, state, passive=attributes.PASSIVE_OFF):
+        prop = state.manager.mapper._props[self.key]
+        strategy = prop._get_strategy(self.strategy_key)
+        return strategy._load_for_state(state, passive, self.siblings)
+
+    def __reduce__(self):
+        return LoadLazyAttribute, (self.key, self.strategy_key)
+
+
+@log.class_logger
+@properties.RelationshipProperty.strategy_for(lazy="batch")
+class BatchLoader(LazyLoader):
+    """Provide loading behavior for a :class:`.RelationshipProperty`
+    with "lazy='batch'", that is loads when first accessed, for all
+    of the objects loaded by the same :class:`.Query` at once.
+
+    """
+
+    __slots__ = ()
+
+    batch_size = 500
+
+    class _Siblings(object):
+        """Weakly track the states loaded along a path by a single
+        :class:`.Query`.
+
+        """
+        __slots__ = 'states', 'batch_size'
+
+        def __init__(self, batch_size):
+            self.states = []
+            self.batch_size = batch_size
+
+    def create_row_processor(
+            self, context, path, loadopt,
+            mapper, result, adapter, populators):
+        super(BatchLoader, self).create_row_processor(
+            context, path, loadopt, mapper, result, adapter, populators)
+
+        key = self.key
+        path = path[self.parent_property]
+
+        siblings = path.get(context.attributes, "batch_siblings")
+        if siblings is None:
+            batch_size = loadopt.local_opts.get('batch_size', None) \
+                if loadopt else None
+            siblings = self._Siblings(batch_size or self.batch_size)
+            path.set(context.attributes, "batch_siblings", siblings)
+
+        loader = LoadBatchAttribute(key, self._strategy_keys[0], siblings)
+
+        def add_sibling(state, dict_, row):
+            siblings.states.append(weakref.ref(state))
+            state.callables[key] = loader
+
+        populators["new"].append((key, add_sibling))
+
+    def _load_for_state(self, state, passive, siblings=None):
+        if siblings is None or not siblings.states or not state.key or \
+                not passive & attributes.SQL_OK or \
+                not passive & attributes.RELATED_OBJECT_OK:
+            return super(BatchLoader, self)._load_for_state(state, passive)
+
+        session = _state_session(state)
+        if not session:
+            return super(BatchLoader, self)._load_for_state(state, passive)
+
+        if self.use_get:
+            # a simple many-to-one may already be present
+            # in the identity map
+            value = super(BatchLoader, self)._load_for_state(
+                state, passive ^ attributes.SQL_OK)
+            if value is not attributes.PASSIVE_NO_RESULT:
+                return value
+
+        key = self.key
+        states = [state]
+        for ref in siblings.states:
+            sibling = ref()
+            if sibling is not None and \
+                    sibling is not state and \
+                    sibling.key is not None and \
+                    sibling.session_id == state.session_id and \
+                    key not in sibling.dict and \
+                    key not in sibling.committed_state:
+                states.append(sibling)
+        del siblings.states[:]
+
+        def setup_query(q):
+            q = q._with_invoke_all_eagers(False)
+            if passive & attributes.NO_AUTOFLUSH:
+                q = q.autoflush(False)
+            if state.load_path:
+                q = q._with_current_path(
+                    state.load_path[self.parent_property])
+            if state.load_options:
+                q = q._conditional_options(*state.load_options)
+            return q
+
+        self.parent_property._get_strategy_by_cls(SelectInLoader).\
+            _load_states(
+                session,
+                [(s, s.dict, True) for s in states],
+                self.mapper, siblings.batch_size, setup_query)
+
+        return attributes.ATTR_WAS_SET
+
+
 @properties.RelationshipProperty.strategy_for(lazy="immediate")
 class ImmediateLoader(AbstractRelationshipLoader):
     __slots__ = ()
@@ -1079,6 +1206,204 @@ class SubqueryLoader(AbstractRelationshipLoader):
             populators["eager"].append((self.key, collections.loader))
 
 
+@log.class_logger
+@properties.RelationshipProperty.strategy_for(lazy="selectin")
+class SelectInLoader(AbstractRelationshipLoader):
+    """Provide loading behavior for a :class:`.RelationshipProperty`
+    using "select IN" eager loading.
+
+    As parent rows are loaded, the identities of the parent objects are
+    collected; once each batch of rows is processed, related objects are
+    loaded using a SELECT which filters on those identities with IN,
+    in chunks of at most ``batch_size`` identities.
+
+    """
+
+    __slots__ = 'join_depth', 'omit_join'
+
+    batch_size = 500
+
+    def __init__(self, parent):
+        super(SelectInLoader, self).__init__(parent)
+        self.join_depth = self.parent_property.join_depth
+
+        # if the relationship is a plain one-to-many against the
+        # parent's primary key, the related rows can be selected
+        # directly from the foreign key columns without joining
+        # back to the parent
+        if self.parent_property.direction is interfaces.ONETOMANY and \
+                self.parent_property.secondary is None:
+            lazyloader = self.parent_property._get_strategy_by_cls(
+                LazyLoader)
+            self.omit_join = self.parent._get_clause[0].compare(
+                lazyloader._rev_lazywhere,
+                use_proxies=True,
+                equivalents=self.parent._equivalent_columns
+            )
+        else:
+            self.omit_join = False
+
+    def init_class_attribute(self, mapper):
+        self.parent_property.\
+            _get_strategy_by_cls(LazyLoader).\
+            init_class_attribute(mapper)
+
+    def create_row_processor(
+            self, context, path, loadopt, mapper,
+            result, adapter, populators):
+        if not self.parent.class_manager[self.key].impl.supports_population:
+            raise sa_exc.InvalidRequestError(
+                "'%s' does not support object "
+                "population - eager loading cannot be applied." %
+                self
+            )
+
+        if not context.query._enable_eagerloads:
+            return
+
+        path = path[self.parent_property]
+
+        selectin_path = context.query._current_path + path
+
+        # if not via query option, check for
+        # a cycle
+        if not path.contains(context.attributes, "loader"):
+            if self.join_depth:
+                if selectin_path.length / 2 > self.join_depth:
+                    return
+            elif selectin_path.contains_mapper(self.mapper):
+                return
+
+        with_poly_info = path.get(
+            context.attributes,
+            "path_with_polymorphic", None)
+        if with_poly_info is not None:
+            effective_entity = with_poly_info.entity
+        else:
+            effective_entity = self.mapper
+
+        batch_size = loadopt.local_opts.get('batch_size', None) \
+            if loadopt else None
+
+        post_load = loading.PostLoad.for_path(
+            context, selectin_path, self._load_for_path,
+            effective_entity, batch_size or self.batch_size)
+
+        populators["new"].append((self.key, post_load.add_state))
+        if context.invoke_all_eagers:
+            populators["eager"].append(
+                (self.key, post_load.add_existing_state))
+
+    def _load_for_path(
+            self, context, path, states, effective_entity, batch_size):
+        orig_query = context.query
+
+        def setup_query(q):
+            # propagate loader options etc. to the new query.
+            # these will fire relative to the current path.
+            q = q._with_current_path(path)
+            q = q._conditional_options(*orig_query._with_options)
+            if orig_query._populate_existing:
+                q._populate_existing = orig_query._populate_existing
+            return q
+
+        self._load_states(
+            orig_query.session, states, effective_entity,
+            batch_size, setup_query)
+
+    def _load_states(
+            self, session, states, effective_entity, batch_size,
+            setup_query):
+        """Load the related objects for the given list of
+        ``(state, dict_, overwrite)`` tuples, populating the attribute
+        on those states where ``overwrite`` is set."""
+
+        if self.omit_join and effective_entity is self.mapper:
+            # select the related rows alone, keyed on the
+            # foreign key columns which refer to the parent
+            pk_to_fk = dict(
+                self.parent_property._join_condition.local_remote_pairs)
+            for col in list(pk_to_fk):
+                for equiv in self.parent._equivalent_columns.get(col, ()):
+                    pk_to_fk.setdefault(equiv, pk_to_fk[col])
+            key_cols = [pk_to_fk[col] for col in self.parent.primary_key]
+
+            q = session.query(effective_entity)
+            q = q.add_columns(*key_cols)
+
+            if self.parent_property.order_by:
+                q = q.order_by(*util.to_list(self.parent_property.order_by))
+        else:
+            # join from an alias of the parent to the related entity,
+            # keyed on the parent's primary key
+            parent_alias = orm_util.AliasedClass(self.parent, flat=True)
+            key_cols = [
+                inspect(parent_alias)._adapt_element(col)
+                for col in self.parent.primary_key
+            ]
+
+            attr = getattr(parent_alias, self.key)
+            if effective_entity is not self.mapper:
+                attr = attr.of_type(effective_entity)
+
+            q = session.query(effective_entity)
+            q = q.add_columns(*key_cols)
+            q = q.select_from(parent_alias).join(attr)
+
+            if self.parent_property.order_by:
+                # if there's an ORDER BY, alias it the same way
+                # as the join, which may have aliased the
+                # "secondary" table
+                q = q.order_by(
+                    *q._from_obj[0]._target_adapter.copy_and_process(
+                        util.to_list(self.parent_property.order_by)))
+
+        q = setup_query(q)
+
+        if len(key_cols) == 1:
+            def in_clause(chunk):
+                return key_cols[0].in_([state.key[1][0] for state in chunk])
+        else:
+            def in_clause(chunk):
+                return sql.or_(*[
+                    sql.and_(*[
+                        col == value
+                        for col, value in zip(key_cols, state.key[1])
+                    ])
+                    for state in chunk
+                ])
+
+        states = [
+            (state, dict_, overwrite) for state, dict_, overwrite in states
+            if state.key is not None
+        ]
+
+        while states:
+            chunk, states = states[0:batch_size], states[batch_size:]
+
+            data = util.defaultdict(list)
+            for row in q.filter(
+                    in_clause([state for state, _, _ in chunk])):
+                data[tuple(row[1:])].append(row[0])
+
+            for state, dict_, overwrite in chunk:
+                if not overwrite:
+                    continue
+                collection = data.get(state.key[1], ())
+                if self.uselist:
+                    state.get_impl(self.key).\
+                        set_committed_value(state, dict_, collection)
+                else:
+                    if len(collection) > 1:
+                        util.warn(
+                            "Multiple rows returned with "
+                            "uselist=False for eagerly-loaded "
+                            "attribute '%s' " % self)
+                    state.get_impl(self.key).set_committed_value(
+                        state, dict_,
+                        collection[0] if collection else None)
+
+
 @log.class_logger
 @properties.RelationshipProperty.strategy_for(lazy="joined")
 @properties.RelationshipProperty.strategy_for(lazy=False)
@@ -769,6 +769,63 @@ def subqueryload_all(*keys):
     return _UnboundLoad._from_keys(_UnboundLoad.subqueryload, keys, True, {})
 
 
+@loader_option()
+def selectinload(loadopt, attr, batch_size=None):
+    """Indicate that the given attribute should be loaded using
+    SELECT IN eager loading.
+
+    This function is part of the :class:`.Load` interface and supports
+    both method-chained and standalone operation.
+
+    examples::
+
+        # selectin-load the "orders" collection on "User"
+        query(User).options(selectinload(User.orders))
+
+        # selectin-load Order.items and then Item.keywords
+        query(Order).options(
+            selectinload(Order.items).selectinload(Item.keywords))
+
+        # lazily load Order.items, but when Items are loaded,
+        # selectin-load the keywords collection
+        query(Order).options(lazyload(Order.items).selectinload(Item.keywords))
+
+    :param batch_size: maximum number of parent identities to be
+     included in the IN clause of a single SELECT; parents beyond this
+     number are loaded using additional SELECT statements.  Defaults
+     to 500.
+
+    .. versionadded:: 1.0.0
+
+    .. seealso::
+
+        :ref:`loading_toplevel`
+
+        :func:`.orm.subqueryload`
+
+        :func:`.orm.joinedload`
+
+        :paramref:`.relationship.lazy`
+
+    """
+    loader = loadopt.set_relationship_strategy(attr, {"lazy": "selectin"})
+    if batch_size is not None:
+        loader.local_opts['batch_size'] = batch_size
+    return loader
+
+
+@selectinload._add_unbound_fn
+def selectinload(*keys, **kw):
+    return _UnboundLoad._from_keys(
+        _UnboundLoad.selectinload, keys, False, kw)
+
+
+@selectinload._add_unbound_all_fn
+def selectinload_all(*keys, **kw):
+    return _UnboundLoad._from_keys(
+        _UnboundLoad.selectinload, keys, True, kw)
+
+
 @loader_option()
 def lazyload(loadopt, attr):
     """Indicate that the given attribute should be loaded using "lazy"
@@ -795,6 +852,51 @@ def lazyload_all(*keys):
     return _UnboundLoad._from_keys(_UnboundLoad.lazyload, keys, True, {})
 
 
+@loader_option()
+def batchload(loadopt, attr, batch_size=None):
+    """Indicate that the given attribute should be loaded using
+    "batch" lazy loading.
+
+    The attribute is loaded when first accessed, as with
+    :func:`.orm.lazyload`; however, the first access loads the attribute
+    for every object that was loaded by the same :class:`.Query` and
+    for which the attribute isn't yet loaded, using a single SELECT
+    with an IN clause against the primary key identities of those
+    objects.
+
+    This function is part of the :class:`.Load` interface and supports
+    both method-chained and standalone operation.
+
+    :param batch_size: maximum number of parent identities to be
+     included in the IN clause of a single SELECT.  Defaults to 500.
+
+    .. versionadded:: 1.0.0
+
+    .. seealso::
+
+        :ref:`loading_toplevel`
+
+        :func:`.orm.selectinload`
+
+        :paramref:`.relationship.lazy`
+
+    """
+    loader = loadopt.set_relationship_strategy(attr, {"lazy": "batch"})
+    if batch_size is not None:
+        loader.local_opts['batch_size'] = batch_size
+    return loader
+
+
+@batchload._add_unbound_fn
+def batchload(*keys, **kw):
+    return _UnboundLoad._from_keys(_UnboundLoad.batchload, keys, False, kw)
+
+
+@batchload._add_unbound_all_fn
+def batchload_all(*keys, **kw):
+    return _UnboundLoad._from_keys(_UnboundLoad.batchload, keys, True, kw)
+
+
 @loader_option()
 def immediateload(loadopt, attr):
     """Indicate that the given attribute should be loaded using
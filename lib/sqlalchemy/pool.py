@@ -17,6 +17,8 @@ regular DB-API connect() methods to be transparently managed by a
 SQLAlchemy connection pool.
 """
 
+import bisect
+import math
 import time
 import traceback
 import weakref
@@ -88,6 +90,89 @@ class _ConnDialect(object):
     def do_close(self, dbapi_connection):
         dbapi_connection.close()
 
+    def do_ping(self, dbapi_connection):
+        raise NotImplementedError(
+            "The ping feature requires that a dialect is "
+            "passed to the connection pool.")
+
+
+class _Histogram(object):
+    """Accumulate a distribution of durations, in seconds, into
+    fixed buckets."""
+
+    bounds = (.001, .005, .01, .05, .1, .5, 1, 5, 10)
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.max = 0
+        self.buckets = [0] * (len(self.bounds) + 1)
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        self.buckets[bisect.bisect_left(self.bounds, value)] += 1
+
+    def percentile(self, p):
+        """Estimate the value below which ``p`` percent of values fall,
+        as the upper bound of the bucket containing it, limited to the
+        largest value seen."""
+
+        if not self.count:
+            return None
+        rank = max(1, int(math.ceil(self.count * p / 100.0)))
+        seen = 0
+        for bound, n in zip(self.bounds, self.buckets):
+            seen += n
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def as_dict(self):
+        return {
+            'count': self.count,
+            'total': self.total,
+            'max': self.max,
+            'buckets': list(zip(self.bounds + (None, ), self.buckets))
+        }
+
+
+class _PoolStats(object):
+    """Counters and timings collected by a :class:`.Pool` when
+    :paramref:`.Pool.collect_stats` is set."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.overflow_connections = 0
+        self.overflow_high_water = 0
+        self.checkout_wait = _Histogram()
+        self.hold_time = _Histogram()
+        self.connect_time = _Histogram()
+
+    def overflow(self, overflow):
+        if overflow > 0:
+            self.overflow_connections += 1
+            if overflow > self.overflow_high_water:
+                self.overflow_high_water = overflow
+
+    def as_dict(self):
+        return {
+            'checkouts': self.checkouts,
+            'connects': self.connects,
+            'invalidations': self.invalidations,
+            'timeouts': self.timeouts,
+            'overflow_connections': self.overflow_connections,
+            'overflow_high_water': self.overflow_high_water,
+            'checkout_wait': self.checkout_wait.as_dict(),
+            'hold_time': self.hold_time.as_dict(),
+            'connect_time': self.connect_time.as_dict()
+        }
+
 
 class Pool(log.Identified):
 
@@ -95,6 +180,11 @@ class Pool(log.Identified):
 
     _dialect = _ConnDialect()
 
+    @property
+    def _has_timing_events(self):
+        return bool(
+            self.dispatch.checkout_wait or self.dispatch.checkin_hold)
+
     def __init__(self,
                  creator, recycle=-1, echo=None,
                  use_threadlocal=False,
@@ -102,6 +192,9 @@ class Pool(log.Identified):
                  reset_on_return=True,
                  listeners=None,
                  events=None,
+                 pre_ping=False,
+                 pre_ping_interval=1,
+                 collect_stats=False,
                  _dispatch=None,
                  _dialect=None):
         """
@@ -206,6 +299,39 @@ class Pool(log.Identified):
           pool.  This has been superseded by
           :func:`~sqlalchemy.event.listen`.
 
+        :param pre_ping: if True, the pool will emit a "ping" (typically
+         "SELECT 1", but is dialect-specific) on the connection
+         upon checkout, to test if the connection is alive or not.   If not,
+         the connection is invalidated and transparently re-connected.
+         Requires that a dialect is passed as well to interpret the
+         disconnection error; this is the case for the pool of an
+         :class:`.Engine`.
+
+         .. versionadded:: 1.0.0
+
+         .. seealso::
+
+            :ref:`pool_disconnects_pessimistic`
+
+        :param pre_ping_interval: when :paramref:`.Pool.pre_ping` is set,
+         a connection which was returned to the pool within this number of
+         seconds is handed out again without being pinged, so that the ping
+         is only emitted for connections which have been idle for some
+         time.  Set to zero to ping on every checkout.  Defaults to 1.
+
+         .. versionadded:: 1.0.0
+
+        :param collect_stats: if True, the pool collects counters and
+         timings regarding its usage, such as the time spent waiting for
+         connections and the time connections stay checked out, which are
+         then available from :meth:`.Pool.stats`.  Defaults to False.
+
+         .. versionadded:: 1.0.0
+
+         .. seealso::
+
+            :ref:`pool_stats`
+
         """
         if logging_name:
             self.logging_name = self._orig_logging_name = logging_name
@@ -218,6 +344,9 @@ class Pool(log.Identified):
         self._recycle = recycle
         self._invalidate_time = 0
         self._use_threadlocal = use_threadlocal
+        self._pre_ping = pre_ping
+        self._pre_ping_interval = pre_ping_interval
+        self._stats = _PoolStats() if collect_stats else None
         if reset_on_return in ('rollback', True, reset_rollback):
             self._reset_on_return = reset_rollback
         elif reset_on_return in (None, False, reset_none):
@@ -373,6 +502,47 @@ class Pool(log.Identified):
     def status(self):
         raise NotImplementedError()
 
+    def stats(self):
+        """Return a dictionary of statistics for this pool.
+
+        Requires that the pool was created with
+        :paramref:`.Pool.collect_stats` set to True.  The dictionary
+        includes the number of ``checkouts``, ``connects``,
+        ``invalidations`` and ``timeouts`` counted since the pool was
+        created or :meth:`.Pool.reset_stats` was last called; the number
+        of ``overflow_connections`` established beyond the size of a
+        :class:`.QueuePool` and the ``overflow_high_water`` mark of
+        :meth:`.QueuePool.overflow`; as well as the timings
+        ``checkout_wait``, ``hold_time`` and ``connect_time``, each a
+        dictionary of ``count``, ``total``, ``max`` and a list of
+        ``buckets``.  Counters are not synchronized between threads and
+        should be treated as approximate.
+
+        .. versionadded:: 1.0.0
+
+        .. seealso::
+
+            :ref:`pool_stats`
+
+        """
+        if self._stats is None:
+            raise exc.InvalidRequestError(
+                "Statistics are not collected for this pool; "
+                "set collect_stats=True to enable")
+        return self._stats.as_dict()
+
+    def reset_stats(self):
+        """Reset all counters and timings returned by :meth:`.Pool.stats`.
+
+        .. versionadded:: 1.0.0
+
+        """
+        if self._stats is None:
+            raise exc.InvalidRequestError(
+                "Statistics are not collected for this pool; "
+                "set collect_stats=True to enable")
+        self._stats = _PoolStats()
+
 
 class _ConnectionRecord(object):
 
@@ -415,6 +585,8 @@ class _ConnectionRecord(object):
             exec_once(self.connection, self)
         pool.dispatch.connect(self.connection, self)
 
+    _checkin_time = None
+
     connection = None
     """A reference to the actual DBAPI connection being tracked.
 
@@ -434,14 +606,28 @@ class _ConnectionRecord(object):
         """
         return {}
 
+    _checkout_time = None
+
     @classmethod
     def checkout(cls, pool):
+        timed = pool._stats is not None or pool._has_timing_events
+        if timed:
+            start = time.time()
         rec = pool._do_get()
         try:
             dbapi_connection = rec.get_connection()
         except:
             with util.safe_reraise():
                 rec.checkin()
+        if timed:
+            rec._checkout_time = now = time.time()
+            wait = now - start
+            stats = pool._stats
+            if stats is not None:
+                stats.checkouts += 1
+                stats.checkout_wait.add(wait)
+            if pool.dispatch.checkout_wait:
+                pool.dispatch.checkout_wait(dbapi_connection, rec, wait)
         echo = pool._should_log_debug()
         fairy = _ConnectionFairy(dbapi_connection, rec, echo)
         rec.fairy_ref = weakref.ref(
@@ -461,6 +647,15 @@ class _ConnectionRecord(object):
         self.fairy_ref = None
         connection = self.connection
         pool = self.__pool
+        if pool._pre_ping:
+            self._checkin_time = time.time()
+        if self._checkout_time is not None:
+            hold = time.time() - self._checkout_time
+            self._checkout_time = None
+            if pool._stats is not None:
+                pool._stats.hold_time.add(hold)
+            if pool.dispatch.checkin_hold:
+                pool.dispatch.checkin_hold(connection, self, hold)
         while self.finalize_callback:
             finalizer = self.finalize_callback.pop()
             finalizer(connection)
@@ -489,6 +684,8 @@ class _ConnectionRecord(object):
         if self.connection is None:
             return
         self.__pool.dispatch.invalidate(self.connection, self, e)
+        if self.__pool._stats is not None:
+            self.__pool._stats.invalidations += 1
         if e is not None:
             self.__pool.logger.info(
                 "Invalidate connection %r (reason: %s:%s)",
@@ -499,6 +696,11 @@ class _ConnectionRecord(object):
         self.__close()
         self.connection = None
 
+    def _ping_due(self):
+        return self._checkin_time is not None and \
+            time.time() - self._checkin_time >= \
+            self.__pool._pre_ping_interval
+
     def get_connection(self):
         recycle = False
         if self.connection is None:
@@ -534,7 +736,12 @@ class _ConnectionRecord(object):
     def __connect(self):
         try:
             self.starttime = time.time()
+            self._checkin_time = None
             connection = self.__pool._creator()
+            stats = self.__pool._stats
+            if stats is not None:
+                stats.connects += 1
+                stats.connect_time.add(time.time() - self.starttime)
             self.__pool.logger.debug("Created new connection %r", connection)
             return connection
         except Exception as e:
@@ -652,16 +859,28 @@ class _ConnectionFairy(object):
             raise exc.InvalidRequestError("This connection is closed")
         fairy._counter += 1
 
-        if not pool.dispatch.checkout or fairy._counter != 1:
+        if not (pool.dispatch.checkout or pool._pre_ping) or \
+                fairy._counter != 1:
             return fairy
 
-        # Pool listeners can trigger a reconnection on checkout
+        # Pool listeners can trigger a reconnection on checkout, as
+        # can a failed pre-ping
         attempts = 2
         while attempts > 0:
             try:
-                pool.dispatch.checkout(fairy.connection,
-                                       fairy._connection_record,
-                                       fairy)
+                if pool._pre_ping and fairy._connection_record._ping_due():
+                    if fairy._echo:
+                        pool.logger.debug(
+                            "Pool pre-ping on connection %s",
+                            fairy.connection)
+                    if not pool._dialect.do_ping(fairy.connection):
+                        raise exc.DisconnectionError(
+                            "Connection %r failed pre-ping" %
+                            fairy.connection)
+                if pool.dispatch.checkout:
+                    pool.dispatch.checkout(fairy.connection,
+                                           fairy._connection_record,
+                                           fairy)
                 return fairy
             except exc.DisconnectionError as e:
                 pool.logger.info(
@@ -832,6 +1051,9 @@ class SingletonThreadPool(Pool):
                               logging_name=self._orig_logging_name,
                               use_threadlocal=self._use_threadlocal,
                               reset_on_return=self._reset_on_return,
+                              pre_ping=self._pre_ping,
+                              pre_ping_interval=self._pre_ping_interval,
+                              collect_stats=self._stats is not None,
                               _dispatch=self.dispatch,
                               _dialect=self._dialect)
 
@@ -885,7 +1107,7 @@ class QueuePool(Pool):
     """
 
     def __init__(self, creator, pool_size=5, max_overflow=10, timeout=30,
-                 **kw):
+                 use_lifo=False, min_size=0, idle_timeout=None, **kw):
         """
         Construct a QueuePool.
 
@@ -917,20 +1139,73 @@ class QueuePool(Pool):
         :param timeout: The number of seconds to wait before giving up
           on returning a connection. Defaults to 30.
 
+        :param use_lifo: use LIFO (last-in-first-out) when retrieving
+          connections instead of FIFO (first-in-first-out). Using LIFO, a
+          server-side timeout scheme can reduce the number of connections
+          used during non-peak periods of use, as the connections which
+          are used least recently are left idle at the bottom of the
+          queue where they may be recycled or expire.  When planning
+          for server-side timeouts, ensure that a recycle or
+          pre-ping strategy is in use to gracefully handle stale
+          connections.
+
+          .. versionadded:: 1.0.0
+
+          .. seealso::
+
+            :ref:`pool_use_lifo`
+
+        :param min_size: The number of connections the pool keeps open
+          at minimum, up to ``pool_size``.  Once the pool has established
+          its first connection, it opens connections in a background
+          thread until this number is reached, so that they're ready
+          ahead of demand; the same takes place whenever connections
+          have been discarded and the pool falls below this number.
+          Defaults to 0.
+
+          .. versionadded:: 1.0.0
+
+          .. seealso::
+
+            :ref:`pool_min_size`
+
+        :param idle_timeout: if set, a number of seconds after which a
+          connection which has remained checked in to the pool without
+          being used is closed, as long as the pool holds more than
+          ``min_size`` connections.  Idle connections are trimmed as
+          other connections are returned to the pool.  Defaults to None,
+          meaning idle connections are never closed.
+
+          .. versionadded:: 1.0.0
+
+          .. seealso::
+
+            :ref:`pool_min_size`
+
         :param \**kw: Other keyword arguments including
           :paramref:`.Pool.recycle`, :paramref:`.Pool.echo`,
           :paramref:`.Pool.reset_on_return` and others are passed to the
           :class:`.Pool` constructor.
 
         """
+        if pool_size > 0 and min_size > pool_size:
+            raise exc.ArgumentError(
+                "min_size %d may not exceed pool_size %d" %
+                (min_size, pool_size))
         Pool.__init__(self, creator, **kw)
-        self._pool = sqla_queue.Queue(pool_size)
+        self._pool = sqla_queue.Queue(pool_size, use_lifo=use_lifo)
         self._overflow = 0 - pool_size
         self._max_overflow = max_overflow
         self._timeout = timeout
+        self._min_size = min_size
+        self._idle_timeout = idle_timeout
         self._overflow_lock = threading.Lock()
+        self._warming = False
+        self._generation = 0
 
     def _do_return_conn(self, conn):
+        if self._idle_timeout is not None:
+            conn._checkin_time = time.time()
         try:
             self._pool.put(conn, False)
         except sqla_queue.Full:
@@ -938,6 +1213,61 @@ class QueuePool(Pool):
                 conn.close()
             finally:
                 self._dec_overflow()
+        else:
+            if self._idle_timeout is not None:
+                self._trim_idle(conn._checkin_time)
+
+    def _total(self):
+        return self._pool.maxsize + self._overflow
+
+    def _trim_idle(self, now):
+        deadline = now - self._idle_timeout
+
+        def idle(rec):
+            return (rec._checkin_time or rec.starttime) < deadline
+
+        for rec in self._pool.get_oldest(
+                idle, self._total() - self._min_size):
+            self.logger.info(
+                "Connection %r exceeded idle timeout; closing",
+                rec.connection)
+            try:
+                rec.close()
+            finally:
+                self._dec_overflow()
+
+    def _start_warm_up(self):
+        with self._overflow_lock:
+            if self._warming:
+                return
+            self._warming = True
+        thread = threading.Thread(
+            target=self._warm_up, args=(self._generation, ))
+        thread.daemon = True
+        thread.start()
+
+    def _warm_up(self, generation):
+        try:
+            while self._total() < self._min_size and \
+                    self._inc_overflow(generation):
+                try:
+                    rec = self._create_connection()
+                except Exception:
+                    self._dec_overflow(generation)
+                    self.logger.error(
+                        "Exception establishing connection during warm-up",
+                        exc_info=True)
+                    break
+                if self._generation != generation:
+                    # the pool was disposed while connecting; dispose()
+                    # has already reset the overflow count, so the
+                    # connection is discarded without adjusting it
+                    rec.close()
+                    break
+                self._do_return_conn(rec)
+        finally:
+            with self._overflow_lock:
+                self._warming = False
 
     def _do_get(self):
         use_overflow = self._max_overflow > -1
@@ -950,36 +1280,51 @@ class QueuePool(Pool):
                 if not wait:
                     return self._do_get()
                 else:
+                    if self._stats is not None:
+                        self._stats.timeouts += 1
                     raise exc.TimeoutError(
                         "QueuePool limit of size %d overflow %d reached, "
                         "connection timed out, timeout %d" %
                         (self.size(), self.overflow(), self._timeout))
 
             if self._inc_overflow():
+                if self._stats is not None:
+                    self._stats.overflow(self._overflow)
                 try:
-                    return self._create_connection()
+                    rec = self._create_connection()
                 except:
                     with util.safe_reraise():
                         self._dec_overflow()
+                if self._min_size and self._total() < self._min_size:
+                    self._start_warm_up()
+                return rec
             else:
                 return self._do_get()
 
-    def _inc_overflow(self):
+    def _inc_overflow(self, generation=None):
         if self._max_overflow == -1:
+            if generation is not None and generation != self._generation:
+                return False
             self._overflow += 1
             return True
         with self._overflow_lock:
+            if generation is not None and generation != self._generation:
+                return False
             if self._overflow < self._max_overflow:
                 self._overflow += 1
                 return True
             else:
                 return False
 
-    def _dec_overflow(self):
+    def _dec_overflow(self, generation=None):
         if self._max_overflow == -1:
+            if generation is not None and generation != self._generation:
+                return False
             self._overflow -= 1
             return True
         with self._overflow_lock:
+            if generation is not None and generation != self._generation:
+                return False
             self._overflow -= 1
             return True
 
@@ -988,10 +1333,16 @@ class QueuePool(Pool):
         return self.__class__(self._creator, pool_size=self._pool.maxsize,
                               max_overflow=self._max_overflow,
                               timeout=self._timeout,
+                              use_lifo=self._pool.use_lifo,
+                              min_size=self._min_size,
+                              idle_timeout=self._idle_timeout,
                               recycle=self._recycle, echo=self.echo,
                               logging_name=self._orig_logging_name,
                               use_threadlocal=self._use_threadlocal,
                               reset_on_return=self._reset_on_return,
+                              pre_ping=self._pre_ping,
+                              pre_ping_interval=self._pre_ping_interval,
+                              collect_stats=self._stats is not None,
                               _dispatch=self.dispatch,
                               _dialect=self._dialect)
 
@@ -1003,7 +1354,9 @@ class QueuePool(Pool):
             except sqla_queue.Empty:
                 break
 
-        self._overflow = 0 - self.size()
+        with self._overflow_lock:
+            self._generation += 1
+            self._overflow = 0 - self.size()
         self.logger.info("Pool disposed. %s", self.status())
 
     def status(self):
@@ -1014,6 +1367,25 @@ class QueuePool(Pool):
                                  self.overflow(),
                                  self.checkedout())
 
+    def stats(self):
+        """Return a dictionary of statistics for this pool.
+
+        In addition to the statistics described at :meth:`.Pool.stats`,
+        the dictionary for :class:`.QueuePool` includes the current
+        ``size``, ``checkedin``, ``checkedout`` and ``overflow`` values.
+
+        .. versionadded:: 1.0.0
+
+        """
+        stats = super(QueuePool, self).stats()
+        stats.update(
+            size=self.size(),
+            checkedin=self.checkedin(),
+            checkedout=self.checkedout(),
+            overflow=self.overflow()
+        )
+        return stats
+
     def size(self):
         return self._pool.maxsize
 
@@ -1062,6 +1434,9 @@ class NullPool(Pool):
                               logging_name=self._orig_logging_name,
                               use_threadlocal=self._use_threadlocal,
                               reset_on_return=self._reset_on_return,
+                              pre_ping=self._pre_ping,
+                              pre_ping_interval=self._pre_ping_interval,
+                              collect_stats=self._stats is not None,
                               _dispatch=self.dispatch,
                               _dialect=self._dialect)
 
@@ -1102,6 +1477,9 @@ class StaticPool(Pool):
                               recycle=self._recycle,
                               use_threadlocal=self._use_threadlocal,
                               reset_on_return=self._reset_on_return,
+                              pre_ping=self._pre_ping,
+                              pre_ping_interval=self._pre_ping_interval,
+                              collect_stats=self._stats is not None,
                               echo=self.echo,
                               logging_name=self._orig_logging_name,
                               _dispatch=self.dispatch,
@@ -113,6 +113,12 @@ def py_fallback():
         else:
             return value and True or False
 
+    def process_column(processor, values):
+        if processor is None:
+            return list(values)
+        else:
+            return list(map(processor, values))
+
     DATETIME_RE = re.compile(
         "(\d+)-(\d+)-(\d+) (\d+):(\d+):(\d+)(?:\.(\d+))?")
     TIME_RE = re.compile("(\d+):(\d+):(\d+)(?:\.(\d+))?")
@@ -129,7 +135,7 @@ try:
         DecimalResultProcessor, \
         to_float, to_str, int_to_boolean, \
         str_to_datetime, str_to_time, \
-        str_to_date
+        str_to_date, process_column
 
     def to_unicode_processor_factory(encoding, errors=None):
         if errors is not None:
@@ -23,6 +23,7 @@ To generate user-defined SQL strings, see
 
 """
 
+import copy
 import re
 from . import schema, sqltypes, operators, functions, visitors, \
     elements, selectable, crud
@@ -305,6 +306,21 @@ class SQLCompiler(Compiled):
     either implicitly or explicitly
     """
 
+    _nested_join_clones = util.immutabledict()
+    """mapping of elements to the copies of them which were
+    compiled in their place, when the statement was rewritten for
+    a backend that doesn't support right-nested joins.
+    """
+
+    insert_single_values_expr = None
+    """when an INSERT is compiled with a single set of parameters inside
+    a VALUES expression, the string is assigned here, where it can be
+    used for insert batching schemes to rewrite the VALUES expression.
+
+    .. versionadded:: 1.0.0
+
+    """
+
     returning_precedes_values = False
     """set to True classwide to generate RETURNING
     clauses before the VALUES or WHERE clause (i.e. MSSQL)
@@ -418,6 +434,101 @@ class SQLCompiler(Compiled):
             if value is not None
         )
 
+    @util.memoized_property
+    def _positional_keys(self):
+        """The keys of bound parameters requiring a value, in the order
+        rendered, to which the values of a positional parameter set
+        passed to :meth:`.Connection.execute` correspond.
+
+        ``None`` if the statement is not an INSERT or UPDATE.
+
+        """
+        if not self.isinsert and not self.isupdate:
+            return None
+        elif self.positional:
+            names = self.positiontup
+        else:
+            names = self._bind_order
+        binds = dict(
+            (name, bindparam) for bindparam, name in self.bind_names.items())
+        keys = []
+        for name in names:
+            bindparam = binds[name]
+            if bindparam.required and bindparam.key not in keys:
+                keys.append(bindparam.key)
+        return keys
+
+    @property
+    def _bind_order(self):
+        """The names of bound parameters in the order rendered, as
+        ``positiontup`` provides for a positional paramstyle.
+
+        Rather than being tracked during compilation, so as to save on
+        callcounts for the common case where it isn't needed, the order
+        is taken from the ``positiontup`` of a second compilation of the
+        statement against a positional paramstyle; bound parameter names
+        don't depend on the paramstyle.
+
+        """
+        dialect = copy.copy(self.dialect)
+        dialect.positional = True
+        dialect.paramstyle = 'qmark'
+        compiled = self.__class__(
+            dialect, self.statement,
+            column_keys=self.column_keys, inline=self.inline)
+        return compiled.positiontup
+
+    @util.memoized_property
+    def _positional_plan(self):
+        """Describe how positional parameter sets are converted directly
+        into DBAPI parameters, without building a dictionary of
+        :meth:`.construct_params` for each.
+
+        Returns a tuple ``(indexes, processors, defaults, names)``, with
+        one entry per DBAPI parameter, suitable for passing to
+        ``_process_tuples()``, or ``None`` if the statement includes a
+        parameter whose value is established at execution time.
+
+        """
+        keys = self._positional_keys
+        if keys is None:
+            return None
+        positions = dict((key, idx) for idx, key in enumerate(keys))
+        bind_processors = self._bind_processors
+
+        if self.positional:
+            binds = dict(
+                (name, bindparam)
+                for bindparam, name in self.bind_names.items())
+            slots = [(name, binds[name]) for name in self.positiontup]
+            names = None
+        else:
+            slots = [(name, bindparam)
+                     for bindparam, name in self.bind_names.items()]
+            if self.dialect.supports_unicode_statements:
+                names = tuple(name for name, bindparam in slots)
+            else:
+                names = tuple(
+                    self.dialect._encoder(name)[0]
+                    for name, bindparam in slots)
+
+        indexes, processors, defaults = [], [], []
+        for name, bindparam in slots:
+            processor = bind_processors.get(name)
+            if bindparam.required:
+                indexes.append(positions[bindparam.key])
+                processors.append(processor)
+                defaults.append(None)
+            elif bindparam.callable:
+                return None
+            else:
+                indexes.append(-1)
+                processors.append(None)
+                defaults.append(
+                    processor(bindparam.value) if processor is not None
+                    else bindparam.value)
+        return tuple(indexes), tuple(processors), tuple(defaults), names
+
     def is_subquery(self):
         return len(self.stack) > 1
 
@@ -425,6 +536,108 @@ class SQLCompiler(Compiled):
     def sql_compiler(self):
         return self
 
+    def _element_replacements(self, orig_elements, new_elements):
+        replace = {}
+        idents = {}
+        for orig, new in zip(orig_elements, new_elements):
+            if isinstance(orig, util.string_types):
+                idents[orig] = new
+            else:
+                replace[id(orig)] = new
+        for orig, clone in self._nested_join_clones.items():
+            if id(orig) in replace:
+                replace[id(clone)] = replace[id(orig)]
+        return replace, idents
+
+    def _can_copy_for_statement(self, statement_elements):
+        """Return True if this :class:`.SQLCompiler` may be copied onto
+        other statements using :meth:`._copy_for_statement`.
+
+        ``statement_elements`` is the element list generated alongside the
+        structural cache key of the statement that was compiled.  Each
+        bound parameter present in the statement must correspond to a
+        parameter that was rendered, otherwise its value was either
+        rendered inline or delivered by some other object.
+
+        """
+        originals = dict(
+            (id(clone), orig)
+            for orig, clone in self._nested_join_clones.items()
+        )
+        rendered = set(
+            id(originals.get(id(bindparam), bindparam))
+            for bindparam in self.bind_names
+        )
+        for elem in statement_elements:
+            if isinstance(elem, elements.BindParameter) and \
+                    not isinstance(elem, selectable._OffsetLimitParam) and \
+                    id(elem) not in rendered:
+                return False
+        return True
+
+    def _copy_for_statement(self, statement, orig_elements, new_elements):
+        """Return a copy of this :class:`.SQLCompiler` established against
+        the given statement.
+
+        The statement is one which has the same structural cache key
+        as the one this compiler was compiled against; ``orig_elements``
+        and ``new_elements`` are the element lists generated alongside each
+        cache key, which correspond to each other positionally.  Bound
+        parameters and result columns are replaced with their counterparts
+        in the new statement, so that the copy delivers the new
+        statement's parameter values and result column targeting.
+
+        """
+        replace, idents = self._element_replacements(
+            orig_elements, new_elements)
+
+        def repl_ident(m):
+            return "%%(%s " % idents.get(m.group(1), m.group(1))
+
+        def repl(obj):
+            if isinstance(obj, elements._anonymous_label):
+                return elements._anonymous_label(
+                    visitors._anon_ident.sub(repl_ident, obj))
+            return replace.get(id(obj), obj)
+
+        compiled = self.__class__.__new__(self.__class__)
+        compiled.__dict__.update(self.__dict__)
+        compiled.statement = statement
+        compiled.binds = dict(
+            (key, repl(bindparam))
+            for key, bindparam in self.binds.items()
+        )
+        compiled.bind_names = util.column_dict(
+            (repl(bindparam), name)
+            for bindparam, name in self.bind_names.items()
+        )
+        compiled.result_map = result_map = dict(
+            (key, (repl(name), tuple(repl(obj) for obj in objects), type_))
+            for key, (name, objects, type_) in self.result_map.items()
+        )
+        if self._result_map_matches(result_map):
+            # result columns are targeted by the same objects, so
+            # result metadata built for either compiled applies to both.
+            if self._cached_metadata is None:
+                self._cached_metadata = {}
+            compiled._cached_metadata = self._cached_metadata
+        else:
+            compiled.__dict__.pop('_cached_metadata', None)
+        if self.returning:
+            compiled.returning = [repl(col) for col in self.returning]
+        return compiled
+
+    def _result_map_matches(self, result_map):
+        for key, (name, objects, type_) in self.result_map.items():
+            other_name, other_objects, other_type = result_map[key]
+            if name != other_name or type_ is not other_type or \
+                    len(objects) != len(other_objects):
+                return False
+            for obj, other_obj in zip(objects, other_objects):
+                if obj is not other_obj:
+                    return False
+        return True
+
     def construct_params(self, params=None, _group_number=None, _check=True):
         """return a dictionary of bind parameter keys and values"""
 
@@ -1432,6 +1645,7 @@ class SQLCompiler(Compiled):
 
             return newelem
 
+        self._nested_join_clones = cloned
         return visit(select)
 
     def _transform_result_map_for_nested_joins(
@@ -1758,7 +1972,11 @@ class SQLCompiler(Compiled):
              "selectable": insert_stmt})
 
         self.isinsert = True
+        if self.positional:
+            positional_count = len(self.positiontup)
         crud_params = crud._get_crud_params(self, insert_stmt, **kw)
+        if self.positional:
+            positional_count = len(self.positiontup) - positional_count
 
         if not crud_params and \
                 not self.dialect.supports_default_values and \
@@ -1834,12 +2052,20 @@ class SQLCompiler(Compiled):
                 )
             )
         else:
-            text += " VALUES (%s)" % \
-                ', '.join([c[1] for c in crud_params])
+            insert_single_values_expr = ', '.join([c[1] for c in crud_params])
+            text += " VALUES (%s)" % insert_single_values_expr
 
         if self.returning and not self.returning_precedes_values:
             text += " " + returning_clause
 
+        if insert_stmt.select is None and crud_params and \
+                not insert_stmt._has_multi_parameters and \
+                (not self.positional or
+                 positional_count == len(self.positiontup)):
+            # a positional statement can only be batched if every
+            # bound parameter is rendered within the VALUES clause
+            self.insert_single_values_expr = insert_single_values_expr
+
         self.stack.pop(-1)
 
         return text
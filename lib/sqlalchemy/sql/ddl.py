@@ -19,6 +19,10 @@ from .. import exc
 
 
 class _DDLCompiles(ClauseElement):
+    # DDL renders from the current state of schema objects, which isn't
+    # reflected in a structural cache key
+    _cache_key_traversal = None
+
     def _compiler(self, dialect, **kw):
         """Return a compiler appropriate for this ClauseElement, given a
         Dialect."""
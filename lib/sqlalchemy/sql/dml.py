@@ -12,6 +12,9 @@ Provide :class:`.Insert`, :class:`.Update` and :class:`.Delete`.
 from .base import Executable, _generative, _from_objects, DialectKWArgs
 from .elements import ClauseElement, _literal_as_text, Null, and_, _clone
 from .selectable import _interpret_as_from, _interpret_as_select, HasPrefixes
+from .visitors import CK_ELEMENT, CK_ELEMENT_TUPLES, CK_PLAIN, \
+    CK_PLAIN_DICT, CK_MIXED_LIST, CK_FLAG_OR_ELEMENT_LIST, CK_HINTS, \
+    CK_DML_VALUES
 from .. import util
 from .. import exc
 
@@ -401,6 +404,21 @@ class ValuesBase(UpdateBase):
         """
         self._return_defaults = cols or True
 
+    def _positional_column_keys(self, size):
+        """Return the column keys of the VALUES or SET clause when this
+        statement is executed with positional parameter sets of the given
+        size.
+
+        Without a :meth:`.ValuesBase.values` clause, the values of each
+        parameter set apply to the leading columns of the table in order,
+        as for a tuple passed to :meth:`.ValuesBase.values`; otherwise they
+        apply to the bound parameters present within the statement.
+
+        """
+        if self.parameters is not None or self.select is not None:
+            return []
+        return [c.key for c in self.table.c][:size]
+
 
 class Insert(ValuesBase):
     """Represent an INSERT construct.
@@ -417,6 +435,21 @@ class Insert(ValuesBase):
 
     _supports_multi_parameters = True
 
+    _cache_key_traversal = (
+        ('table', CK_ELEMENT),
+        ('parameters', CK_DML_VALUES),
+        ('_has_multi_parameters', CK_PLAIN),
+        ('select', CK_ELEMENT),
+        ('select_names', CK_MIXED_LIST),
+        ('include_insert_from_select_defaults', CK_PLAIN),
+        ('inline', CK_PLAIN),
+        ('_returning', CK_MIXED_LIST),
+        ('_return_defaults', CK_FLAG_OR_ELEMENT_LIST),
+        ('_prefixes', CK_ELEMENT_TUPLES),
+        ('_hints', CK_HINTS),
+        ('dialect_kwargs', CK_PLAIN_DICT),
+    )
+
     def __init__(self,
                  table,
                  values=None,
@@ -561,6 +594,18 @@ class Update(ValuesBase):
     """
     __visit_name__ = 'update'
 
+    _cache_key_traversal = (
+        ('table', CK_ELEMENT),
+        ('parameters', CK_DML_VALUES),
+        ('_whereclause', CK_ELEMENT),
+        ('inline', CK_PLAIN),
+        ('_returning', CK_MIXED_LIST),
+        ('_return_defaults', CK_FLAG_OR_ELEMENT_LIST),
+        ('_prefixes', CK_ELEMENT_TUPLES),
+        ('_hints', CK_HINTS),
+        ('dialect_kwargs', CK_PLAIN_DICT),
+    )
+
     def __init__(self,
                  table,
                  whereclause=None,
@@ -733,6 +778,15 @@ class Delete(UpdateBase):
 
     __visit_name__ = 'delete'
 
+    _cache_key_traversal = (
+        ('table', CK_ELEMENT),
+        ('_whereclause', CK_ELEMENT),
+        ('_returning', CK_MIXED_LIST),
+        ('_prefixes', CK_ELEMENT_TUPLES),
+        ('_hints', CK_HINTS),
+        ('dialect_kwargs', CK_PLAIN_DICT),
+    )
+
     def __init__(self,
                  table,
                  whereclause=None,
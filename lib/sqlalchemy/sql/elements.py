@@ -15,7 +15,10 @@ from __future__ import unicode_literals
 from .. import util, exc, inspection
 from . import type_api
 from . import operators
-from .visitors import Visitable, cloned_traverse, traverse
+from .visitors import Visitable, cloned_traverse, traverse, \
+    generate_cache_key, _gen_cache_key, CK_ELEMENT, CK_ELEMENT_LIST, \
+    CK_ELEMENT_DICT, CK_ELEMENT_TUPLES, CK_PLAIN, CK_NAME, CK_TYPE, \
+    CK_OPERATOR, CK_PLAIN_DICT
 from .annotation import Annotated
 import itertools
 from .base import Executable, PARSE_AUTOCOMMIT, Immutable, NO_ARG
@@ -232,6 +235,11 @@ class ClauseElement(Visitable):
     _order_by_label_element = None
     _is_from_container = False
 
+    _cache_key_traversal = None
+    """Describes the attributes which make up the structural cache key
+    of this element; ``None`` indicates that the element doesn't support
+    structural caching."""
+
     def _clone(self):
         """Create a shallow copy of this ClauseElement.
 
@@ -375,6 +383,17 @@ class ClauseElement(Visitable):
         """
         return self is other
 
+    def _gen_cache_key(self, anon_map, elements):
+        return _gen_cache_key(self, anon_map, elements)
+
+    def _generate_cache_key(self):
+        """Return a structural cache key for this element, or ``None``.
+
+        See :func:`.visitors.generate_cache_key`.
+
+        """
+        return generate_cache_key(self)
+
     def _copy_internals(self, clone=_clone, **kw):
         """Reassign internal elements to be clones of themselves.
 
@@ -893,6 +912,12 @@ class BindParameter(ColumnElement):
 
     _is_crud = False
 
+    _cache_key_traversal = (
+        ('key', CK_NAME),
+        ('type', CK_TYPE),
+        ('isoutparam', CK_PLAIN),
+    )
+
     def __init__(self, key, value=NO_ARG, type_=None,
                  unique=False, required=NO_ARG,
                  quote=None, callable_=None,
@@ -1209,6 +1234,10 @@ class TypeClause(ClauseElement):
 
     __visit_name__ = 'typeclause'
 
+    _cache_key_traversal = (
+        ('type', CK_TYPE),
+    )
+
     def __init__(self, type):
         self.type = type
 
@@ -1235,6 +1264,11 @@ class TextClause(Executable, ClauseElement):
 
     __visit_name__ = 'textclause'
 
+    _cache_key_traversal = (
+        ('text', CK_PLAIN),
+        ('_bindparams', CK_ELEMENT_DICT),
+    )
+
     _bind_params_regex = re.compile(r'(?<![:\w\x5c]):(\w+)(?!:)', re.UNICODE)
     _execution_options = \
         Executable._execution_options.union(
@@ -1615,6 +1649,8 @@ class Null(ColumnElement):
 
     __visit_name__ = 'null'
 
+    _cache_key_traversal = ()
+
     @util.memoized_property
     def type(self):
         return type_api.NULLTYPE
@@ -1639,6 +1675,8 @@ class False_(ColumnElement):
 
     __visit_name__ = 'false'
 
+    _cache_key_traversal = ()
+
     @util.memoized_property
     def type(self):
         return type_api.BOOLEANTYPE
@@ -1698,6 +1736,8 @@ class True_(ColumnElement):
 
     __visit_name__ = 'true'
 
+    _cache_key_traversal = ()
+
     @util.memoized_property
     def type(self):
         return type_api.BOOLEANTYPE
@@ -1762,6 +1802,13 @@ class ClauseList(ClauseElement):
     """
     __visit_name__ = 'clauselist'
 
+    _cache_key_traversal = (
+        ('clauses', CK_ELEMENT_LIST),
+        ('operator', CK_OPERATOR),
+        ('group', CK_PLAIN),
+        ('group_contents', CK_PLAIN),
+    )
+
     def __init__(self, *clauses, **kwargs):
         self.operator = kwargs.pop('operator', operators.comma_op)
         self.group = kwargs.pop('group', True)
@@ -2030,6 +2077,13 @@ class Case(ColumnElement):
 
     __visit_name__ = 'case'
 
+    _cache_key_traversal = (
+        ('value', CK_ELEMENT),
+        ('whens', CK_ELEMENT_TUPLES),
+        ('else_', CK_ELEMENT),
+        ('type', CK_TYPE),
+    )
+
     def __init__(self, whens, value=None, else_=None):
         """Produce a ``CASE`` expression.
 
@@ -2262,6 +2316,11 @@ class Cast(ColumnElement):
 
     __visit_name__ = 'cast'
 
+    _cache_key_traversal = (
+        ('clause', CK_ELEMENT),
+        ('type', CK_TYPE),
+    )
+
     def __init__(self, expression, type_):
         """Produce a ``CAST`` expression.
 
@@ -2332,6 +2391,11 @@ class Extract(ColumnElement):
 
     __visit_name__ = 'extract'
 
+    _cache_key_traversal = (
+        ('field', CK_PLAIN),
+        ('expr', CK_ELEMENT),
+    )
+
     def __init__(self, field, expr, **kwargs):
         """Return a :class:`.Extract` construct.
 
@@ -2369,6 +2433,10 @@ class _label_reference(ColumnElement):
     """
     __visit_name__ = 'label_reference'
 
+    _cache_key_traversal = (
+        ('element', CK_ELEMENT),
+    )
+
     def __init__(self, element):
         self.element = element
 
@@ -2383,6 +2451,10 @@ class _label_reference(ColumnElement):
 class _textual_label_reference(ColumnElement):
     __visit_name__ = 'textual_label_reference'
 
+    _cache_key_traversal = (
+        ('element', CK_PLAIN),
+    )
+
     def __init__(self, element):
         self.element = element
 
@@ -2406,6 +2478,13 @@ class UnaryExpression(ColumnElement):
     """
     __visit_name__ = 'unary'
 
+    _cache_key_traversal = (
+        ('element', CK_ELEMENT),
+        ('operator', CK_OPERATOR),
+        ('modifier', CK_OPERATOR),
+        ('type', CK_TYPE),
+    )
+
     def __init__(self, element, operator=None, modifier=None,
                  type_=None, negate=None):
         self.operator = operator
@@ -2691,6 +2770,14 @@ class BinaryExpression(ColumnElement):
 
     __visit_name__ = 'binary'
 
+    _cache_key_traversal = (
+        ('left', CK_ELEMENT),
+        ('right', CK_ELEMENT),
+        ('operator', CK_OPERATOR),
+        ('modifiers', CK_PLAIN_DICT),
+        ('type', CK_TYPE),
+    )
+
     def __init__(self, left, right, operator, type_=None,
                  negate=None, modifiers=None):
         # allow compatibility with libraries that
@@ -2774,6 +2861,11 @@ class Grouping(ColumnElement):
 
     __visit_name__ = 'grouping'
 
+    _cache_key_traversal = (
+        ('element', CK_ELEMENT),
+        ('type', CK_TYPE),
+    )
+
     def __init__(self, element):
         self.element = element
         self.type = getattr(element, 'type', type_api.NULLTYPE)
@@ -2829,6 +2921,12 @@ class Over(ColumnElement):
     order_by = None
     partition_by = None
 
+    _cache_key_traversal = (
+        ('func', CK_ELEMENT),
+        ('partition_by', CK_ELEMENT),
+        ('order_by', CK_ELEMENT),
+    )
+
     def __init__(self, func, partition_by=None, order_by=None):
         """Produce an :class:`.Over` object against a function.
 
@@ -2900,6 +2998,11 @@ class WithinGroup(ColumnElement):
     """
     __visit_name__ = 'within_group'
 
+    _cache_key_traversal = (
+        ('func', CK_ELEMENT),
+        ('order_by', CK_ELEMENT),
+    )
+
     order_by = None
 
     def __init__(self, func, order_by):
@@ -2977,6 +3080,11 @@ class FunctionFilter(ColumnElement):
 
     criterion = None
 
+    _cache_key_traversal = (
+        ('func', CK_ELEMENT),
+        ('criterion', CK_ELEMENT),
+    )
+
     def __init__(self, func, *criterion):
         """Produce a :class:`.FunctionFilter` object against a function.
 
@@ -3078,6 +3186,13 @@ class Label(ColumnElement):
 
     __visit_name__ = 'label'
 
+    _cache_key_traversal = (
+        ('name', CK_NAME),
+        ('_resolve_label', CK_NAME),
+        ('element', CK_ELEMENT),
+        ('type', CK_TYPE),
+    )
+
     def __init__(self, name, element, type_=None):
         """Return a :class:`Label` object for the
         given :class:`.ColumnElement`.
@@ -3213,6 +3328,14 @@ class ColumnClause(Immutable, ColumnElement):
 
     onupdate = default = server_default = server_onupdate = None
 
+    _cache_key_traversal = (
+        ('name', CK_NAME),
+        ('key', CK_NAME),
+        ('table', CK_ELEMENT),
+        ('is_literal', CK_PLAIN),
+        ('type', CK_TYPE),
+    )
+
     _memoized_property = util.group_expirable_memoized_property()
 
     def __init__(self, text, type_=None, is_literal=False, _selectable=None):
@@ -3430,6 +3553,10 @@ class ColumnClause(Immutable, ColumnElement):
 class _IdentifiedClause(Executable, ClauseElement):
 
     __visit_name__ = 'identified'
+
+    _cache_key_traversal = (
+        ('ident', CK_PLAIN),
+    )
     _execution_options = \
         Executable._execution_options.union({'autocommit': False})
 
@@ -3636,6 +3763,8 @@ class _anonymous_label(_truncated_label):
 
     __slots__ = ()
 
+    _is_anonymous = True
+
     def __add__(self, other):
         return _anonymous_label(
             quoted_name(
@@ -16,7 +16,8 @@ from .elements import ClauseList, Cast, Extract, _literal_as_binds, \
 from .selectable import FromClause, Select, Alias
 
 from . import operators
-from .visitors import VisitableType
+from .visitors import VisitableType, CK_ELEMENT, CK_MIXED_LIST, CK_PLAIN, \
+    CK_TYPE
 from .. import util
 from . import annotation
 
@@ -394,6 +395,13 @@ class Function(FunctionElement):
 
     __visit_name__ = 'function'
 
+    _cache_key_traversal = (
+        ('name', CK_PLAIN),
+        ('packagenames', CK_MIXED_LIST),
+        ('clause_expr', CK_ELEMENT),
+        ('type', CK_TYPE),
+    )
+
     def __init__(self, name, *clauses, **kw):
         """Construct a :class:`.Function`.
 
@@ -530,6 +538,12 @@ class next_value(GenericFunction):
     type = sqltypes.Integer()
     name = "next_value"
 
+    # the Sequence is keyed on identity
+    _cache_key_traversal = (
+        ('sequence', CK_PLAIN),
+        ('type', CK_TYPE),
+    )
+
     def __init__(self, seq, **kw):
         assert isinstance(seq, schema.Sequence), \
             "next_value() accepts a Sequence object as input."
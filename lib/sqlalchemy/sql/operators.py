@@ -226,6 +226,11 @@ class custom_op(object):
     def __hash__(self):
         return id(self)
 
+    @property
+    def _static_cache_key(self):
+        return (custom_op, self.opstring,
+                self.precedence, self.is_comparison)
+
     def __call__(self, left, right, **kw):
         return left.operate(self, right, **kw)
 
@@ -1186,6 +1186,17 @@ class Column(SchemaItem, ColumnClause):
 #    def quote(self):
 #        return getattr(self.name, "quote", None)
 
+    @property
+    def _cache_key_traversal(self):
+        # a Column attached to a Table is keyed on identity, in the
+        # same way as the Table itself.
+        table = self.table
+        if table is not None and \
+                table._cache_key_traversal is visitors.CK_IDENTITY:
+            return visitors.CK_IDENTITY
+        else:
+            return ColumnClause._cache_key_traversal
+
     def __str__(self):
         if self.name is None:
             return "(no name)"
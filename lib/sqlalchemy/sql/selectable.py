@@ -29,7 +29,9 @@ import operator
 import collections
 from .annotation import Annotated
 import itertools
-from sqlalchemy.sql.visitors import Visitable
+from sqlalchemy.sql.visitors import Visitable, CK_ELEMENT, CK_ELEMENT_LIST, \
+    CK_ELEMENT_TUPLES, CK_PLAIN, CK_NAME, CK_IDENTITY, \
+    CK_FLAG_OR_ELEMENT_LIST, CK_UNORDERED_ELEMENTS, CK_HINTS
 
 
 def _interpret_as_from(element):
@@ -58,6 +60,12 @@ def _interpret_as_select(element):
 
 
 class _OffsetLimitParam(BindParameter):
+    # the value is part of the key, as dialects which can't bind
+    # LIMIT / OFFSET render it inline
+    _cache_key_traversal = BindParameter._cache_key_traversal + (
+        ('value', CK_PLAIN),
+    )
+
     @property
     def _limit_offset_value(self):
         return self.effective_value
@@ -647,6 +655,13 @@ class Join(FromClause):
 
     _is_join = True
 
+    _cache_key_traversal = (
+        ('left', CK_ELEMENT),
+        ('right', CK_ELEMENT),
+        ('onclause', CK_ELEMENT),
+        ('isouter', CK_PLAIN),
+    )
+
     def __init__(self, left, right, onclause=None, isouter=False):
         """Construct a new :class:`.Join`.
 
@@ -1084,6 +1099,11 @@ class Alias(FromClause):
 
     _is_from_container = True
 
+    _cache_key_traversal = (
+        ('name', CK_NAME),
+        ('element', CK_ELEMENT),
+    )
+
     def __init__(self, selectable, name=None):
         baseselectable = selectable
         while isinstance(baseselectable, Alias):
@@ -1173,6 +1193,15 @@ class CTE(Generative, HasSuffixes, Alias):
     """
     __visit_name__ = 'cte'
 
+    _cache_key_traversal = (
+        ('name', CK_NAME),
+        ('element', CK_ELEMENT),
+        ('recursive', CK_PLAIN),
+        ('_cte_alias', CK_ELEMENT),
+        ('_restates', CK_UNORDERED_ELEMENTS),
+        ('_suffixes', CK_ELEMENT_TUPLES),
+    )
+
     def __init__(self, selectable,
                  name=None,
                  recursive=False,
@@ -1218,6 +1247,10 @@ class FromGrouping(FromClause):
     """Represent a grouping of a FROM clause"""
     __visit_name__ = 'grouping'
 
+    _cache_key_traversal = (
+        ('element', CK_ELEMENT),
+    )
+
     def __init__(self, element):
         self.element = element
 
@@ -1299,6 +1332,8 @@ class TableClause(Immutable, FromClause):
 
     named_with_column = True
 
+    _cache_key_traversal = CK_IDENTITY
+
     implicit_returning = False
     """:class:`.TableClause` doesn't support having a primary key or column
     -level defaults, so implicit returning doesn't apply."""
@@ -1421,6 +1456,12 @@ class TableClause(Immutable, FromClause):
 
 class ForUpdateArg(ClauseElement):
 
+    _cache_key_traversal = (
+        ('nowait', CK_PLAIN),
+        ('read', CK_PLAIN),
+        ('of', CK_ELEMENT_LIST),
+    )
+
     @classmethod
     def parse_legacy_select(self, arg):
         """Parse the for_update arugment of :func:`.select`.
@@ -1974,6 +2015,17 @@ class CompoundSelect(GenerativeSelect):
 
     _is_from_container = True
 
+    _cache_key_traversal = (
+        ('keyword', CK_PLAIN),
+        ('selects', CK_ELEMENT_LIST),
+        ('_order_by_clause', CK_ELEMENT),
+        ('_group_by_clause', CK_ELEMENT),
+        ('_limit_clause', CK_ELEMENT),
+        ('_offset_clause', CK_ELEMENT),
+        ('_for_update_arg', CK_ELEMENT),
+        ('use_labels', CK_PLAIN),
+    )
+
     def __init__(self, keyword, *selects, **kwargs):
         self._auto_correlate = kwargs.pop('correlate', False)
         self.keyword = keyword
@@ -2215,6 +2267,27 @@ class Select(HasPrefixes, HasSuffixes, GenerativeSelect):
     _memoized_property = SelectBase._memoized_property
     _is_select = True
 
+    _cache_key_traversal = (
+        ('_raw_columns', CK_ELEMENT_LIST),
+        ('_from_obj', CK_ELEMENT_LIST),
+        ('_whereclause', CK_ELEMENT),
+        ('_having', CK_ELEMENT),
+        ('_order_by_clause', CK_ELEMENT),
+        ('_group_by_clause', CK_ELEMENT),
+        ('_distinct', CK_FLAG_OR_ELEMENT_LIST),
+        ('_auto_correlate', CK_PLAIN),
+        ('_correlate', CK_UNORDERED_ELEMENTS),
+        ('_correlate_except', CK_UNORDERED_ELEMENTS),
+        ('_hints', CK_HINTS),
+        ('_statement_hints', CK_PLAIN),
+        ('_prefixes', CK_ELEMENT_TUPLES),
+        ('_suffixes', CK_ELEMENT_TUPLES),
+        ('_limit_clause', CK_ELEMENT),
+        ('_offset_clause', CK_ELEMENT),
+        ('_for_update_arg', CK_ELEMENT),
+        ('use_labels', CK_PLAIN),
+    )
+
     def __init__(self,
                  columns=None,
                  whereclause=None,
@@ -3401,6 +3474,11 @@ class TextAsFrom(SelectBase):
 
     _textual = True
 
+    _cache_key_traversal = (
+        ('element', CK_ELEMENT),
+        ('column_args', CK_ELEMENT_LIST),
+    )
+
     def __init__(self, text, columns):
         self.element = text
         self.column_args = columns
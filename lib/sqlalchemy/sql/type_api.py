@@ -323,6 +323,20 @@ class TypeEngine(Visitable):
         else:
             return self.__class__
 
+    @util.memoized_property
+    def _static_cache_key(self):
+        """Return a hashable value representing the class and
+        configuration of this type, for use within the structural
+        cache key of a SQL expression.
+
+        """
+        cls = self.__class__
+        return (cls, ) + tuple(
+            (key, _cache_key_value(value))
+            for key, value in sorted(self.__dict__.items())
+            if not isinstance(getattr(cls, key, None), util.memoized_property)
+        )
+
     def dialect_impl(self, dialect):
         """Return a dialect-specific implementation for this
         :class:`.TypeEngine`.
@@ -1089,6 +1103,25 @@ def _reconstitute_comparator(expression):
     return expression.comparator
 
 
+def _cache_key_value(value):
+    if isinstance(value, TypeEngine):
+        return value._static_cache_key
+    elif isinstance(value, (list, tuple)):
+        return tuple(_cache_key_value(elem) for elem in value)
+    elif isinstance(value, dict):
+        return frozenset(
+            (k, _cache_key_value(v)) for k, v in value.items())
+    try:
+        hash(value)
+    except TypeError:
+        # the value is still referenced by the type, which in turn is
+        # referenced by whatever statement is being keyed, so its
+        # identity is stable for as long as the key is in use
+        return ('_id', id(value))
+    else:
+        return value
+
+
 def to_instance(typeobj, *arg, **kw):
     if typeobj is None:
         return NULLTYPE
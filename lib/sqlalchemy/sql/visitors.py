@@ -27,6 +27,7 @@ http://techspot.zzzeek.org/2008/01/23/expression-transformations/
 from collections import deque
 from .. import util
 import operator
+import re
 from .. import exc
 
 __all__ = ['VisitableType', 'Visitable', 'ClauseVisitor',
@@ -314,3 +315,252 @@ def replacement_traverse(obj, opts, replace):
     if obj is not None:
         obj = clone(obj, **opts)
     return obj
+
+
+# symbols used within the ``_cache_key_traversal`` collection of
+# a Visitable, indicating how the value of a given attribute is to
+# be incorporated into a structural cache key.
+
+CK_ELEMENT = util.symbol('CK_ELEMENT')
+"""a single Visitable, or None"""
+
+CK_ELEMENT_LIST = util.symbol('CK_ELEMENT_LIST')
+"""a sequence of Visitable objects"""
+
+CK_ELEMENT_TUPLES = util.symbol('CK_ELEMENT_TUPLES')
+"""a sequence of tuples of Visitable objects"""
+
+CK_ELEMENT_DICT = util.symbol('CK_ELEMENT_DICT')
+"""a dictionary of string keys to Visitable objects"""
+
+CK_PLAIN = util.symbol('CK_PLAIN')
+"""a hashable value which is part of the key as is"""
+
+CK_NAME = util.symbol('CK_NAME')
+"""a string name which may be an anonymous label"""
+
+CK_TYPE = util.symbol('CK_TYPE')
+"""a TypeEngine object"""
+
+CK_OPERATOR = util.symbol('CK_OPERATOR')
+"""an operator function or custom_op object"""
+
+CK_PLAIN_DICT = util.symbol('CK_PLAIN_DICT')
+"""a dictionary of hashable keys and values"""
+
+CK_MIXED_LIST = util.symbol('CK_MIXED_LIST')
+"""a sequence of Visitable objects and/or hashable plain values"""
+
+CK_FLAG_OR_ELEMENT_LIST = util.symbol('CK_FLAG_OR_ELEMENT_LIST')
+"""either a boolean flag or a sequence of Visitable objects"""
+
+CK_UNORDERED_ELEMENTS = util.symbol('CK_UNORDERED_ELEMENTS')
+"""a set of Visitable objects where ordering is not significant"""
+
+CK_HINTS = util.symbol('CK_HINTS')
+"""a dictionary of (Visitable, dialect name) tuples to hint strings"""
+
+CK_DML_VALUES = util.symbol('CK_DML_VALUES')
+"""the parameters of an INSERT or UPDATE; a dictionary, or list of
+dictionaries, of string or Column keys to literal values or Visitable
+objects"""
+
+CK_IDENTITY = util.symbol('CK_IDENTITY')
+"""used in place of a traversal collection, indicates that the object is
+keyed on its identity; used for long-lived objects such as Table and
+Column."""
+
+_anon_ident = re.compile(r'%\((\d+) ')
+
+
+class NoCacheKey(exc.InvalidRequestError):
+    """Raised internally when a structural cache key can't be generated
+    for an element."""
+
+
+def _gen_cache_key(obj, anon_map, elements):
+    """Generate a structural cache key for a single Visitable.
+
+    The key is a tuple consisting of the object's class, followed by
+    the keys of each attribute named in the class'
+    ``_cache_key_traversal`` collection.  Bound parameter values are
+    never part of the key.   Objects which have already been keyed within
+    the same traversal are represented by a back-reference to their
+    position in ``elements``, so that the key also reflects how objects
+    are shared within the structure.
+
+    """
+    id_ = id(obj)
+    if id_ in anon_map:
+        return ('_ref', anon_map[id_])
+    anon_map[id_] = len(elements)
+    elements.append(obj)
+
+    traversal = obj._cache_key_traversal
+    if traversal is None:
+        raise NoCacheKey(
+            "Element %r does not support structural caching" %
+            obj.__class__)
+    elif traversal is CK_IDENTITY:
+        return (obj.__class__, hash(obj))
+
+    result = [obj.__class__]
+    for attrname, sym in traversal:
+        value = getattr(obj, attrname, None)
+        if value is None:
+            result.append(None)
+        elif sym is CK_ELEMENT:
+            result.append(value._gen_cache_key(anon_map, elements))
+        elif sym is CK_ELEMENT_LIST:
+            result.append(tuple(
+                elem._gen_cache_key(anon_map, elements)
+                for elem in value))
+        elif sym is CK_PLAIN:
+            result.append(value)
+        elif sym is CK_NAME:
+            result.append(_name_cache_key(value, anon_map, elements))
+        elif sym is CK_TYPE:
+            result.append(value._static_cache_key)
+        elif sym is CK_OPERATOR:
+            result.append(getattr(value, '_static_cache_key', value))
+        elif sym is CK_ELEMENT_TUPLES:
+            result.append(tuple(
+                tuple(
+                    _mixed_cache_key(elem, anon_map, elements)
+                    for elem in tup
+                )
+                for tup in value))
+        elif sym is CK_ELEMENT_DICT:
+            result.append(tuple(
+                (key, value[key]._gen_cache_key(anon_map, elements))
+                for key in sorted(value)))
+        elif sym is CK_PLAIN_DICT:
+            result.append(tuple(sorted(value.items())))
+        elif sym is CK_MIXED_LIST:
+            result.append(tuple(
+                _mixed_cache_key(elem, anon_map, elements)
+                for elem in value))
+        elif sym is CK_FLAG_OR_ELEMENT_LIST:
+            if value is True or value is False:
+                result.append(value)
+            else:
+                result.append(tuple(
+                    _mixed_cache_key(elem, anon_map, elements)
+                    for elem in value))
+        elif sym is CK_UNORDERED_ELEMENTS:
+            result.append(frozenset(
+                _unordered_cache_key(elem, anon_map)
+                for elem in value))
+        elif sym is CK_HINTS:
+            result.append(frozenset(
+                (_unordered_cache_key(selectable, anon_map),
+                 dialect_name, hint)
+                for (selectable, dialect_name), hint in value.items()))
+        elif sym is CK_DML_VALUES:
+            if isinstance(value, list):
+                result.append(tuple(
+                    _dml_values_cache_key(params, anon_map, elements)
+                    for params in value))
+            else:
+                result.append(
+                    _dml_values_cache_key(value, anon_map, elements))
+        else:
+            raise NoCacheKey("Unknown cache key symbol %r" % sym)
+    return tuple(result)
+
+
+def _mixed_cache_key(value, anon_map, elements):
+    """Produce the cache key portion for a value that may be either
+    a Visitable or a plain literal value."""
+
+    if hasattr(value, '_gen_cache_key'):
+        return value._gen_cache_key(anon_map, elements)
+    elif hasattr(value, '__clause_element__'):
+        return value.__clause_element__()._gen_cache_key(anon_map, elements)
+    else:
+        try:
+            hash(value)
+        except TypeError:
+            raise NoCacheKey("Unhashable value %r" % (value, ))
+        # the type is part of the key so that values which compare
+        # as equal, such as 1 and True, remain distinct
+        return (value.__class__, value)
+
+
+def _unordered_cache_key(value, anon_map):
+    """Produce the cache key portion for a member of an unordered
+    collection.
+
+    Such members can't take part in the positional ``elements`` list;
+    objects already present within the traversal are referred to by
+    position, others are keyed separately.
+
+    """
+    if id(value) in anon_map:
+        return ('_ref', anon_map[id(value)])
+    else:
+        return value._gen_cache_key({}, [])
+
+
+def _dml_values_cache_key(params, anon_map, elements):
+    """Produce the cache key portion for a dictionary of INSERT or UPDATE
+    parameters.
+
+    Literal values are made part of the key, as the compiler generates
+    bound parameters for them which are then carried along with the
+    compiled form.
+
+    """
+    return tuple(
+        (
+            _mixed_cache_key(key, anon_map, elements),
+            _mixed_cache_key(params[key], anon_map, elements)
+        )
+        for key in sorted(params, key=lambda key: getattr(key, 'key', key))
+    )
+
+
+def _name_cache_key(name, anon_map, elements):
+    """Produce the cache key portion for a string name.
+
+    Anonymous labels embed the ``id()`` of the object that generated them;
+    these are replaced with a counter local to the current traversal so that
+    structurally equivalent statements produce the same key.  The
+    identifiers themselves are added to ``elements``, so that names
+    derived from them may be translated between statements.
+
+    """
+    if '%(' in name and getattr(name, '_is_anonymous', False):
+        def repl(m):
+            ident = m.group(1)
+            if ident not in anon_map:
+                anon_map[ident] = len(anon_map)
+                elements.append(ident)
+            return '%%(%d ' % anon_map[ident]
+        return (name.__class__, _anon_ident.sub(repl, name))
+    else:
+        return (name.__class__, name, getattr(name, 'quote', None))
+
+
+def generate_cache_key(obj):
+    """Produce a structural cache key for the given expression structure.
+
+    Returns a tuple ``(key, elements)``, where ``key`` is a hashable value
+    that is equal for any two structures which would compile into the same
+    SQL string, not including the values of bound parameters, and
+    ``elements`` is the list of objects that were traversed, along with
+    the identifier strings embedded within anonymous names, in a
+    deterministic order.  Two structures with equal keys will produce
+    ``elements`` lists which correspond to each other positionally.
+
+    Returns ``None`` if any element within the structure does not
+    support structural caching.
+
+    """
+    elements = []
+    try:
+        key = obj._gen_cache_key({}, elements)
+    except NoCacheKey:
+        return None
+    else:
+        return key, elements
@@ -855,6 +855,14 @@ class LRUCache(dict):
         self._counter += 1
         return self._counter
 
+    def get(self, key, default=None):
+        item = dict.get(self, key, default)
+        if item is not default:
+            item[2] = self._inc_counter()
+            return item[1]
+        else:
+            return default
+
     def __getitem__(self, key):
         item = dict.__getitem__(self, key)
         item[2] = self._inc_counter()
@@ -39,10 +39,12 @@ class Full(Exception):
 
 
 class Queue:
-    def __init__(self, maxsize=0):
+    def __init__(self, maxsize=0, use_lifo=False):
         """Initialize a queue object with a given maximum size.
 
         If `maxsize` is <= 0, the queue size is infinite.
+
+        If `use_lifo` is True, this Queue acts like a Stack (LIFO).
         """
 
         self._init(maxsize)
@@ -57,6 +59,8 @@ class Queue:
         # Notify not_full whenever an item is removed from the queue;
         # a thread waiting to put is notified then.
         self.not_full = threading.Condition(self.mutex)
+        # If this queue uses LIFO or FIFO
+        self.use_lifo = use_lifo
 
     def qsize(self):
         """Return the approximate size of the queue (not reliable!)."""
@@ -161,6 +165,25 @@ class Queue:
         finally:
             self.not_empty.release()
 
+    def get_oldest(self, predicate, limit):
+        """Remove and return up to `limit` items from the end of the
+        queue holding the items that were put least recently, for as
+        long as `predicate` returns True for them.
+
+        Never blocks; returns a possibly empty list.
+        """
+        self.not_empty.acquire()
+        try:
+            items = []
+            while len(items) < limit and self.queue and \
+                    predicate(self.queue[0]):
+                items.append(self.queue.popleft())
+            if items:
+                self.not_full.notify(len(items))
+            return items
+        finally:
+            self.not_empty.release()
+
     def get_nowait(self):
         """Remove and return an item from the queue without blocking.
 
@@ -196,4 +219,9 @@ class Queue:
 
     # Get an item from the queue
     def _get(self):
-        return self.queue.popleft()
+        if self.use_lifo:
+            # LIFO
+            return self.queue.pop()
+        else:
+            # FIFO
+            return self.queue.popleft()
@@ -6,7 +6,10 @@ from sqlalchemy.engine.url import make_url
 from sqlalchemy.testing import fixtures
 from sqlalchemy import testing
 from sqlalchemy.testing import engines
+from sqlalchemy.testing.mock import Mock, call, patch
+from sqlalchemy.engine.result import BufferedRowResultProxy
 import datetime
+import sys
 
 class DialectTest(fixtures.TestBase):
     def test_ssl_arguments_mysqldb(self):
@@ -38,6 +41,57 @@ class DialectTest(fixtures.TestBase):
             }
         )
 
+    def test_server_side_cursors_mysqldb(self):
+        self._test_server_side_cursors('mysqldb', 'MySQLdb')
+
+    def test_server_side_cursors_pymysql(self):
+        self._test_server_side_cursors('pymysql', 'pymysql')
+
+    def _test_server_side_cursors(self, driver, modname):
+        dbapi = Mock(__name__=modname, paramstyle='format')
+        cursor = dbapi.connect.return_value.cursor.return_value
+        cursor.description = [('x', None, None, None, None, None, None)]
+        cursor.fetchmany.return_value = [(1, ), (2, )]
+        cursor.fetchall.return_value = []
+
+        with patch.dict(
+                sys.modules,
+                {modname: dbapi, modname + '.cursors': dbapi.cursors}):
+            eng = create_engine(
+                "mysql+%s://" % driver, module=dbapi, _initialize=False)
+            result = eng.execute(
+                select([literal_column('x')]).
+                execution_options(stream_results=True))
+
+        assert isinstance(result, BufferedRowResultProxy)
+        eq_(result.fetchall(), [(1, ), (2, )])
+        eq_(
+            dbapi.connect.return_value.cursor.mock_calls[0],
+            call(dbapi.cursors.SSCursor)
+        )
+        eng.dispose()
+
+    def test_no_server_side_cursors_cymysql(self):
+        dbapi = Mock(__name__='cymysql', paramstyle='format')
+        cursor = dbapi.connect.return_value.cursor.return_value
+        cursor.description = [('x', None, None, None, None, None, None)]
+        cursor.fetchall.return_value = [(1, ), (2, )]
+
+        eng = create_engine(
+            "mysql+cymysql://", module=dbapi, _initialize=False)
+        result = eng.execute(
+            select([literal_column('x')]).
+            execution_options(stream_results=True))
+
+        assert not isinstance(result, BufferedRowResultProxy)
+        eq_(result.fetchall(), [(1, ), (2, )])
+        eq_(dbapi.connect.return_value.cursor.mock_calls[0], call())
+        eng.dispose()
+
+    def test_no_server_side_cursors_gaerdbms(self):
+        from sqlalchemy.dialects.mysql import gaerdbms
+        assert not gaerdbms.dialect.supports_server_side_cursors
+
     def test_mysqlconnector_buffered_arg(self):
         from sqlalchemy.dialects.mysql import mysqlconnector
         dialect = mysqlconnector.dialect()
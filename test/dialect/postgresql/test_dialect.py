@@ -3,17 +3,19 @@
 from sqlalchemy.testing.assertions import (
     eq_, assert_raises, assert_raises_message, AssertsExecutionResults,
     AssertsCompiledSQL)
-from sqlalchemy.testing import engines, fixtures
+from sqlalchemy.testing import engines, fixtures, is_
 from sqlalchemy import testing
 import datetime
+import decimal
 from sqlalchemy import (
     Table, Column, select, MetaData, text, Integer, String, Sequence, Numeric,
-    DateTime, BigInteger, func, extract, SmallInteger)
+    DateTime, BigInteger, func, extract, SmallInteger, Boolean, Float, Date,
+    Interval, LargeBinary)
 from sqlalchemy import exc, schema
 from sqlalchemy.dialects.postgresql import base as postgresql
 import logging
 import logging.handlers
-from sqlalchemy.testing.mock import Mock
+from sqlalchemy.testing.mock import Mock, call
 
 
 class MiscTest(fixtures.TestBase, AssertsExecutionResults, AssertsCompiledSQL):
@@ -248,3 +250,231 @@ class MiscTest(fixtures.TestBase, AssertsExecutionResults, AssertsCompiledSQL):
                 ddl_compiler.get_column_specification(t.c.c),
                 "c %s NOT NULL" % expected
             )
+
+
+class PG8000ServerSideCursorTest(fixtures.TestBase):
+
+    def _fixture(self):
+        from sqlalchemy.dialects.postgresql import pg8000
+        cursor = Mock(arraysize=1)
+        return cursor, pg8000._PG8000ServerSideCursor(cursor, 'c_1')
+
+    def test_execute(self):
+        cursor, ss = self._fixture()
+        ss.execute("SELECT x FROM t WHERE y=%s", (5, ))
+        eq_(
+            cursor.execute.mock_calls,
+            [call("DECLARE c_1 NO SCROLL CURSOR FOR "
+                  "SELECT x FROM t WHERE y=%s", (5, ))]
+        )
+        eq_(ss.rowcount, -1)
+
+    def test_fetch(self):
+        cursor, ss = self._fixture()
+        cursor.fetchall.side_effect = [[(1, ), (2, )], [(3, )], [], [(4, )]]
+        ss.execute("SELECT x FROM t", ())
+        eq_(ss.fetchmany(2), [(1, ), (2, )])
+        eq_(ss.fetchone(), (3, ))
+        eq_(ss.fetchone(), None)
+        eq_(ss.fetchall(), [(4, )])
+        eq_(
+            cursor.execute.mock_calls[1:],
+            [
+                call("FETCH FORWARD 2 FROM c_1"),
+                call("FETCH FORWARD 1 FROM c_1"),
+                call("FETCH FORWARD 1 FROM c_1"),
+                call("FETCH FORWARD ALL FROM c_1")
+            ]
+        )
+
+    def test_close(self):
+        cursor, ss = self._fixture()
+        ss.execute("SELECT x FROM t", ())
+        ss.close()
+        ss.close()
+        eq_(
+            cursor.execute.mock_calls[1:],
+            [call("CLOSE c_1")]
+        )
+        eq_(cursor.close.call_count, 2)
+
+    def test_proxies_description(self):
+        cursor, ss = self._fixture()
+        is_(ss.description, cursor.description)
+
+
+class CopyFromTest(fixtures.TestBase):
+
+    def _dialect(self):
+        from sqlalchemy.dialects.postgresql import psycopg2
+        return psycopg2.dialect()
+
+    def _copy(self, table, rows, dialect=None, read_size=8192, **kw):
+        from sqlalchemy.dialects.postgresql import copy_from
+
+        if dialect is None:
+            dialect = self._dialect()
+        data = []
+
+        def copy_expert(statement, stream):
+            data.append(statement)
+            chunks = []
+            while True:
+                chunk = stream.read(read_size)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            data.append(''.join(chunks))
+
+        conn = Mock(dialect=dialect, _echo=False)
+        conn.connection.cursor.return_value.copy_expert = copy_expert
+        count = copy_from(conn, table, rows, **kw)
+        return count, data[0], data[1]
+
+    def _table(self, *cols):
+        return Table(
+            't', MetaData(), Column('id', Integer, primary_key=True), *cols)
+
+    def test_tuples(self):
+        t = self._table(Column('data', String(50)))
+        count, stmt, data = self._copy(t, [(1, 'a'), (2, 'b'), (3, None)])
+        eq_(count, 3)
+        eq_(stmt, "COPY t (id, data) FROM STDIN")
+        eq_(data, "1\ta\n2\tb\n3\t\\N\n")
+
+    def test_dicts_columns_from_first_row(self):
+        t = self._table(
+            Column('data', String(50)), Column('x', Integer))
+        count, stmt, data = self._copy(
+            t, [{'x': 5, 'id': 1}, {'x': 6, 'id': 2}])
+        eq_(stmt, "COPY t (id, x) FROM STDIN")
+        eq_(data, "1\t5\n2\t6\n")
+
+    def test_explicit_columns(self):
+        t = self._table(Column('data', String(50)), Column('x', Integer))
+        count, stmt, data = self._copy(
+            t, [(5, 'a'), (6, 'b')], columns=['x', t.c.data])
+        eq_(stmt, "COPY t (x, data) FROM STDIN")
+        eq_(data, "5\ta\n6\tb\n")
+
+    def test_no_rows(self):
+        from sqlalchemy.dialects.postgresql import copy_from
+
+        t = self._table()
+        conn = Mock(dialect=self._dialect())
+        eq_(copy_from(conn, t, []), 0)
+        eq_(conn.connection.mock_calls, [])
+
+    def test_cursor_closed_on_error(self):
+        from sqlalchemy.dialects.postgresql import copy_from
+
+        class MyException(Exception):
+            pass
+
+        def handle_dbapi_exception(e, statement, parameters, cursor, context):
+            raise e
+
+        t = self._table()
+        conn = Mock(dialect=self._dialect(), _echo=False)
+        conn._handle_dbapi_exception.side_effect = handle_dbapi_exception
+        cursor = conn.connection.cursor.return_value
+        cursor.copy_expert.side_effect = MyException("copy failed")
+
+        assert_raises(MyException, copy_from, conn, t, [(1, )])
+        eq_(cursor.close.mock_calls, [call()])
+
+    def test_chunked_reads(self):
+        t = self._table(Column('data', String(50)))
+        rows = [(i, 'data %d' % i) for i in range(100)]
+        count, stmt, data = self._copy(
+            t, iter(rows), read_size=7, chunk_size=9)
+        eq_(count, 100)
+        eq_(data, "".join("%d\tdata %d\n" % (i, i) for i in range(100)))
+
+    def test_escaping(self):
+        t = self._table(Column('data', String(50)))
+        count, stmt, data = self._copy(
+            t, [(1, 'tab\there'), (2, 'line\nbreak\r'), (3, 'back\\slash')])
+        eq_(
+            data,
+            "1\ttab\\there\n2\tline\\nbreak\\r\n3\tback\\\\slash\n")
+
+    def test_scalar_types(self):
+        t = self._table(
+            Column('b', Boolean), Column('f', Float),
+            Column('n', Numeric(10, 2)), Column('dt', DateTime),
+            Column('d', Date), Column('i', Interval))
+        count, stmt, data = self._copy(t, [
+            (1, True, 1.5, decimal.Decimal("10.25"),
+             datetime.datetime(2014, 5, 10, 12, 15, 0),
+             datetime.date(2014, 5, 10),
+             datetime.timedelta(days=2, seconds=30)),
+            (2, False, float('nan'), None, None, None, None)
+        ])
+        eq_(
+            data,
+            "1\tt\t1.5\t10.25\t2014-05-10T12:15:00\t2014-05-10\t"
+            "2 days 30 seconds 0 microseconds\n"
+            "2\tf\tNaN\t\\N\t\\N\t\\N\t\\N\n"
+        )
+
+    def test_binary(self):
+        t = self._table(Column('data', LargeBinary))
+        count, stmt, data = self._copy(
+            t, [(1, b'\x00\xffab'), (2, None)])
+        eq_(data, "1\t\\\\x00ff6162\n2\t\\N\n")
+
+    def test_array(self):
+        from sqlalchemy.dialects.postgresql import ARRAY
+
+        t = self._table(
+            Column('a', ARRAY(String)), Column('b', ARRAY(Integer)))
+        count, stmt, data = self._copy(t, [
+            (1, ['x', 'has "quote"', None], [[1, 2], [3, 4]])
+        ])
+        eq_(
+            data,
+            '1\t{"x","has \\\\"quote\\\\"",NULL}\t{{"1","2"},{"3","4"}}\n'
+        )
+
+    def test_json(self):
+        from sqlalchemy.dialects.postgresql import JSON
+
+        t = self._table(Column('data', JSON))
+        count, stmt, data = self._copy(t, [(1, {"key": "a\tb"})])
+        eq_(data, '1\t{"key": "a\\\\tb"}\n')
+
+    def test_hstore(self):
+        from sqlalchemy.dialects.postgresql import HSTORE
+
+        t = self._table(Column('data', HSTORE))
+        for native in (False, True):
+            dialect = self._dialect()
+            dialect._has_native_hstore = native
+            count, stmt, data = self._copy(
+                t, [(1, {"key": "value"})], dialect=dialect)
+            eq_(data, '1\t"key"=>"value"\n')
+
+    def test_range(self):
+        from sqlalchemy.dialects.postgresql import INT4RANGE
+
+        t = self._table(Column('data', INT4RANGE))
+        count, stmt, data = self._copy(t, [
+            (1, Mock(isempty=False, lower=1, upper=10,
+                     lower_inc=True, upper_inc=False)),
+            (2, Mock(isempty=False, lower=None, upper=10,
+                     lower_inc=False, upper_inc=True)),
+            (3, Mock(isempty=True)),
+        ])
+        eq_(data, '1\t["1","10")\n2\t(,"10"]\n3\tempty\n')
+
+    def test_not_supported(self):
+        from sqlalchemy.dialects.postgresql import copy_from, pg8000
+
+        t = self._table()
+        conn = Mock(dialect=pg8000.dialect())
+        assert_raises_message(
+            exc.InvalidRequestError,
+            r"The postgresql\+pg8000 dialect does not support COPY FROM",
+            copy_from, conn, t, [(1, )]
+        )
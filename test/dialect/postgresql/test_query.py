@@ -644,6 +644,103 @@ class ServerSideCursorsTest(fixtures.TestBase, AssertsExecutionResults):
             test_table.drop(checkfirst=True)
 
 
+class PG8000ServerSideCursorsTest(fixtures.TablesTest):
+
+    __only_on__ = 'postgresql+pg8000'
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('data', metadata,
+              Column('id', Integer, primary_key=True),
+              Column('data', String(50)))
+
+    @classmethod
+    def insert_data(cls):
+        testing.db.execute(
+            cls.tables.data.insert(),
+            [{'id': i, 'data': 'd%d' % i} for i in range(1, 101)]
+        )
+
+    def test_stream_results(self):
+        data = self.tables.data
+        with testing.db.begin() as conn:
+            result = conn.execution_options(stream_results=True).\
+                execute(data.select().order_by(data.c.id))
+            assert result.cursor.ident
+            eq_(result.fetchmany(7), [(i, 'd%d' % i) for i in range(1, 8)])
+            eq_(result.fetchone(), (8, 'd8'))
+            eq_(
+                result.fetchall(),
+                [(i, 'd%d' % i) for i in range(9, 101)]
+            )
+            eq_(conn.scalar(select([func.count(data.c.id)])), 100)
+
+    def test_global_text(self):
+        engine = engines.testing_engine(
+            options={'server_side_cursors': True})
+        with engine.begin() as conn:
+            result = conn.execute(text('select id from data order by id'))
+            assert result.cursor.ident
+            eq_([row[0] for row in result], list(range(1, 101)))
+        engine.dispose()
+
+
+class CopyFromTest(fixtures.TablesTest):
+
+    __only_on__ = 'postgresql+psycopg2'
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        from sqlalchemy.dialects.postgresql import ARRAY, JSON
+
+        Table('data', metadata,
+              Column('id', Integer, primary_key=True),
+              Column('name', String(50)),
+              Column('stamp', DateTime),
+              Column('tags', ARRAY(String(20))),
+              Column('doc', JSON),
+              Column('status', String(20), server_default='new'))
+
+    def test_round_trip(self):
+        from sqlalchemy.dialects.postgresql import copy_from
+
+        data = self.tables.data
+        stamp = datetime.datetime(2014, 5, 10, 12, 15, 30)
+        count = copy_from(
+            testing.db, data,
+            (
+                {'id': i, 'name': 'name\t%d' % i, 'stamp': stamp,
+                 'tags': ['a', 'b "%d"' % i, None],
+                 'doc': {'key': [i, 'x\ny']}}
+                for i in range(1, 101)
+            ),
+            chunk_size=7
+        )
+        eq_(count, 100)
+        eq_(
+            testing.db.execute(data.select().order_by(data.c.id)).fetchall(),
+            [
+                (i, 'name\t%d' % i, stamp, ['a', 'b "%d"' % i, None],
+                 {'key': [i, 'x\ny']}, 'new')
+                for i in range(1, 101)
+            ]
+        )
+
+    def test_tuples_in_transaction(self):
+        from sqlalchemy.dialects.postgresql import copy_from
+
+        data = self.tables.data
+        with testing.db.connect() as conn:
+            trans = conn.begin()
+            copy_from(
+                conn, data, [(1, None), (2, 'two')],
+                columns=[data.c.id, data.c.name])
+            trans.rollback()
+            eq_(conn.scalar(select([func.count(data.c.id)])), 0)
+
+
 class MatchTest(fixtures.TestBase, AssertsCompiledSQL):
 
     __only_on__ = 'postgresql >= 8.3'
@@ -7,7 +7,7 @@ from sqlalchemy.testing.util import picklers
 from sqlalchemy.interfaces import ConnectionProxy
 from sqlalchemy import MetaData, Integer, String, INT, VARCHAR, func, \
     bindparam, select, event, TypeDecorator, create_engine, Sequence
-from sqlalchemy.sql import column, literal
+from sqlalchemy.sql import column, literal, literal_column
 from sqlalchemy.testing.schema import Table, Column
 import sqlalchemy as tsa
 from sqlalchemy import testing
@@ -17,6 +17,7 @@ from sqlalchemy.testing.engines import testing_engine
 from sqlalchemy.dialects.oracle.zxjdbc import ReturningParam
 from sqlalchemy.engine import result as _result, default
 from sqlalchemy.engine.base import Engine
+from sqlalchemy.engine.util import CompiledCache, StatementStats
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing.mock import Mock, call, patch
 from contextlib import contextmanager
@@ -778,6 +779,643 @@ class CompiledCacheTest(fixtures.TestBase):
         eq_(len(cache), 1)
 
 
+class EngineCompiledCacheTest(fixtures.TablesTest):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('users', metadata,
+              Column('user_id', INT, primary_key=True,
+                     test_needs_autoincrement=True),
+              Column('user_name', VARCHAR(20)))
+
+    @classmethod
+    def insert_data(cls):
+        cls.tables.users.insert().execute(
+            [{'user_id': 1, 'user_name': 'u1'},
+             {'user_id': 2, 'user_name': 'u2'},
+             {'user_id': 3, 'user_name': 'u3'}])
+
+    def _engine(self, compiled_cache_size=500):
+        # an engine against the same database, with its own cache
+        eng = testing.db.execution_options()
+        if compiled_cache_size:
+            eng.compiled_cache = CompiledCache(compiled_cache_size)
+        else:
+            eng.compiled_cache = None
+        return eng
+
+    def test_default_disabled(self):
+        eng = engines.testing_engine()
+        is_(eng.compiled_cache, None)
+
+    def test_enabled_via_create_engine(self):
+        eng = engines.testing_engine(options={'compiled_cache_size': 500})
+        assert isinstance(eng.compiled_cache, CompiledCache)
+        eq_(eng.compiled_cache.capacity, 500)
+
+    def test_disabled(self):
+        users = self.tables.users
+        eng = self._engine(compiled_cache_size=0)
+        eq_(
+            eng.execute(
+                select([users.c.user_name]).
+                where(users.c.user_id == 2)).scalar(),
+            'u2'
+        )
+
+    def test_equivalent_statements_hit(self):
+        users = self.tables.users
+        eng = self._engine()
+
+        for id_, name in [(1, 'u1'), (2, 'u2'), (3, 'u3')]:
+            stmt = select([users.c.user_name]).where(users.c.user_id == id_)
+            eq_(eng.execute(stmt).scalar(), name)
+
+        stats = eng.compiled_cache.stats()
+        eq_(stats['misses'], 1)
+        eq_(stats['hits'], 2)
+        eq_(stats['size'], 1)
+
+    def test_param_keys_part_of_key(self):
+        users = self.tables.users
+        eng = self._engine()
+
+        eng.execute(users.update(), user_name='x')
+        eng.execute(
+            users.update().where(users.c.user_id == bindparam('id')),
+            id=1, user_name='y')
+        eng.execute(
+            users.update().where(users.c.user_id == bindparam('id')),
+            [{'id': 2, 'user_name': 'z'}, {'id': 3, 'user_name': 'q'}])
+
+        eq_(eng.compiled_cache.stats()['misses'], 3)
+        eq_(
+            eng.execute(
+                select([users.c.user_name]).order_by(users.c.user_id)
+            ).fetchall(),
+            [('y', ), ('z', ), ('q', )]
+        )
+
+    def test_anonymous_alias_result_targeting(self):
+        users = self.tables.users
+        eng = self._engine()
+
+        for id_ in (1, 2, 3):
+            ua = users.alias()
+            row = eng.execute(
+                select([ua]).where(ua.c.user_id == id_)).first()
+            eq_(row[ua.c.user_name], 'u%d' % id_)
+            eq_(row[ua.c.user_id], id_)
+        eq_(eng.compiled_cache.stats()['hits'], 2)
+
+    def test_anonymous_label_result_targeting(self):
+        users = self.tables.users
+        eng = self._engine()
+
+        for id_ in (1, 2):
+            expr = func.lower(users.c.user_name).label(None)
+            row = eng.execute(
+                select([expr]).where(users.c.user_id == id_)).first()
+            eq_(row[expr], 'u%d' % id_)
+        eq_(eng.compiled_cache.stats()['hits'], 1)
+
+    def test_literal_values_part_of_key(self):
+        users = self.tables.users
+        eng = self._engine()
+
+        eng.execute(users.insert().values(user_id=4, user_name='u4'))
+        eng.execute(users.insert().values(user_id=5, user_name='u5'))
+
+        eq_(eng.compiled_cache.stats()['misses'], 2)
+        eq_(
+            eng.execute(
+                select([users.c.user_name]).
+                where(users.c.user_id > 3).order_by(users.c.user_id)
+            ).fetchall(),
+            [('u4', ), ('u5', )]
+        )
+
+    def test_limit_offset(self):
+        users = self.tables.users
+        eng = self._engine()
+
+        for limit, offset, expected in [
+                (1, 0, [(1, )]), (2, 1, [(2, ), (3, )]), (1, 2, [(3, )])]:
+            eq_(
+                eng.execute(
+                    select([users.c.user_id]).order_by(users.c.user_id).
+                    limit(limit).offset(offset)
+                ).fetchall(),
+                expected
+            )
+
+    def test_eviction(self):
+        users = self.tables.users
+        eng = self._engine(compiled_cache_size=2)
+
+        for col in (users.c.user_id, users.c.user_name):
+            for crit in (
+                    users.c.user_id == 1, users.c.user_id > 1,
+                    users.c.user_id < 1):
+                eng.execute(select([col]).where(crit)).fetchall()
+
+        stats = eng.compiled_cache.stats()
+        eq_(stats['misses'], 6)
+        eq_(stats['capacity'], 2)
+        assert stats['size'] <= 3
+        eq_(stats['evictions'], 6 - stats['size'])
+
+    def test_explicit_compiled_cache_takes_precedence(self):
+        users = self.tables.users
+        eng = self._engine()
+        cache = {}
+
+        conn = eng.connect().execution_options(compiled_cache=cache)
+        stmt = select([users.c.user_name]).where(users.c.user_id == 1)
+        conn.execute(stmt).fetchall()
+        conn.execute(stmt).fetchall()
+        conn.close()
+
+        eq_(len(cache), 1)
+        eq_(eng.compiled_cache.stats()['size'], 0)
+
+    def test_option_engine_shares_cache(self):
+        eng = engines.testing_engine()
+        is_(
+            eng.execution_options(foo='bar').compiled_cache,
+            eng.compiled_cache
+        )
+
+    def test_uncacheable(self):
+        users = self.tables.users
+        eng = self._engine()
+
+        from sqlalchemy.ext.compiler import compiles
+        from sqlalchemy.sql.expression import ColumnElement
+
+        class MyThing(ColumnElement):
+            type = Integer()
+
+        @compiles(MyThing)
+        def visit_my_thing(element, compiler, **kw):
+            return "1"
+
+        for i in range(2):
+            eq_(
+                eng.execute(
+                    select([func.count(users.c.user_id)]).
+                    where(users.c.user_id > MyThing())).scalar(),
+                2
+            )
+        stats = eng.compiled_cache.stats()
+        eq_(stats['uncacheable'], 2)
+        eq_(stats['size'], 0)
+
+    def test_result_metadata_reused(self):
+        users = self.tables.users
+        eng = self._engine()
+
+        metadatas = []
+        for id_ in (1, 2, 3):
+            stmt = select([users.c.user_name]).where(users.c.user_id == id_)
+            result = eng.execute(stmt)
+            metadatas.append(result._metadata)
+            eq_(result.fetchall(), [('u%d' % id_, )])
+
+        is_(metadatas[0], metadatas[1])
+        is_(metadatas[1], metadatas[2])
+
+    def test_result_metadata_keyed_to_description(self):
+        users = self.tables.users
+        eng = self._engine()
+        stmt = select([users.c.user_id, users.c.user_name]).\
+            where(users.c.user_id == 1)
+
+        eng.execute(stmt).fetchall()
+        (compiled, elements), = eng.compiled_cache.values()
+        eq_(len(compiled._cached_metadata), 1)
+
+        # a description of a different shape gets its own metadata
+        with patch.object(
+                eng.dialect.execution_ctx_cls, "_result_metadata_key",
+                lambda self, description: "other"):
+            row = eng.execute(stmt).first()
+        eq_(row[users.c.user_name], 'u1')
+        eq_(len(compiled._cached_metadata), 2)
+
+    def test_reset_stats(self):
+        users = self.tables.users
+        eng = self._engine()
+        eng.execute(select([users.c.user_id])).fetchall()
+        eng.compiled_cache.reset_stats()
+        stats = eng.compiled_cache.stats()
+        eq_(stats['misses'], 0)
+        eq_(stats['size'], 1)
+
+
+class PositionalParametersTest(fixtures.TablesTest):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        class UpperString(TypeDecorator):
+            impl = VARCHAR(20)
+
+            def process_bind_param(self, value, dialect):
+                return value.upper() if value is not None else None
+
+        Table('data', metadata,
+              Column('id', INT, primary_key=True, autoincrement=False),
+              Column('x', UpperString),
+              Column('y', INT, default=5))
+
+    def _rows(self, bind=testing.db):
+        data = self.tables.data
+        return bind.execute(
+            select([data.c.id, data.c.x, data.c.y]).order_by(data.c.id)
+        ).fetchall()
+
+    def test_insert_executemany(self):
+        data = self.tables.data
+        result = testing.db.execute(
+            data.insert(), [(1, 'a', 10), (2, 'b', 11), (3, None, 12)])
+        if testing.db.dialect.supports_sane_multi_rowcount:
+            eq_(result.rowcount, 3)
+        eq_(self._rows(), [(1, 'A', 10), (2, 'B', 11), (3, None, 12)])
+
+    def test_insert_does_not_construct_params(self):
+        data = self.tables.data
+        result = testing.db.execute(
+            data.insert(), [(1, 'a', 10), (2, 'b', 11)])
+        assert 'compiled_parameters' not in result.context.__dict__
+        eq_(
+            result.context.compiled_parameters,
+            [{'id': 1, 'x': 'a', 'y': 10}, {'id': 2, 'x': 'b', 'y': 11}]
+        )
+
+    def test_insert_leading_columns_w_python_default(self):
+        data = self.tables.data
+        testing.db.execute(data.insert(), [(1, 'a'), (2, 'b')])
+        eq_(self._rows(), [(1, 'A', 5), (2, 'B', 5)])
+
+    def test_insert_single(self):
+        data = self.tables.data
+        result = testing.db.execute(data.insert(), (7, 'a', 10))
+        eq_(result.inserted_primary_key, [7])
+        eq_(self._rows(), [(7, 'A', 10)])
+
+    def test_update_executemany(self):
+        data = self.tables.data
+        testing.db.execute(data.insert(), [(1, 'a', 10), (2, 'b', 11)])
+        testing.db.execute(
+            data.update().where(data.c.id == bindparam('b_id')).
+            values(x=bindparam('b_x'), y=15),
+            [('p', 2), ('q', 1)]
+        )
+        eq_(self._rows(), [(1, 'Q', 15), (2, 'P', 15)])
+
+    @testing.only_on('sqlite')
+    def test_named_paramstyle(self):
+        data = self.tables.data
+        eng = engines.testing_engine(
+            options={'paramstyle': 'named', 'pool': testing.db.pool,
+                     'use_reaper': False})
+        result = eng.execute(data.insert(), [(1, 'a', 10), (2, 'b', 11)])
+        eq_(
+            result.context.parameters,
+            ({'id': 1, 'x': 'A', 'y': 10}, {'id': 2, 'x': 'B', 'y': 11})
+        )
+        result = eng.execute(
+            data.update().where(data.c.id == bindparam('b_id')).
+            values(y=bindparam('b_y'), x=bindparam('b_x')),
+            [('p', 20, 2)]
+        )
+        eq_(
+            result.context.parameters,
+            ({'b_x': 'P', 'b_y': 20, 'b_id': 2}, )
+        )
+        eq_(self._rows(eng), [(1, 'A', 10), (2, 'P', 20)])
+
+    def test_named_paramstyle_prefixed_names(self):
+        data = self.tables.data
+        stmt = data.update().where(data.c.id == bindparam('b_1')).values(
+            x=bindparam('b_10'), y=bindparam('b'))
+        for paramstyle in ('named', 'pyformat'):
+            dialect = default.DefaultDialect(paramstyle=paramstyle)
+            eq_(stmt.compile(dialect=dialect)._positional_keys,
+                ['b_10', 'b', 'b_1'])
+
+    def test_named_paramstyle_bind_in_literal(self):
+        data = self.tables.data
+        stmt = data.update().where(data.c.id == bindparam('b_id')).values(
+            x=bindparam('b_x'),
+            y=func.concat(literal_column("':b_id'"), bindparam('b_y')))
+        for paramstyle in ('named', 'pyformat', 'qmark'):
+            dialect = default.DefaultDialect(paramstyle=paramstyle)
+            eq_(stmt.compile(dialect=dialect)._positional_keys,
+                ['b_x', 'b_y', 'b_id'])
+
+    def test_wrong_length(self):
+        data = self.tables.data
+        assert_raises_message(
+            tsa.exc.StatementError,
+            "Positional parameter set 1 contains 2 values; expected 3",
+            testing.db.execute, data.insert(), [(1, 'a', 10), (2, 'b')]
+        )
+
+    def test_not_accepted_for_select(self):
+        data = self.tables.data
+        assert_raises_message(
+            tsa.exc.ArgumentError,
+            r"Positional parameter sets are accepted only by insert\(\) "
+            r"and update\(\) constructs",
+            testing.db.execute, select([data]).where(data.c.id == 5),
+            [(1, ), (2, )]
+        )
+
+
+class StatementStatsTest(fixtures.TablesTest):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('users', metadata,
+              Column('user_id', INT, primary_key=True,
+                     test_needs_autoincrement=True),
+              Column('user_name', VARCHAR(20)))
+
+    @classmethod
+    def insert_data(cls):
+        cls.tables.users.insert().execute(
+            [{'user_id': i, 'user_name': 'u%d' % i} for i in range(1, 11)])
+
+    def _engine(self):
+        # an engine against the same database, with its own statistics
+        eng = testing.db.execution_options()
+        eng.statement_stats = StatementStats()
+        return eng
+
+    def _stats(self, eng):
+        return dict(
+            (stat['statement'], stat)
+            for stat in eng.statement_stats.snapshot()
+        )
+
+    def test_default_disabled(self):
+        eng = engines.testing_engine()
+        is_(eng.statement_stats, None)
+        is_(eng.execution_options(foo='bar').statement_stats, None)
+
+    def test_enabled_via_create_engine(self):
+        eng = engines.testing_engine(
+            options={'collect_statement_stats': True})
+        assert isinstance(eng.statement_stats, StatementStats)
+        eq_(eng.statement_stats.capacity, 1000)
+
+    def test_option_engine_shares_stats(self):
+        eng = engines.testing_engine(
+            options={'collect_statement_stats': True})
+        is_(
+            eng.execution_options(foo='bar').statement_stats,
+            eng.statement_stats)
+
+    def test_select_rows_and_timings(self):
+        users = self.tables.users
+        eng = self._engine()
+        stmt = select([users.c.user_name]).order_by(users.c.user_id)
+        for i in range(3):
+            eq_(len(eng.execute(stmt).fetchall()), 10)
+        r = eng.execute(stmt.where(users.c.user_id == 5))
+        eq_(r.fetchone(), ('u5', ))
+        r.close()
+
+        stats = self._stats(eng)
+        eq_(len(stats), 2)
+        stat = stats[str(stmt.compile(eng))]
+        eq_(stat['executions'], 3)
+        eq_(stat['rows'], 30)
+        assert stat['total'] >= stat['max'] >= stat['p99'] >= \
+            stat['p50'] > 0
+        assert stat['fetch_total'] >= stat['fetch_p99'] >= 0
+
+        stat = stats[str(stmt.where(users.c.user_id == 5).compile(eng))]
+        eq_(stat['executions'], 1)
+        eq_(stat['rows'], 1)
+
+    @testing.requires.sane_rowcount
+    def test_dml_rowcount(self):
+        users = self.tables.users
+        eng = self._engine()
+        stmt = users.update().where(users.c.user_id > 4).\
+            values(user_name='x')
+        eng.execute(stmt)
+        eng.execute(stmt)
+
+        stat, = eng.statement_stats.snapshot()
+        eq_(stat['executions'], 2)
+        eq_(stat['rows'], 12)
+        eq_(stat['fetch_total'], 0)
+        eq_(stat['fetch_p50'], None)
+
+    def test_snapshot_ordering(self):
+        eng = self._engine()
+        for i in range(3):
+            eng.execute("select user_id from users")
+        eng.execute("select user_name from users")
+
+        eq_(
+            [
+                stat['statement'] for stat in
+                eng.statement_stats.snapshot('executions')
+            ],
+            ["select user_id from users", "select user_name from users"]
+        )
+        eq_(len(eng.statement_stats.snapshot('executions', limit=1)), 1)
+
+    def test_reset(self):
+        eng = self._engine()
+        eng.execute("select user_id from users")
+        eq_(len(eng.statement_stats), 1)
+        eng.statement_stats.reset_stats()
+        eq_(len(eng.statement_stats), 0)
+        eq_(eng.statement_stats.snapshot(), [])
+
+
+class ExecutemanyValuesTest(fixtures.TablesTest):
+    __backend__ = True
+    __requires__ = 'multivalues_inserts',
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('data', metadata,
+              Column('id', INT, primary_key=True,
+                     test_needs_autoincrement=True),
+              Column('x', VARCHAR(20)),
+              Column('y', INT, default=5))
+
+    def _engine(self, paramstyle=None, executemany_mode='values'):
+        # share the pool so that the tables are visible on an
+        # in-memory database
+        options = {
+            'executemany_values_page_size': 3,
+            'pool': testing.db.pool,
+            'use_reaper': False
+        }
+        if executemany_mode is not None:
+            options['executemany_mode'] = executemany_mode
+        if paramstyle is not None:
+            options['paramstyle'] = paramstyle
+        eng = engines.testing_engine(options=options)
+        statements = []
+
+        class CursorSpy(object):
+            def __init__(self, cursor):
+                self.cursor = cursor
+
+            def execute(self, statement, parameters):
+                statements.append((statement, parameters))
+                return self.cursor.execute(statement, parameters)
+
+            def __getattr__(self, key):
+                return getattr(self.cursor, key)
+
+        do_executemany_values = eng.dialect._do_executemany_values
+
+        def spy(cursor, statement, parameters, context):
+            return do_executemany_values(
+                CursorSpy(cursor), statement, parameters, context)
+        eng.dialect._do_executemany_values = spy
+        return eng, statements
+
+    def _assert_pages(self, eng, statements, stmt=None):
+        data = self.tables.data
+        if stmt is None:
+            stmt = data.insert()
+        result = eng.execute(
+            stmt, [{'x': 'x%d' % i} for i in range(7)])
+
+        eq_(len(statements), 3)
+        if testing.db.dialect.supports_sane_multi_rowcount:
+            eq_(result.rowcount, 7)
+        eq_(
+            eng.execute(
+                select([data.c.x, data.c.y]).order_by(data.c.id)).fetchall(),
+            [('x%d' % i, 5) for i in range(7)]
+        )
+
+    @testing.only_on('sqlite')
+    def test_named(self):
+        eng, statements = self._engine(paramstyle='named')
+        self._assert_pages(eng, statements)
+        eq_(
+            statements[2],
+            (
+                "INSERT INTO data (x, y) VALUES (:x_m0, :y_m0)",
+                {'x': 'x6', 'y': 5, 'x_m0': 'x6', 'y_m0': 5}
+            )
+        )
+
+    @testing.only_on('sqlite')
+    def test_positional(self):
+        eng, statements = self._engine(paramstyle='qmark')
+        self._assert_pages(eng, statements)
+        eq_(
+            statements[1],
+            (
+                "INSERT INTO data (x, y) VALUES (?, ?), (?, ?), (?, ?)",
+                ('x3', 5, 'x4', 5, 'x5', 5)
+            )
+        )
+
+    @testing.only_on('sqlite')
+    def test_page_size_limited_by_max_parameters(self):
+        data = self.tables.data
+        eng, statements = self._engine(paramstyle='qmark')
+        eq_(eng.dialect.executemany_values_max_parameters, 999)
+        eng.dialect.executemany_values_max_parameters = 5
+        eng.execute(data.insert(), [{'x': 'x%d' % i} for i in range(7)])
+
+        # two parameters per row allow two rows per statement
+        eq_(len(statements), 4)
+        eq_(
+            statements[0],
+            ("INSERT INTO data (x, y) VALUES (?, ?), (?, ?)",
+             ('x0', 5, 'x1', 5))
+        )
+        eq_(
+            eng.execute(select([data.c.x]).order_by(data.c.id)).fetchall(),
+            [('x%d' % i, ) for i in range(7)]
+        )
+
+    def test_execution_option(self):
+        data = self.tables.data
+        eng, statements = self._engine(executemany_mode=None)
+        eng.execute(data.insert(), [{'x': 'x1'}, {'x': 'x2'}])
+        eq_(statements, [])
+        eng.execute(data.delete())
+
+        self._assert_pages(
+            eng, statements,
+            data.insert().execution_options(executemany_mode='values'))
+
+    def test_single_row_not_batched(self):
+        data = self.tables.data
+        eng, statements = self._engine()
+        eng.execute(data.insert(), {'x': 'x1'})
+        eng.execute(data.insert(), [{'x': 'x2'}])
+        eq_(statements, [])
+        eq_(eng.execute(select([func.count(data.c.id)])).scalar(), 2)
+
+    def test_update_not_batched(self):
+        data = self.tables.data
+        eng, statements = self._engine()
+        eng.execute(data.insert(), [{'x': 'x1'}, {'x': 'x2'}])
+        eng.execute(
+            data.update().where(data.c.x == bindparam('oldx')).
+            values(x=bindparam('newx')),
+            [{'oldx': 'x1', 'newx': 'y1'}, {'oldx': 'x2', 'newx': 'y2'}])
+        eq_(len(statements), 1)
+        eq_(
+            eng.execute(select([data.c.x]).order_by(data.c.id)).fetchall(),
+            [('y1', ), ('y2', )]
+        )
+
+    def test_not_enabled(self):
+        data = self.tables.data
+        with patch.object(
+                testing.db.dialect, '_do_executemany_values') as do_values:
+            testing.db.execute(
+                data.insert(), [{'x': 'x1'}, {'x': 'x2'}])
+        eq_(do_values.mock_calls, [])
+        eq_(
+            testing.db.execute(select([func.count(data.c.id)])).scalar(),
+            2)
+
+    @testing.requires.returning
+    def test_returning(self):
+        data = self.tables.data
+        eng, statements = self._engine()
+        result = eng.execute(
+            data.insert().returning(data.c.id, data.c.x),
+            [{'x': 'x%d' % i} for i in range(7)])
+        eq_(len(statements), 3)
+        rows = result.fetchall()
+        eq_([row.x for row in rows], ['x%d' % i for i in range(7)])
+        eq_(
+            [row.id for row in rows],
+            [row.id for row in eng.execute(
+                select([data.c.id]).order_by(data.c.id))]
+        )
+
+    def test_invalid_mode(self):
+        assert_raises_message(
+            tsa.exc.ArgumentError,
+            "Invalid value 'foo' for executemany_mode",
+            default.DefaultDialect, executemany_mode='foo'
+        )
+
+
 class MockStrategyTest(fixtures.TestBase):
 
     def _engine_fixture(self):
@@ -1068,9 +1706,68 @@ class AlternateResultProxyTest(fixtures.TestBase):
         rows = r.fetchmany(6)
         eq_(rows, [(i, "t_%d" % i) for i in range(1, 6)])
 
+    def _test_fetch_columns(self, cls):
+        class ExcCtx(default.DefaultExecutionContext):
+
+            def get_result_proxy(self):
+                return cls(self)
+        self.engine.dialect.execution_ctx_cls = ExcCtx
+
+        r = self.engine.execute(select([self.table]).order_by(self.table.c.x))
+        assert isinstance(r, cls)
+        eq_(
+            r.fetch_columns(3),
+            [[1, 2, 3], ["t_1", "t_2", "t_3"]]
+        )
+        eq_(
+            r.fetch_columns(),
+            [list(range(4, 12)), ["t_%d" % i for i in range(4, 12)]]
+        )
+        assert r.closed
+
+        r = self.engine.execute(
+            select([self.table]).where(self.table.c.x > 5).
+            order_by(self.table.c.x))
+        eq_(
+            r.fetch_columns(6),
+            [list(range(6, 12)), ["t_%d" % i for i in range(6, 12)]]
+        )
+        eq_(r.fetch_columns(6), [[], []])
+        assert r.closed
+
     def test_plain(self):
         self._test_proxy(_result.ResultProxy)
 
+    def test_plain_fetch_columns(self):
+        self._test_fetch_columns(_result.ResultProxy)
+
+    def test_buffered_row_fetch_columns(self):
+        self._test_fetch_columns(_result.BufferedRowResultProxy)
+
+    def test_fully_buffered_fetch_columns(self):
+        self._test_fetch_columns(_result.FullyBufferedResultProxy)
+
+    def test_buffered_column_fetch_columns(self):
+        self._test_fetch_columns(_result.BufferedColumnResultProxy)
+
+    def test_fetch_columns_processed(self):
+        r = self.engine.execute(
+            select([self.table.c.y]).where(self.table.c.x == 1))
+        eq_(r.fetch_columns(), [["t_1"]])
+        r = self.engine.execute(
+            select([self.table.c.y]).where(self.table.c.x == 1))
+        col, = r.fetch_columns()
+        assert isinstance(col[0], util.text_type)
+
+    def test_fetch_columns_no_rows_returned(self):
+        r = self.engine.execute(
+            self.table.update().values(y="q").where(self.table.c.x == 0))
+        assert_raises_message(
+            tsa.exc.ResourceClosedError,
+            "This result object does not return rows.",
+            r.fetch_columns
+        )
+
     def test_buffered_row_result_proxy(self):
         self._test_proxy(_result.BufferedRowResultProxy)
 
@@ -1080,6 +1777,113 @@ class AlternateResultProxyTest(fixtures.TestBase):
     def test_buffered_column_result_proxy(self):
         self._test_proxy(_result.BufferedColumnResultProxy)
 
+    def test_buffered_column_result_proxy_cached_metadata(self):
+        class ExcCtx(default.DefaultExecutionContext):
+
+            def get_result_proxy(self):
+                return _result.BufferedColumnResultProxy(self)
+        self.engine.dialect.execution_ctx_cls = ExcCtx
+        stmt = select([self.table]).where(self.table.c.x < 3)
+        conn = self.engine.connect().execution_options(compiled_cache={})
+        for i in range(3):
+            eq_(conn.execute(stmt).fetchall(), [(1, "t_1"), (2, "t_2")])
+        conn.close()
+
+
+class ServerSideCursorHookTest(fixtures.TestBase):
+    __requires__ = ('sqlite', )
+
+    def setup(self):
+        self.engine = engine = testing_engine('sqlite://')
+        m = MetaData()
+        self.table = t = Table('test', m,
+                               Column('x', Integer, primary_key=True),
+                               Column('y', String(50)))
+        m.create_all(engine)
+        engine.execute(t.insert(), [
+            {'x': i, 'y': "t_%d" % i} for i in range(1, 12)
+        ])
+
+    def teardown(self):
+        self.engine.dispose()
+
+    def _fixture(self, server_side_cursors):
+        canary = Mock()
+
+        class ExcCtx(self.engine.dialect.execution_ctx_cls):
+
+            def create_server_side_cursor(self):
+                canary(self.statement)
+                return self._dbapi_connection.cursor()
+
+        self.engine.dialect.execution_ctx_cls = ExcCtx
+        self.engine.dialect.supports_server_side_cursors = True
+        self.engine.dialect.server_side_cursors = server_side_cursors
+        return canary
+
+    def _assert_ss(self, result, canary):
+        assert isinstance(result, _result.BufferedRowResultProxy)
+        eq_(canary.call_count, 1)
+
+    def _assert_not_ss(self, result, canary):
+        assert not isinstance(result, _result.BufferedRowResultProxy)
+        eq_(canary.call_count, 0)
+
+    def test_not_supported_ignores_option(self):
+        result = self.engine.execution_options(stream_results=True).\
+            execute(select([self.table]))
+        assert not isinstance(result, _result.BufferedRowResultProxy)
+        eq_(len(result.fetchall()), 11)
+
+    def test_stmt_option(self):
+        canary = self._fixture(False)
+        result = self.engine.execute(
+            select([self.table]).execution_options(stream_results=True))
+        self._assert_ss(result, canary)
+        eq_(
+            result.fetchall(),
+            [(i, "t_%d" % i) for i in range(1, 12)]
+        )
+
+    def test_conn_option(self):
+        canary = self._fixture(False)
+        with self.engine.connect() as conn:
+            result = conn.execution_options(stream_results=True).\
+                execute("select * from test")
+            self._assert_ss(result, canary)
+            eq_(len(result.fetchall()), 11)
+
+    def test_option_off_by_default(self):
+        canary = self._fixture(False)
+        result = self.engine.execute(select([self.table]))
+        self._assert_not_ss(result, canary)
+
+    def test_global_expr(self):
+        canary = self._fixture(True)
+        result = self.engine.execute(select([self.table]))
+        self._assert_ss(result, canary)
+        eq_(result.fetchmany(3), [(i, "t_%d" % i) for i in range(1, 4)])
+        result.close()
+
+    def test_global_string(self):
+        canary = self._fixture(True)
+        result = self.engine.execute("select * from test")
+        self._assert_ss(result, canary)
+        result.close()
+
+    def test_global_no_dml(self):
+        canary = self._fixture(True)
+        result = self.engine.execute(
+            self.table.update().values(y='q'))
+        self._assert_not_ss(result, canary)
+        eq_(result.rowcount, 11)
+
+    def test_global_stmt_option_disabled(self):
+        canary = self._fixture(True)
+        result = self.engine.execute(
+            select([self.table]).execution_options(stream_results=False))
+        self._assert_not_ss(result, canary)
+
 
 class EngineEventsTest(fixtures.TestBase):
     __requires__ = 'ad_hoc_engines',
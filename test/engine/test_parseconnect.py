@@ -272,10 +272,22 @@ class CreateEngineTest(fixtures.TestBase):
             'postgresql://',
             max_overflow=8,
             pool_timeout=60,
+            pool_use_lifo=True,
+            pool_pre_ping=True,
+            pool_pre_ping_interval=5,
+            pool_collect_stats=True,
+            pool_min_size=2,
+            pool_idle_timeout=30,
             poolclass=tsa.pool.QueuePool,
             module=mock_dbapi,
             _initialize=False,
         )
+        assert e.pool._pool.use_lifo
+        assert e.pool._pre_ping
+        eq_(e.pool._pre_ping_interval, 5)
+        eq_(e.pool.stats()['checkouts'], 0)
+        eq_(e.pool._min_size, 2)
+        eq_(e.pool._idle_timeout, 30)
 
         # but not SingletonThreadPool
 
@@ -4,11 +4,12 @@ from sqlalchemy import pool, select, event
 import sqlalchemy as tsa
 from sqlalchemy import testing
 from sqlalchemy.testing.util import gc_collect, lazy_gc
-from sqlalchemy.testing import eq_, assert_raises, is_not_
+from sqlalchemy.testing import eq_, assert_raises, is_not_, is_, \
+    assert_raises_message
 from sqlalchemy.testing.engines import testing_engine
 from sqlalchemy.testing import fixtures
 import random
-from sqlalchemy.testing.mock import Mock, call
+from sqlalchemy.testing.mock import Mock, call, patch
 
 join_timeout = 10
 
@@ -1247,6 +1248,178 @@ class QueuePoolTest(PoolTestBase):
         c2.close()
         self.assert_(p.checkedout() == 0)
 
+    def test_fifo(self):
+        p = self._queuepool_fixture(pool_size=3, max_overflow=0)
+        c1, c2, c3 = p.connect(), p.connect(), p.connect()
+        conns = [c.connection for c in (c1, c2, c3)]
+        c1.close()
+        c2.close()
+        c3.close()
+        checked_out = [p.connect() for i in range(3)]
+        eq_([c.connection for c in checked_out], conns)
+
+    def test_lifo(self):
+        p = self._queuepool_fixture(
+            pool_size=3, max_overflow=0, use_lifo=True)
+        c1, c2, c3 = p.connect(), p.connect(), p.connect()
+        conns = [c.connection for c in (c1, c2, c3)]
+        c1.close()
+        c2.close()
+        c3.close()
+        checked_out = [p.connect() for i in range(3)]
+        eq_([c.connection for c in checked_out], list(reversed(conns)))
+
+    def test_lifo_idle_connections_recycle(self):
+        p = self._queuepool_fixture(
+            pool_size=2, max_overflow=0, use_lifo=True)
+        c1, c2 = p.connect(), p.connect()
+        busy = c2.connection
+        c1.close()
+        c2.close()
+
+        # with a single connection in use at a time, the same
+        # connection is handed out each time and the other stays idle
+        for i in range(3):
+            c = p.connect()
+            is_(c.connection, busy)
+            c.close()
+
+    def test_lifo_recreate(self):
+        p = self._queuepool_fixture(pool_size=1, use_lifo=True)
+        assert p.recreate()._pool.use_lifo
+
+    def _wait_for(self, fn):
+        deadline = time.time() + join_timeout
+        while not fn() and time.time() < deadline:
+            time.sleep(.01)
+
+    @testing.requires.threading_with_mock
+    def test_min_size_warm_up(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=5, max_overflow=0, min_size=3)
+        eq_(dbapi.connect.call_count, 0)
+        c1 = p.connect()
+        self._wait_for(lambda: p.checkedin() == 2)
+        eq_(p.checkedin(), 2)
+        eq_(p.checkedout(), 1)
+        eq_(dbapi.connect.call_count, 3)
+
+        c2, c3 = p.connect(), p.connect()
+        eq_(dbapi.connect.call_count, 3)
+
+    @testing.requires.threading_with_mock
+    def test_min_size_warm_up_after_dispose(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=5, max_overflow=0, min_size=2)
+        p.connect().close()
+        self._wait_for(lambda: p.checkedin() == 2)
+        p.dispose()
+        eq_(p.checkedin(), 0)
+
+        c1 = p.connect()
+        self._wait_for(lambda: p.checkedin() == 1)
+        eq_(p.checkedin(), 1)
+        eq_(dbapi.connect.call_count, 4)
+
+    def test_min_size_single_warm_up(self):
+        p = self._queuepool_fixture(pool_size=5, max_overflow=0, min_size=3)
+        with patch("threading.Thread") as thread:
+            p._start_warm_up()
+            p._start_warm_up()
+        eq_(thread.mock_calls[0], call(target=p._warm_up, args=(0, )))
+        eq_(thread.return_value.start.call_count, 1)
+        assert p._warming
+
+    @testing.requires.threading_with_mock
+    def test_min_size_dispose_during_warm_up(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=5, max_overflow=0, min_size=3)
+        connecting = threading.Event()
+        proceed = threading.Event()
+        conns = []
+
+        def connect(*arg, **kw):
+            if threading.current_thread() is not main:
+                connecting.set()
+                proceed.wait(join_timeout)
+            conn = Mock()
+            conns.append(conn)
+            return conn
+        main = threading.current_thread()
+        dbapi.connect = Mock(side_effect=connect)
+
+        c1 = p.connect()
+        connecting.wait(join_timeout)
+        p.dispose()
+        eq_(p.overflow(), -5)
+        proceed.set()
+        self._wait_for(lambda: not p._warming)
+
+        # the old generation's connection is closed and neither
+        # returned to the pool nor subtracted from the overflow
+        eq_(p.checkedin(), 0)
+        eq_(p.overflow(), -5)
+        eq_(dbapi.connect.call_count, 2)
+        eq_(conns[1].close.call_count, 1)
+
+    def test_min_size_exceeds_pool_size(self):
+        assert_raises_message(
+            tsa.exc.ArgumentError,
+            "min_size 6 may not exceed pool_size 5",
+            self._queuepool_fixture, pool_size=5, min_size=6
+        )
+
+    def test_idle_timeout(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=3, max_overflow=0, min_size=1, idle_timeout=10)
+        c1, c2, c3 = p.connect(), p.connect(), p.connect()
+        conns = [c.connection for c in (c1, c2, c3)]
+        c1.close()
+        c2.close()
+        eq_(p.checkedin(), 2)
+
+        now = time.time()
+        with patch("time.time", Mock(return_value=now + 20)):
+            c3.close()
+
+        # the two idle connections are closed; the connection returned
+        # just now remains, which satisfies min_size
+        eq_(p.checkedin(), 1)
+        eq_(p.overflow(), -2)
+        eq_([c.close.called for c in conns], [True, True, False])
+
+        c1 = p.connect()
+        is_(c1.connection, conns[2])
+
+    def test_idle_timeout_respects_min_size(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=3, max_overflow=0, min_size=2, idle_timeout=10)
+        c1, c2 = p.connect(), p.connect()
+        conns = [c1.connection, c2.connection]
+        c1.close()
+
+        now = time.time()
+        with patch("time.time", Mock(return_value=now + 20)):
+            c2.close()
+        eq_(p.checkedin(), 2)
+        eq_([c.close.called for c in conns], [False, False])
+
+    def test_idle_timeout_not_reached(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=3, max_overflow=0, idle_timeout=10)
+        c1, c2 = p.connect(), p.connect()
+        conns = [c1.connection, c2.connection]
+        c1.close()
+        c2.close()
+        eq_(p.checkedin(), 2)
+        eq_([c.close.called for c in conns], [False, False])
+
+    def test_min_size_idle_timeout_recreate(self):
+        p = self._queuepool_fixture(pool_size=3, min_size=2, idle_timeout=5)
+        p2 = p.recreate()
+        eq_(p2._min_size, 2)
+        eq_(p2._idle_timeout, 5)
+
     def test_recycle(self):
         p = self._queuepool_fixture(pool_size=1,
                            max_overflow=0,
@@ -1460,6 +1633,167 @@ class QueuePoolTest(PoolTestBase):
         c2 = p.connect()
         assert c2.connection is not None
 
+class PoolStatsTest(PoolTestBase):
+    def test_histogram_percentile(self):
+        h = pool._Histogram()
+        eq_(h.percentile(50), None)
+        for value in [.0005] * 90 + [.02] * 9 + [7]:
+            h.add(value)
+        eq_(h.percentile(50), .001)
+        eq_(h.percentile(90), .001)
+        eq_(h.percentile(99), .05)
+        eq_(h.percentile(100), 7)
+
+    def test_not_collected(self):
+        p = self._queuepool_fixture(pool_size=1)
+        assert_raises_message(
+            tsa.exc.InvalidRequestError,
+            "Statistics are not collected for this pool",
+            p.stats
+        )
+
+    def test_checkout_checkin(self):
+        p = self._queuepool_fixture(
+            pool_size=2, max_overflow=1, collect_stats=True)
+        c1, c2, c3 = p.connect(), p.connect(), p.connect()
+
+        stats = p.stats()
+        eq_(stats['checkouts'], 3)
+        eq_(stats['connects'], 3)
+        eq_(stats['connect_time']['count'], 3)
+        eq_(stats['checkout_wait']['count'], 3)
+        eq_(stats['hold_time']['count'], 0)
+        eq_(stats['overflow_connections'], 1)
+        eq_(stats['overflow_high_water'], 1)
+        eq_(stats['checkedout'], 3)
+        eq_(stats['overflow'], 1)
+
+        c1.close()
+        c2.close()
+        c3.close()
+        c1 = p.connect()
+        c1.close()
+
+        stats = p.stats()
+        eq_(stats['checkouts'], 4)
+        eq_(stats['connects'], 3)
+        eq_(stats['hold_time']['count'], 4)
+        eq_(stats['overflow_high_water'], 1)
+        eq_(stats['checkedin'], 2)
+        eq_(stats['checkedout'], 0)
+
+    def test_timeout(self):
+        p = self._queuepool_fixture(
+            pool_size=1, max_overflow=0, timeout=.05, collect_stats=True)
+        c1 = p.connect()
+        assert_raises(tsa.exc.TimeoutError, p.connect)
+        eq_(p.stats()['timeouts'], 1)
+        c1.close()
+
+    def test_invalidate(self):
+        p = self._queuepool_fixture(pool_size=1, collect_stats=True)
+        c1 = p.connect()
+        c1.invalidate()
+        c1.close()
+        c1 = p.connect()
+        stats = p.stats()
+        eq_(stats['invalidations'], 1)
+        eq_(stats['connects'], 2)
+
+    def test_reset_stats(self):
+        p = self._queuepool_fixture(pool_size=1, collect_stats=True)
+        p.connect().close()
+        p.reset_stats()
+        stats = p.stats()
+        eq_(stats['checkouts'], 0)
+        eq_(stats['hold_time']['count'], 0)
+        eq_(stats['checkedin'], 1)
+
+    def test_recreate(self):
+        p = self._queuepool_fixture(pool_size=1, collect_stats=True)
+        p.connect().close()
+        p2 = p.recreate()
+        eq_(p2.stats()['checkouts'], 0)
+
+    def test_histogram(self):
+        hist = pool._Histogram()
+        for value in (.0005, .02, .03, 20):
+            hist.add(value)
+        result = hist.as_dict()
+        eq_(result['count'], 4)
+        eq_(result['max'], 20)
+        eq_(result['total'], .0505 + 20)
+        eq_(
+            result['buckets'],
+            [(.001, 1), (.005, 0), (.01, 0), (.05, 2), (.1, 0), (.5, 0),
+             (1, 0), (5, 0), (10, 0), (None, 1)]
+        )
+
+    def test_timing_events(self):
+        p = self._queuepool_fixture(pool_size=1)
+        canary = []
+
+        @event.listens_for(p, "checkout_wait")
+        def checkout_wait(dbapi_con, con_record, wait_time):
+            canary.append(("checkout_wait", dbapi_con, wait_time >= 0))
+
+        @event.listens_for(p, "checkin_hold")
+        def checkin_hold(dbapi_con, con_record, hold_time):
+            canary.append(("checkin_hold", dbapi_con, hold_time >= 0))
+
+        c1 = p.connect()
+        dbapi_con = c1.connection
+        c1.close()
+        eq_(
+            canary,
+            [("checkout_wait", dbapi_con, True),
+             ("checkin_hold", dbapi_con, True)]
+        )
+
+        p2 = p.recreate()
+        c1 = p2.connect()
+        dbapi_con = c1.connection
+        c1.close()
+        eq_(
+            canary[2:],
+            [("checkout_wait", dbapi_con, True),
+             ("checkin_hold", dbapi_con, True)]
+        )
+
+    def test_timing_events_removed(self):
+        p = self._queuepool_fixture(pool_size=1)
+        eq_(p._has_timing_events, False)
+
+        def checkout_wait(dbapi_con, con_record, wait_time):
+            pass
+
+        event.listen(p, "checkout_wait", checkout_wait)
+        eq_(p._has_timing_events, True)
+        event.remove(p, "checkout_wait", checkout_wait)
+        eq_(p._has_timing_events, False)
+
+        c1 = p.connect()
+        eq_(c1._connection_record._checkout_time, None)
+        c1.close()
+
+    def test_timing_events_class_level_removed(self):
+        p1 = self._queuepool_fixture(pool_size=1)
+
+        def checkin_hold(dbapi_con, con_record, hold_time):
+            pass
+
+        event.listen(pool.Pool, "checkin_hold", checkin_hold)
+        try:
+            p2 = self._queuepool_fixture(pool_size=1)
+            eq_(p1._has_timing_events, True)
+            eq_(p2._has_timing_events, True)
+        finally:
+            event.remove(pool.Pool, "checkin_hold", checkin_hold)
+        eq_(p1._has_timing_events, False)
+        eq_(p2._has_timing_events, False)
+        eq_(self._queuepool_fixture(pool_size=1)._has_timing_events, False)
+
+
 class ResetOnReturnTest(PoolTestBase):
     def _fixture(self, **kw):
         dbapi = Mock()
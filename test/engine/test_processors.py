@@ -1,5 +1,6 @@
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import assert_raises_message, eq_
+from sqlalchemy import exc
 
 
 class _DateProcessorTest(fixtures.TestBase):
@@ -65,6 +66,58 @@ class CDateProcessorTest(_DateProcessorTest):
         cls.module = cprocessors
 
 
+class _ProcessColumnTest(fixtures.TestBase):
+    def test_no_processor(self):
+        eq_(
+            self.module.process_column(None, (1, None, 'x')),
+            [1, None, 'x']
+        )
+
+    def test_c_level_processor(self):
+        eq_(
+            self.module.process_column(self.module.to_str, (1, None, 2.5)),
+            ['1', None, '2.5']
+        )
+
+    def test_python_processor(self):
+        eq_(
+            self.module.process_column(
+                lambda value: "x%s" % value, [1, None]),
+            ['x1', 'xNone']
+        )
+
+    def test_empty(self):
+        eq_(self.module.process_column(self.module.to_str, ()), [])
+
+    def test_processor_error(self):
+        assert_raises_message(
+            ValueError,
+            "Couldn't parse date string: '5:a'",
+            self.module.process_column,
+            self.module.str_to_date, ("2012-10-15", "5:a")
+        )
+
+
+class PyProcessColumnTest(_ProcessColumnTest):
+    @classmethod
+    def setup_class(cls):
+        from sqlalchemy import processors
+        cls.module = type("util", (object,),
+                dict(
+                    (k, staticmethod(v))
+                        for k, v in list(processors.py_fallback().items())
+                )
+            )
+
+
+class CProcessColumnTest(_ProcessColumnTest):
+    __requires__ = ('cextensions',)
+    @classmethod
+    def setup_class(cls):
+        from sqlalchemy import cprocessors
+        cls.module = cprocessors
+
+
 class _DistillArgsTest(fixtures.TestBase):
     def test_distill_none(self):
         eq_(
@@ -166,3 +219,65 @@ class CDistillArgsTest(_DistillArgsTest):
     def setup_class(cls):
         from sqlalchemy import cutils as util
         cls.module = util
+
+
+class _ProcessTuplesTest(fixtures.TestBase):
+    def test_positional(self):
+        eq_(
+            self.module._process_tuples(
+                [(1, "a"), (2, "b")], (1, 0, -1), (None, str, None),
+                (None, None, "x"), None, 2, tuple),
+            [("a", "1", "x"), ("b", "2", "x")]
+        )
+
+    def test_positional_list_format(self):
+        eq_(
+            self.module._process_tuples(
+                [[1, "a"]], (0, 1), (None, None), (None, None),
+                None, 2, list),
+            [[1, "a"]]
+        )
+
+    def test_named(self):
+        eq_(
+            self.module._process_tuples(
+                [(1, "a"), (2, "b")], (1, 0, -1), (None, str, None),
+                (None, None, "x"), ("p", "q", "r"), 2, tuple),
+            [{"p": "a", "q": "1", "r": "x"}, {"p": "b", "q": "2", "r": "x"}]
+        )
+
+    def test_no_rows(self):
+        eq_(
+            self.module._process_tuples(
+                [], (0, ), (None, ), (None, ), None, 1, tuple),
+            []
+        )
+
+    def test_wrong_length(self):
+        assert_raises_message(
+            exc.ArgumentError,
+            "Positional parameter set 1 contains 1 values; expected 2",
+            self.module._process_tuples,
+            [(1, "a"), (2, )], (0, 1), (None, None), (None, None),
+            None, 2, tuple
+        )
+
+
+class PyProcessTuplesTest(_ProcessTuplesTest):
+    @classmethod
+    def setup_class(cls):
+        from sqlalchemy.engine import util
+        cls.module = type("util", (object,),
+                dict(
+                    (k, staticmethod(v))
+                        for k, v in list(util.py_fallback().items())
+                )
+        )
+
+
+class CProcessTuplesTest(_ProcessTuplesTest):
+    __requires__ = ('cextensions', )
+    @classmethod
+    def setup_class(cls):
+        from sqlalchemy import cutils as util
+        cls.module = util
@@ -0,0 +1,238 @@
+from sqlalchemy import MetaData, Integer, String, select, func, \
+    exc as sa_exc
+from sqlalchemy.testing.schema import Table, Column
+from sqlalchemy.testing import fixtures, eq_, is_, assert_raises, \
+    assert_raises_message
+import os
+import shutil
+import tempfile
+
+
+class AsyncTest(fixtures.TestBase):
+    __requires__ = 'asyncio',
+
+    def setup(self):
+        import asyncio
+        from sqlalchemy.ext import asyncio as sa_asyncio
+
+        self.sa_asyncio = sa_asyncio
+        self.loop = asyncio.new_event_loop()
+        self.dir = tempfile.mkdtemp()
+
+        metadata = MetaData()
+        self.table = Table(
+            'data', metadata,
+            Column('id', Integer, primary_key=True),
+            Column('x', String(20)))
+        self.engine = self._engine()
+        metadata.create_all(self.engine.sync_engine)
+
+    def teardown(self):
+        self._run(self.engine.dispose())
+        self.loop.close()
+        shutil.rmtree(self.dir)
+
+    def _engine(self, **kw):
+        kw.setdefault('loop', self.loop)
+        return self.sa_asyncio.create_async_engine(
+            "sqlite:///%s" % os.path.join(self.dir, "test.db"), **kw)
+
+    def _run(self, future):
+        return self.loop.run_until_complete(future)
+
+    def _count(self):
+        return self.engine.sync_engine.scalar(
+            select([func.count(self.table.c.id)]))
+
+
+class AsyncConnectionTest(AsyncTest):
+
+    def test_execute_fetch(self):
+        conn = self._run(self.engine.connect())
+        result = self._run(
+            conn.execute(self.table.insert(), [{'x': 'a'}, {'x': 'b'}]))
+        eq_(result.rowcount, 2)
+
+        result = self._run(
+            conn.execute(
+                select([self.table.c.id, self.table.c.x]).
+                order_by(self.table.c.id)))
+        eq_(result.keys(), ['id', 'x'])
+        eq_(self._run(result.fetchone()), (1, 'a'))
+        eq_(self._run(result.fetchall()), [(2, 'b')])
+        self._run(conn.close())
+
+    def test_fetchmany(self):
+        conn = self._run(self.engine.connect())
+        self._run(
+            conn.execute(
+                self.table.insert(), [{'x': str(i)} for i in range(5)]))
+        result = self._run(
+            conn.execute(select([self.table.c.x]).order_by(self.table.c.id)))
+        eq_(self._run(result.fetchmany(3)), [('0', ), ('1', ), ('2', )])
+        eq_(self._run(result.fetchmany(3)), [('3', ), ('4', )])
+        self._run(conn.close())
+
+    def test_scalar_first(self):
+        conn = self._run(self.engine.connect())
+        self._run(conn.execute(self.table.insert(), x='a'))
+        eq_(
+            self._run(conn.scalar(select([self.table.c.x]))),
+            'a'
+        )
+        result = self._run(conn.execute(select([self.table.c.x])))
+        eq_(self._run(result.first()), ('a', ))
+        self._run(conn.close())
+
+    def test_inserted_primary_key(self):
+        conn = self._run(self.engine.connect())
+        result = self._run(conn.execute(self.table.insert(), x='a'))
+        eq_(result.inserted_primary_key, [1])
+        self._run(conn.close())
+
+    def test_transaction_commit(self):
+        conn = self._run(self.engine.connect())
+        trans = self._run(conn.begin())
+        assert conn.in_transaction()
+        self._run(conn.execute(self.table.insert(), x='a'))
+        self._run(trans.commit())
+        assert not conn.in_transaction()
+        self._run(conn.close())
+        eq_(self._count(), 1)
+
+    def test_transaction_rollback(self):
+        conn = self._run(self.engine.connect())
+        trans = self._run(conn.begin())
+        self._run(conn.execute(self.table.insert(), x='a'))
+        self._run(trans.rollback())
+        self._run(conn.close())
+        eq_(self._count(), 0)
+
+    def test_close_rolls_back(self):
+        conn = self._run(self.engine.connect())
+        self._run(conn.begin())
+        self._run(conn.execute(self.table.insert(), x='a'))
+        self._run(conn.close())
+        eq_(self._count(), 0)
+        eq_(self.engine.pool.checkedin(), 1)
+
+    def test_closed(self):
+        conn = self._run(self.engine.connect())
+        self._run(conn.close())
+        is_(conn.closed, True)
+        assert_raises_message(
+            sa_exc.ResourceClosedError,
+            "This Connection is closed",
+            conn.execute, select([self.table])
+        )
+        # a second close is a no-op
+        self._run(conn.close())
+
+    def test_errors_propagate(self):
+        conn = self._run(self.engine.connect())
+        assert_raises(
+            sa_exc.DBAPIError,
+            self._run, conn.execute("select * from nonexistent")
+        )
+        self._run(conn.close())
+
+    def test_context_managers(self):
+        conn = self._run(self.engine.connect())
+        eq_(self._run(conn.__aenter__()), conn)
+        trans = self._run(conn.begin())
+        eq_(self._run(trans.__aenter__()), trans)
+        self._run(conn.execute(self.table.insert(), x='a'))
+        self._run(trans.__aexit__(None, None, None))
+        trans = self._run(conn.begin())
+        self._run(conn.execute(self.table.insert(), x='b'))
+        self._run(trans.__aexit__(Exception, Exception(), None))
+        self._run(conn.__aexit__(None, None, None))
+        is_(conn.closed, True)
+        eq_(self._count(), 1)
+
+
+class AsyncPoolTest(AsyncTest):
+
+    def test_reuse(self):
+        conn = self._run(self.engine.connect())
+        sync_conn = conn.sync_connection
+        self._run(conn.close())
+        conn = self._run(self.engine.connect())
+        is_(conn.sync_connection, sync_conn)
+        self._run(conn.close())
+
+    def test_overflow_closed_on_release(self):
+        engine = self._engine(pool_size=1, max_overflow=1)
+        c1 = self._run(engine.connect())
+        c2 = self._run(engine.connect())
+        eq_(engine.pool.overflow(), 1)
+        self._run(c1.close())
+        self._run(c2.close())
+        eq_(engine.pool.overflow(), 0)
+        eq_(engine.pool.checkedin(), 1)
+        self._run(engine.dispose())
+
+    def test_fifo_waiters(self):
+        engine = self._engine(pool_size=1, max_overflow=0)
+        c1 = self._run(engine.connect())
+        waiters = [engine.connect() for i in range(3)]
+        eq_(engine.pool.waiting(), 3)
+        for w in waiters:
+            assert not w.done()
+
+        received = []
+        conn = c1
+        for w in waiters:
+            self._run(conn.close())
+            conn = self._run(w)
+            received.append(w)
+            for other in waiters[len(received):]:
+                assert not other.done()
+        eq_(received, waiters)
+        self._run(conn.close())
+        eq_(engine.pool.checkedout(), 0)
+        self._run(engine.dispose())
+
+    def test_cancelled_waiter_skipped(self):
+        engine = self._engine(pool_size=1, max_overflow=0)
+        c1 = self._run(engine.connect())
+        w1 = engine.connect()
+        w2 = engine.connect()
+        w1.cancel()
+        self._run(c1.close())
+        c2 = self._run(w2)
+        self._run(c2.close())
+        eq_(engine.pool.checkedin(), 1)
+        self._run(engine.dispose())
+
+    def test_timeout(self):
+        engine = self._engine(pool_size=1, max_overflow=0, pool_timeout=.1)
+        c1 = self._run(engine.connect())
+        assert_raises_message(
+            sa_exc.TimeoutError,
+            "AsyncPool limit of size 1 overflow 0 reached",
+            self._run, engine.connect()
+        )
+        eq_(engine.pool.waiting(), 0)
+        self._run(c1.close())
+        self._run(engine.dispose())
+
+    def test_connect_error(self):
+        engine = self.sa_asyncio.create_async_engine(
+            "sqlite:///%s" % os.path.join(self.dir, "nonexistent", "test.db"),
+            loop=self.loop)
+        assert_raises(
+            sa_exc.DBAPIError,
+            self._run, engine.connect()
+        )
+        eq_(engine.pool.checkedout(), 0)
+
+    def test_dispose(self):
+        c1 = self._run(self.engine.connect())
+        c2 = self._run(self.engine.connect())
+        self._run(c1.close())
+        self._run(c2.close())
+        eq_(self.engine.pool.checkedin(), 2)
+        self._run(self.engine.dispose())
+        eq_(self.engine.pool.checkedin(), 0)
+        eq_(self.engine.pool.checkedout(), 0)
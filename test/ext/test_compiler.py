@@ -8,7 +8,7 @@ from sqlalchemy.schema import DDLElement, CreateColumn, CreateTable
 from sqlalchemy.ext.compiler import compiles, deregister
 from sqlalchemy import exc
 from sqlalchemy.sql import table, column, visitors
-from sqlalchemy.testing import assert_raises_message
+from sqlalchemy.testing import assert_raises_message, eq_
 from sqlalchemy.testing import fixtures, AssertsCompiledSQL
 
 class UserDefinedTest(fixtures.TestBase, AssertsCompiledSQL):
@@ -34,6 +34,18 @@ class UserDefinedTest(fixtures.TestBase, AssertsCompiledSQL):
             "SELECT >>x<<, >>y<< WHERE >>MYTHINGY!<< = :MYTHINGY!_1"
         )
 
+    def test_subclass_not_structurally_cached(self):
+        class MyThingy(ColumnClause):
+            pass
+
+        @compiles(MyThingy)
+        def visit_thingy(thingy, compiler, **kw):
+            return ">>%s<<" % thingy.name
+
+        assert MyThingy._cache_key_traversal is None
+        assert ColumnClause._cache_key_traversal is not None
+        eq_(select([MyThingy('x')])._generate_cache_key(), None)
+
     def test_create_column_skip(self):
         @compiles(CreateColumn)
         def skip_xmin(element, compiler, **kw):
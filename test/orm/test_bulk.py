@@ -1,9 +1,9 @@
 from sqlalchemy import testing
-from sqlalchemy.testing import eq_
+from sqlalchemy.testing import eq_, assert_raises_message, mock
 from sqlalchemy.testing.schema import Table, Column
 from sqlalchemy.testing import fixtures
-from sqlalchemy import Integer, String, ForeignKey
-from sqlalchemy.orm import mapper, Session
+from sqlalchemy import Integer, String, ForeignKey, exc
+from sqlalchemy.orm import mapper, relationship, Session
 from sqlalchemy.testing.assertsql import CompiledSQL
 from test.orm import _fixtures
 
@@ -104,6 +104,219 @@ class BulkInsertUpdateTest(BulkTest, _fixtures.FixtureTest):
             )
         )
 
+    def test_bulk_insert_use_copy(self):
+        User, = self.classes("User",)
+        users = self.tables.users
+
+        canary = []
+        s = Session()
+        dialect = testing.db.dialect
+        with mock.patch.object(dialect, "supports_copy_from", True), \
+                mock.patch.object(
+                    dialect, "copy_from", create=True) as copy_from:
+            copy_from.side_effect = lambda conn, table, rows, columns: \
+                canary.append((table, list(rows), columns))
+            s.bulk_insert_mappings(
+                User,
+                [{'id': 1, 'name': 'u1'}, {'id': 2, 'name': 'u2'},
+                 {'id': 3}, {'id': 4, 'name': 'u4'}],
+                use_copy=True
+            )
+        eq_(
+            canary,
+            [
+                (users, [{'id': 1, 'name': 'u1'}, {'id': 2, 'name': 'u2'}],
+                 ('id', 'name')),
+                (users, [{'id': 3}], ('id', )),
+                (users, [{'id': 4, 'name': 'u4'}], ('id', 'name')),
+            ]
+        )
+
+    def test_bulk_insert_use_copy_return_defaults(self):
+        User, = self.classes("User",)
+
+        s = Session()
+        assert_raises_message(
+            exc.ArgumentError,
+            "return_defaults is not supported with use_copy",
+            s.bulk_insert_mappings,
+            User, [{'name': 'u1'}], return_defaults=True, use_copy=True
+        )
+
+    @testing.fails_if(
+        lambda: testing.db.dialect.supports_copy_from,
+        "dialect supports COPY FROM")
+    def test_bulk_insert_use_copy_not_supported(self):
+        User, = self.classes("User",)
+
+        s = Session()
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "dialect does not support COPY FROM",
+            s.bulk_insert_mappings,
+            User, [{'id': 1, 'name': 'u1'}], use_copy=True
+        )
+
+    @testing.only_on('postgresql+psycopg2')
+    def test_bulk_insert_use_copy_round_trip(self):
+        User, = self.classes("User",)
+
+        s = Session()
+        s.bulk_insert_mappings(
+            User,
+            [{'id': i, 'name': 'u%d' % i} for i in range(1, 101)],
+            use_copy=True
+        )
+        eq_(
+            s.query(User.id, User.name).order_by(User.id).all(),
+            [(i, 'u%d' % i) for i in range(1, 101)]
+        )
+
+
+class BulkRelationshipTest(BulkTest, _fixtures.FixtureTest):
+
+    def _assert_users_addresses(self, s):
+        User, Address = self.classes("User", "Address")
+        eq_(
+            s.query(Address.email_address, User.name).
+            join(User, Address.user_id == User.id).
+            order_by(Address.email_address).all(),
+            [('a1', 'u1'), ('a2', 'u1'), ('a3', 'u2')]
+        )
+
+    def test_one_to_many(self):
+        User, Address = self.classes("User", "Address")
+        users, addresses = self.tables("users", "addresses")
+        mapper(User, users, properties={
+            'addresses': relationship(Address)
+        })
+        mapper(Address, addresses)
+
+        s = Session()
+        objects = [
+            User(name='u1', addresses=[
+                Address(email_address='a1'), Address(email_address='a2')]),
+            User(name='u2', addresses=[Address(email_address='a3')])
+        ]
+
+        with self.sql_execution_asserter() as asserter:
+            s.bulk_save_objects(objects, include_relationships=True)
+
+        asserter.assert_(
+            CompiledSQL(
+                "INSERT INTO users (name) VALUES (:name)",
+                [{'name': 'u1'}]
+            ),
+            CompiledSQL(
+                "INSERT INTO users (name) VALUES (:name)",
+                [{'name': 'u2'}]
+            ),
+            CompiledSQL(
+                "INSERT INTO addresses (user_id, email_address) "
+                "VALUES (:user_id, :email_address)",
+                lambda ctx: [
+                    {'user_id': objects[0].id, 'email_address': 'a1'},
+                    {'user_id': objects[0].id, 'email_address': 'a2'},
+                    {'user_id': objects[1].id, 'email_address': 'a3'}
+                ]
+            ),
+        )
+        assert objects[0] not in s
+        self._assert_users_addresses(s)
+
+    def test_many_to_one(self):
+        User, Address = self.classes("User", "Address")
+        users, addresses = self.tables("users", "addresses")
+        mapper(User, users)
+        mapper(Address, addresses, properties={
+            'user': relationship(User)
+        })
+
+        s = Session()
+        u1, u2 = User(name='u1'), User(name='u2')
+        objects = [
+            Address(email_address='a1', user=u1),
+            Address(email_address='a2', user=u1),
+            Address(email_address='a3', user=u2)
+        ]
+
+        with self.sql_execution_asserter() as asserter:
+            s.bulk_save_objects(objects, include_relationships=True)
+
+        asserter.assert_(
+            CompiledSQL(
+                "INSERT INTO users (name) VALUES (:name)",
+                [{'name': 'u1'}]
+            ),
+            CompiledSQL(
+                "INSERT INTO users (name) VALUES (:name)",
+                [{'name': 'u2'}]
+            ),
+            CompiledSQL(
+                "INSERT INTO addresses (user_id, email_address) "
+                "VALUES (:user_id, :email_address)",
+                lambda ctx: [
+                    {'user_id': u1.id, 'email_address': 'a1'},
+                    {'user_id': u1.id, 'email_address': 'a2'},
+                    {'user_id': u2.id, 'email_address': 'a3'}
+                ]
+            ),
+        )
+        self._assert_users_addresses(s)
+
+    def test_persistent_parent(self):
+        User, Address = self.classes("User", "Address")
+        users, addresses = self.tables("users", "addresses")
+        mapper(User, users, properties={
+            'addresses': relationship(Address)
+        })
+        mapper(Address, addresses)
+
+        s = Session()
+        s.add_all([User(name='u1'), User(name='u2')])
+        s.commit()
+        u1, u2 = s.query(User).order_by(User.id).all()
+        eq_(u1.addresses, [])
+        eq_(u2.addresses, [])
+        s.close()
+
+        u1.addresses.extend(
+            [Address(email_address='a1'), Address(email_address='a2')])
+        u2.addresses.append(Address(email_address='a3'))
+
+        with self.sql_execution_asserter() as asserter:
+            s.bulk_save_objects([u1, u2], include_relationships=True)
+
+        asserter.assert_(
+            CompiledSQL(
+                "INSERT INTO addresses (user_id, email_address) "
+                "VALUES (:user_id, :email_address)",
+                [
+                    {'user_id': u1.id, 'email_address': 'a1'},
+                    {'user_id': u1.id, 'email_address': 'a2'},
+                    {'user_id': u2.id, 'email_address': 'a3'}
+                ]
+            ),
+        )
+        self._assert_users_addresses(s)
+
+    def test_self_referential_pending_not_supported(self):
+        Node = self.classes.Node
+        nodes = self.tables.nodes
+        mapper(Node, nodes, properties={
+            'children': relationship(Node)
+        })
+
+        s = Session()
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "Relationship Node.children links two pending objects of "
+            "the same mapper hierarchy",
+            s.bulk_save_objects,
+            [Node(data='n1', children=[Node(data='n2')])],
+            include_relationships=True
+        )
+
 
 class BulkInheritanceTest(BulkTest, fixtures.MappedTest):
     @classmethod
@@ -10,7 +10,7 @@ from sqlalchemy.types import TypeDecorator
 from sqlalchemy.testing.schema import Table
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.orm import mapper, relationship, create_session, Session
-from sqlalchemy.testing import eq_
+from sqlalchemy.testing import eq_, is_
 from sqlalchemy.testing import fixtures
 from test.orm import _fixtures
 from sqlalchemy.testing.assertsql import CompiledSQL
@@ -552,6 +552,171 @@ class LazyTest(_fixtures.FixtureTest):
         self.assert_sql_count(testing.db, go, 1)
 
 
+class BatchLoadTest(_fixtures.FixtureTest):
+    run_inserts = 'once'
+    run_deletes = None
+
+    def _user_address_fixture(self, lazy="batch"):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(
+                mapper(Address, addresses), lazy=lazy,
+                order_by=addresses.c.id)
+        })
+        return User, Address
+
+    def test_one_to_many(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+
+        users = sess.query(User).order_by(User.id).all()
+
+        def go():
+            for u in users:
+                u.addresses
+        self.assert_sql_execution(
+            testing.db,
+            go,
+            CompiledSQL(
+                "SELECT addresses.id AS addresses_id, "
+                "addresses.user_id AS addresses_user_id, "
+                "addresses.email_address AS addresses_email_address "
+                "FROM addresses WHERE addresses.user_id IN "
+                "(:user_id_1, :user_id_2, :user_id_3, :user_id_4) "
+                "ORDER BY addresses.id",
+                {"user_id_1": 7, "user_id_2": 8,
+                 "user_id_3": 9, "user_id_4": 10}
+            )
+        )
+        eq_(users, self.static.user_address_result)
+
+    def test_option(self):
+        User, Address = self._user_address_fixture(lazy="select")
+        sess = create_session()
+
+        users = sess.query(User).options(sa.orm.batchload(User.addresses)).\
+            order_by(User.id).all()
+
+        def go():
+            eq_(users, self.static.user_address_result)
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_batch_size(self):
+        User, Address = self._user_address_fixture(lazy="select")
+        sess = create_session()
+
+        users = sess.query(User).options(
+            sa.orm.batchload(User.addresses, batch_size=3)).\
+            order_by(User.id).all()
+
+        def go():
+            eq_(users, self.static.user_address_result)
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_siblings_scoped_to_query(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+
+        u7 = sess.query(User).filter_by(id=7).one()
+        rest = sess.query(User).filter(User.id > 7).order_by(User.id).all()
+
+        def go():
+            eq_(u7.addresses, [Address(id=1)])
+        self.assert_sql_count(testing.db, go, 1)
+
+        def go():
+            for u in rest:
+                u.addresses
+        self.assert_sql_count(testing.db, go, 1)
+        assert 'addresses' in rest[-1].__dict__
+
+    def test_siblings_scoped_to_session(self):
+        User, Address = self._user_address_fixture()
+        s1, s2 = create_session(), create_session()
+
+        u1 = s1.query(User).order_by(User.id).all()
+        u2 = s2.query(User).order_by(User.id).all()
+
+        def go():
+            u1[0].addresses
+        self.assert_sql_count(testing.db, go, 1)
+        assert 'addresses' in u1[-1].__dict__
+        for u in u2:
+            assert 'addresses' not in u.__dict__
+
+        def go():
+            eq_(u2, self.static.user_address_result)
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_loader_pickles_as_lazy(self):
+        from sqlalchemy.util import pickle
+        from sqlalchemy.orm.strategies import LoadLazyAttribute
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+
+        users = sess.query(User).order_by(User.id).all()
+        state = attributes.instance_state(users[0])
+        loader = pickle.loads(pickle.dumps(state.callables['addresses']))
+        is_(type(loader), LoadLazyAttribute)
+
+        # plain lazy load of the one instance
+        def go():
+            eq_(loader(state),
+                self.static.user_address_result[0].addresses)
+        self.assert_sql_count(testing.db, go, 1)
+        assert 'addresses' not in users[1].__dict__
+
+    def test_already_loaded_not_replaced(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+
+        users = sess.query(User).order_by(User.id).all()
+        users[1].addresses = []
+
+        users[0].addresses
+        eq_(users[1].addresses, [])
+        eq_(len(users[2].addresses), 1)
+
+    def test_many_to_one(self):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User)
+
+        mapper(Address, addresses, properties={
+            'user': relationship(mapper(User, users), lazy="batch")
+        })
+        sess = create_session()
+
+        address_list = sess.query(Address).order_by(Address.id).all()
+
+        def go():
+            eq_(
+                [a.user.id for a in address_list],
+                [7, 8, 8, 8, 9]
+            )
+        self.assert_sql_count(testing.db, go, 1)
+
+        # related objects already in the identity map are used directly
+        sess.expire_all()
+        address_list = sess.query(Address).order_by(Address.id).all()
+        user_list = sess.query(User).all()
+        eq_(len(user_list), 4)
+
+        def go():
+            eq_(
+                [a.user.id for a in address_list],
+                [7, 8, 8, 8, 9]
+            )
+        self.assert_sql_count(testing.db, go, 0)
+
+
 class GetterStateTest(_fixtures.FixtureTest):
 
     """test lazyloader on non-existent attribute returns
@@ -8,13 +8,14 @@ from sqlalchemy.engine import default
 from sqlalchemy.orm import (
     attributes, mapper, relationship, create_session, synonym, Session,
     aliased, column_property, joinedload_all, joinedload, Query, Bundle,
-    subqueryload, backref, lazyload, defer)
+    subqueryload, backref, lazyload, defer, selectinload)
 from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing.schema import Table, Column
 import sqlalchemy as sa
 from sqlalchemy.testing.assertions import (
-    eq_, assert_raises, assert_raises_message, expect_warnings)
+    eq_, is_, assert_raises, assert_raises_message, expect_warnings)
 from sqlalchemy.testing import fixtures, AssertsCompiledSQL, assert_warnings
+from sqlalchemy.testing import mock
 from test.orm import _fixtures
 from sqlalchemy.orm.util import join, with_parent
 
@@ -2482,6 +2483,211 @@ class YieldTest(_fixtures.FixtureTest):
         self.assert_sql_count(testing.db, go, 1)
 
 
+class StreamTest(_fixtures.FixtureTest):
+    run_setup_mappers = 'each'
+    run_inserts = 'each'
+
+    def _mappings(self, addresses_lazy=True):
+        User, Address = self.classes("User", "Address")
+        users, addresses = self.tables("users", "addresses")
+        mapper(User, users, properties={
+            "addresses": relationship(
+                Address, lazy=addresses_lazy, order_by=addresses.c.id)
+        })
+        mapper(Address, addresses)
+
+    def test_partitions(self):
+        self._mappings()
+        User = self.classes.User
+
+        sess = create_session()
+        q = sess.query(User).order_by(User.id).stream(3)
+        eq_(
+            [[u.id for u in partition] for partition in q],
+            [[7, 8, 9], [10]]
+        )
+
+    def test_execution_options(self):
+        self._mappings()
+        User = self.classes.User
+
+        sess = create_session()
+        q = sess.query(User)
+        with mock.patch.object(
+                Query, "_execute_and_instances",
+                return_value=iter(())) as execute:
+            list(q.stream(10))
+        context = execute.mock_calls[0][1][0]
+        is_(context.partitioned, True)
+        eq_(context.query._yield_per, 10)
+        eq_(context.query._execution_options, {"stream_results": True})
+
+    def test_expunge(self):
+        self._mappings()
+        User = self.classes.User
+
+        sess = create_session()
+        partitions = sess.query(User).order_by(User.id).stream(2)
+        first = next(partitions)
+        for u in first:
+            assert u in sess
+        second = next(partitions)
+        for u in first:
+            assert u not in sess
+        for u in second:
+            assert u in sess
+        assert_raises(StopIteration, next, partitions)
+        for u in second:
+            assert u not in sess
+        eq_(len(sess.identity_map), 0)
+
+    def test_no_expunge(self):
+        self._mappings()
+        User = self.classes.User
+
+        sess = create_session()
+        users = [
+            u for partition in sess.query(User).stream(2, expunge=False)
+            for u in partition
+        ]
+        eq_(len(users), 4)
+        for u in users:
+            assert u in sess
+
+    def test_expunge_tuples(self):
+        self._mappings()
+        User, Address = self.classes("User", "Address")
+
+        sess = create_session()
+        partitions = list(
+            sess.query(User, Address.id, Address).join(User.addresses).
+            order_by(Address.id).stream(2))
+        eq_(
+            [[(u.id, a_id, a.id) for u, a_id, a in partition]
+             for partition in partitions],
+            [[(7, 1, 1), (8, 2, 2)], [(8, 3, 3), (8, 4, 4)], [(9, 5, 5)]]
+        )
+        eq_(len(sess.identity_map), 0)
+
+    def test_columns(self):
+        self._mappings()
+        User = self.classes.User
+
+        sess = create_session()
+        eq_(
+            list(sess.query(User.id).order_by(User.id).stream(3)),
+            [[(7, ), (8, ), (9, )], [(10, )]]
+        )
+
+    def test_selectinload(self):
+        self._mappings()
+        User, Address = self.classes("User", "Address")
+
+        sess = create_session()
+        q = sess.query(User).options(selectinload(User.addresses)).\
+            order_by(User.id)
+
+        def go():
+            eq_(
+                [
+                    [(u.id, [a.id for a in u.addresses]) for u in partition]
+                    for partition in q.stream(2)
+                ],
+                [[(7, [1]), (8, [2, 3, 4])], [(9, [5]), (10, [])]]
+            )
+        self.assert_sql_count(testing.db, go, 3)
+
+    def test_no_joinedload_collection(self):
+        self._mappings(addresses_lazy="joined")
+        User = self.classes.User
+
+        sess = create_session()
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            "The yield_per Query option is currently not compatible with "
+            "joined collection eager loading.",
+            sess.query(User).stream, 2
+        )
+
+
+class PlainTuplesTest(QueryTest):
+
+    def _assert_plain(self, rows, expected):
+        eq_(rows, expected)
+        for row in rows:
+            is_(type(row), tuple)
+
+    def test_columns(self):
+        User = self.classes.User
+
+        sess = create_session()
+        q = sess.query(User.id, User.name).order_by(User.id).plain_tuples()
+        self._assert_plain(
+            q.all(),
+            [(7, 'jack'), (8, 'ed'), (9, 'fred'), (10, 'chuck')]
+        )
+
+    def test_single_column(self):
+        User = self.classes.User
+
+        sess = create_session()
+        q = sess.query(User.id).order_by(User.id).plain_tuples()
+        self._assert_plain(q.all(), [(7, ), (8, ), (9, ), (10, )])
+
+    def test_expressions_aliased(self):
+        User = self.classes.User
+
+        sess = create_session()
+        ua = aliased(User)
+        q = sess.query(ua.id, func.upper(ua.name)).\
+            filter(ua.id < 9).order_by(ua.id).plain_tuples()
+        self._assert_plain(q.all(), [(7, 'JACK'), (8, 'ED')])
+
+    def test_from_self(self):
+        User = self.classes.User
+
+        sess = create_session()
+        q = sess.query(User.name, User.id).filter(User.id > 8).\
+            from_self().order_by(User.id).plain_tuples()
+        self._assert_plain(q.all(), [('fred', 9), ('chuck', 10)])
+
+    def test_entities(self):
+        User, Address = self.classes("User", "Address")
+
+        sess = create_session()
+        q = sess.query(User, Address.id).join(User.addresses).\
+            filter(Address.id < 3).order_by(Address.id).plain_tuples()
+        rows = q.all()
+        self._assert_plain(
+            rows,
+            [(sess.query(User).get(7), 1), (sess.query(User).get(8), 2)]
+        )
+
+    def test_single_entity(self):
+        User = self.classes.User
+
+        sess = create_session()
+        eq_(
+            sess.query(User).order_by(User.id).plain_tuples().all(),
+            sess.query(User).order_by(User.id).all()
+        )
+
+    def test_yield_per(self):
+        User = self.classes.User
+
+        sess = create_session()
+        q = sess.query(User.id).order_by(User.id).plain_tuples().yield_per(3)
+        self._assert_plain(list(q), [(7, ), (8, ), (9, ), (10, )])
+
+    def test_default_keyed_tuples(self):
+        User = self.classes.User
+
+        sess = create_session()
+        row = sess.query(User.id, User.name).filter(User.id == 7).one()
+        eq_(row.name, 'jack')
+        assert type(row) is not tuple
+
+
 class HintsTest(QueryTest, AssertsCompiledSQL):
     __dialect__ = 'default'
 
@@ -0,0 +1,325 @@
+from sqlalchemy.testing import eq_
+from sqlalchemy import testing
+from sqlalchemy.testing.schema import Table, Column
+from sqlalchemy import Integer, String, ForeignKeyConstraint
+from sqlalchemy.orm import selectinload, selectinload_all, \
+    mapper, relationship, create_session
+from sqlalchemy.testing.assertsql import CompiledSQL
+from sqlalchemy.testing import fixtures
+from test.orm.test_subquery_relations import _EagerTest, \
+    _LoadOnExistingTest, _OrderBySecondaryTest, \
+    _BaseRelationFromJoinedSubclassTest, \
+    _SubRelationFromJoinedSubclassMultiLevelTest, _SelfReferentialTest, \
+    _InheritanceToRelatedTest, _CyclicalInheritingEagerTestOne, \
+    _CyclicalInheritingEagerTestTwo, _JoinedNoLoadConflictTest
+
+
+# tests common to the "subquery" and "selectin" loaders are in
+# test_subquery_relations; they are run against "selectin" loading here,
+# along with tests which are specific to it.
+class _SelectInLoader(object):
+    lazy = 'selectin'
+    loader = staticmethod(selectinload)
+    loader_all = staticmethod(selectinload_all)
+
+
+class EagerTest(_SelectInLoader, _EagerTest):
+    def test_one_to_many_omits_join(self):
+        users, Address, addresses, User = (self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(
+                mapper(Address, addresses), order_by=Address.id)
+        })
+        sess = create_session()
+
+        q = sess.query(User).options(selectinload(User.addresses)).\
+            filter(User.id.in_([7, 8])).order_by(User.id).limit(5)
+
+        def go():
+            eq_(q.all(), self.static.user_address_result[0:2])
+
+        # the parent query, including its LIMIT, is not run a second time;
+        # the related rows are selected using the loaded identities
+        self.assert_sql_execution(
+            testing.db,
+            go,
+            CompiledSQL(
+                "SELECT users.id AS users_id, users.name AS users_name "
+                "FROM users WHERE users.id IN (:id_1, :id_2) "
+                "ORDER BY users.id LIMIT :param_1",
+                {"id_1": 7, "id_2": 8, "param_1": 5}
+            ),
+            CompiledSQL(
+                "SELECT addresses.id AS addresses_id, "
+                "addresses.user_id AS addresses_user_id, "
+                "addresses.email_address AS addresses_email_address "
+                "FROM addresses WHERE addresses.user_id IN "
+                "(:user_id_1, :user_id_2) ORDER BY addresses.id",
+                {"user_id_1": 7, "user_id_2": 8}
+            )
+        )
+
+    def test_many_to_one_joins_from_parent(self):
+        users, Address, addresses, User = (self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User)
+
+        mapper(Address, addresses, properties={
+            'user': relationship(mapper(User, users))
+        })
+        sess = create_session()
+
+        q = sess.query(Address).options(selectinload(Address.user)).\
+            filter(Address.id.in_([1, 5])).order_by(Address.id)
+
+        def go():
+            eq_(
+                q.all(),
+                [Address(id=1, user=User(id=7)),
+                 Address(id=5, user=User(id=9))]
+            )
+
+        self.assert_sql_execution(
+            testing.db,
+            go,
+            CompiledSQL(
+                "SELECT addresses.id AS addresses_id, "
+                "addresses.user_id AS addresses_user_id, "
+                "addresses.email_address AS addresses_email_address "
+                "FROM addresses WHERE addresses.id IN (:id_1, :id_2) "
+                "ORDER BY addresses.id",
+                {"id_1": 1, "id_2": 5}
+            ),
+            CompiledSQL(
+                "SELECT users.id AS users_id, users.name AS users_name, "
+                "addresses_1.id AS addresses_1_id "
+                "FROM addresses AS addresses_1 JOIN users "
+                "ON users.id = addresses_1.user_id "
+                "WHERE addresses_1.id IN (:id_1, :id_2)",
+                {"id_1": 1, "id_2": 5}
+            )
+        )
+
+    def test_batch_size(self):
+        users, Address, addresses, User = (self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(
+                mapper(Address, addresses), order_by=Address.id)
+        })
+        sess = create_session()
+
+        q = sess.query(User).order_by(User.id)
+
+        def go():
+            eq_(
+                q.options(selectinload(User.addresses, batch_size=2)).all(),
+                self.static.user_address_result
+            )
+        self.assert_sql_count(testing.db, go, 3)
+
+        sess.expunge_all()
+
+        def go():
+            eq_(
+                q.options(selectinload(User.addresses)).all(),
+                self.static.user_address_result
+            )
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_yield_per(self):
+        users, Address, addresses, User = (self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(
+                mapper(Address, addresses), order_by=Address.id)
+        })
+        sess = create_session()
+
+        q = sess.query(User).options(selectinload(User.addresses)).\
+            order_by(User.id).yield_per(2)
+
+        def go():
+            eq_(q.all(), self.static.user_address_result)
+
+        # one SELECT for the related rows of each batch of parents
+        self.assert_sql_count(testing.db, go, 3)
+
+
+class LoadOnExistingTest(_SelectInLoader, _LoadOnExistingTest):
+    pass
+
+
+class OrderBySecondaryTest(_SelectInLoader, _OrderBySecondaryTest):
+    pass
+
+
+class BaseRelationFromJoinedSubclassTest(
+        _SelectInLoader, _BaseRelationFromJoinedSubclassTest):
+    def _paperwork_sql(self, test):
+        # the paperwork rows are selected directly using the
+        # identities of the Engineer objects already loaded
+        return CompiledSQL(
+            "SELECT paperwork.paperwork_id AS paperwork_paperwork_id, "
+            "paperwork.description AS paperwork_description, "
+            "paperwork.person_id AS paperwork_person_id "
+            "FROM paperwork WHERE paperwork.person_id IN (:person_id_1) "
+            "ORDER BY paperwork.paperwork_id",
+            {"person_id_1": 1}
+        )
+
+
+class SubRelationFromJoinedSubclassMultiLevelTest(
+        _SelectInLoader, _SubRelationFromJoinedSubclassMultiLevelTest):
+    pass
+
+
+class SelfReferentialTest(_SelectInLoader, _SelfReferentialTest):
+    # all nodes are loaded by the first query, so a single SELECT
+    # loads the children of every node
+    lazy_fallback_sql_count = 2
+
+
+class InheritanceToRelatedTest(_SelectInLoader, _InheritanceToRelatedTest):
+    pass
+
+
+class CyclicalInheritingEagerTestOne(
+        _SelectInLoader, _CyclicalInheritingEagerTestOne):
+    pass
+
+
+class CyclicalInheritingEagerTestTwo(
+        _SelectInLoader, _CyclicalInheritingEagerTestTwo):
+    pass
+
+
+class JoinedNoLoadConflictTest(_SelectInLoader, _JoinedNoLoadConflictTest):
+    pass
+
+
+class CompositePrimaryKeyTest(fixtures.MappedTest):
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('parent', metadata,
+              Column('id_a', Integer, primary_key=True),
+              Column('id_b', Integer, primary_key=True),
+              Column('data', String(30)))
+        Table('child', metadata,
+              Column('id', Integer, primary_key=True),
+              Column('parent_id_a', Integer),
+              Column('parent_id_b', Integer),
+              Column('data', String(30)),
+              ForeignKeyConstraint(
+                  ['parent_id_a', 'parent_id_b'],
+                  ['parent.id_a', 'parent.id_b']))
+
+    @classmethod
+    def setup_classes(cls):
+        class Parent(cls.Comparable):
+            pass
+
+        class Child(cls.Comparable):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        Parent, Child = cls.classes.Parent, cls.classes.Child
+        mapper(Parent, cls.tables.parent, properties={
+            'children': relationship(
+                Child, backref='parent', order_by=cls.tables.child.c.id)
+        })
+        mapper(Child, cls.tables.child)
+
+    @classmethod
+    def fixtures(cls):
+        return dict(
+            parent=(('id_a', 'id_b', 'data'),
+                    (1, 1, 'p11'),
+                    (1, 2, 'p12'),
+                    (2, 1, 'p21')),
+            child=(('id', 'parent_id_a', 'parent_id_b', 'data'),
+                   (1, 1, 1, 'c1'),
+                   (2, 1, 2, 'c2'),
+                   (3, 1, 2, 'c3'),
+                   (4, 2, 1, 'c4'))
+        )
+
+    def test_one_to_many(self):
+        Parent, Child = self.classes.Parent, self.classes.Child
+        sess = create_session()
+
+        q = sess.query(Parent).options(selectinload(Parent.children)).\
+            filter(Parent.id_a == 1).order_by(Parent.id_b)
+
+        def go():
+            eq_(
+                q.all(),
+                [Parent(data='p11', children=[Child(data='c1')]),
+                 Parent(data='p12',
+                        children=[Child(data='c2'), Child(data='c3')])]
+            )
+        self.assert_sql_execution(
+            testing.db,
+            go,
+            CompiledSQL(
+                "SELECT parent.id_a AS parent_id_a, "
+                "parent.id_b AS parent_id_b, parent.data AS parent_data "
+                "FROM parent WHERE parent.id_a = :id_a_1 "
+                "ORDER BY parent.id_b",
+                {"id_a_1": 1}
+            ),
+            CompiledSQL(
+                "SELECT child.id AS child_id, "
+                "child.parent_id_a AS child_parent_id_a, "
+                "child.parent_id_b AS child_parent_id_b, "
+                "child.data AS child_data "
+                "FROM child WHERE child.parent_id_a = :parent_id_a_1 "
+                "AND child.parent_id_b = :parent_id_b_1 "
+                "OR child.parent_id_a = :parent_id_a_2 "
+                "AND child.parent_id_b = :parent_id_b_2 "
+                "ORDER BY child.id",
+                {"parent_id_a_1": 1, "parent_id_b_1": 1,
+                 "parent_id_a_2": 1, "parent_id_b_2": 2}
+            )
+        )
+
+    def test_many_to_one(self):
+        Parent, Child = self.classes.Parent, self.classes.Child
+        sess = create_session()
+
+        q = sess.query(Child).options(selectinload(Child.parent)).\
+            order_by(Child.id)
+
+        def go():
+            eq_(
+                [(c.data, c.parent.data) for c in q],
+                [('c1', 'p11'), ('c2', 'p12'), ('c3', 'p12'), ('c4', 'p21')]
+            )
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_batch_size(self):
+        Parent, Child = self.classes.Parent, self.classes.Child
+        sess = create_session()
+
+        q = sess.query(Parent).options(
+            selectinload(Parent.children, batch_size=2)).\
+            order_by(Parent.id_a, Parent.id_b)
+
+        def go():
+            eq_(
+                [[c.data for c in p.children] for p in q],
+                [['c1'], ['c2', 'c3'], ['c4']]
+            )
+        self.assert_sql_count(testing.db, go, 3)
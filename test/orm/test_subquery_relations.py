@@ -16,7 +16,18 @@ import sqlalchemy as sa
 
 from sqlalchemy.orm import with_polymorphic
 
-class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
+
+# the underscore-prefixed classes below contain tests common to the
+# "subquery" and "selectin" loaders; each is run against "subquery"
+# loading here, and against "selectin" loading in
+# test_selectin_relations.
+class _SubqueryLoader(object):
+    lazy = 'subquery'
+    loader = staticmethod(subqueryload)
+    loader_all = staticmethod(subqueryload_all)
+
+
+class _EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
     run_inserts = 'once'
     run_deletes = None
 
@@ -33,7 +44,7 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
         })
         sess = create_session()
 
-        q = sess.query(User).options(subqueryload(User.addresses))
+        q = sess.query(User).options(self.loader(User.addresses))
 
         def go():
             eq_(
@@ -72,7 +83,7 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
 
         u = aliased(User)
 
-        q = sess.query(u).options(subqueryload(u.addresses))
+        q = sess.query(u).options(self.loader(u.addresses))
 
         def go():
             eq_(
@@ -91,7 +102,7 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
         self.assert_sql_count(testing.db, go, 2)
 
         q = sess.query(u).\
-                        options(subqueryload_all(u.addresses, Address.dingalings))
+                        options(self.loader_all(u.addresses, Address.dingalings))
 
         def go():
             eq_(
@@ -123,7 +134,7 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
         })
         sess = create_session()
 
-        q = sess.query(User).options(subqueryload(User.addresses))
+        q = sess.query(User).options(self.loader(User.addresses))
         def go():
             eq_(
                     User(id=7, addresses=[
@@ -146,7 +157,7 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
         })
         sess = create_session()
 
-        q = sess.query(User).options(subqueryload(User.addresses))
+        q = sess.query(User).options(self.loader(User.addresses))
         def go():
             eq_(
                     User(id=7, addresses=[
@@ -157,7 +168,7 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
         self.assert_sql_count(testing.db, go, 2)
 
     def test_disable_dynamic(self):
-        """test no subquery option on a dynamic."""
+        """test no eager loader option on a dynamic."""
 
         users, Address, addresses, User = (self.tables.users,
                                 self.classes.Address,
@@ -176,7 +187,7 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
         assert_raises_message(
             sa.exc.InvalidRequestError,
             "User.addresses' does not support object population - eager loading cannot be applied.",
-            sess.query(User).options(subqueryload(User.addresses)).first,
+            sess.query(User).options(self.loader(User.addresses)).first,
         )
 
     def test_many_to_many_plain(self):
@@ -189,7 +200,7 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
         mapper(Keyword, keywords)
         mapper(Item, items, properties = dict(
                 keywords = relationship(Keyword, secondary=item_keywords,
-                                    lazy='subquery', order_by=keywords.c.id)))
+                                    lazy=self.lazy, order_by=keywords.c.id)))
 
         q = create_session().query(Item).order_by(Item.id)
         def go():
@@ -206,7 +217,7 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
         mapper(Keyword, keywords)
         mapper(Item, items, properties = dict(
                 keywords = relationship(Keyword, secondary=item_keywords,
-                                    lazy='subquery', order_by=keywords.c.id)))
+                                    lazy=self.lazy, order_by=keywords.c.id)))
 
         q = create_session().query(Item).order_by(Item.id)
         def go():
@@ -224,7 +235,7 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
         mapper(Keyword, keywords)
         mapper(Item, items, properties = dict(
                 keywords = relationship(Keyword, secondary=item_keywords,
-                                    lazy='subquery', order_by=keywords.c.id)))
+                                    lazy=self.lazy, order_by=keywords.c.id)))
 
         q = create_session().query(Item).order_by(Item.id)
         def go():
@@ -241,7 +252,7 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
 
         mapper(User, users, properties = {
             'addresses':relationship(mapper(Address, addresses),
-                        lazy='subquery', order_by=addresses.c.email_address),
+                        lazy=self.lazy, order_by=addresses.c.email_address),
         })
         q = create_session().query(User)
         eq_([
@@ -267,7 +278,7 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
 
         mapper(User, users, properties = {
             'addresses':relationship(mapper(Address, addresses),
-                            lazy='subquery',
+                            lazy=self.lazy,
                             order_by=[
                                     addresses.c.email_address,
                                     addresses.c.id]),
@@ -301,7 +312,7 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
         mapper(Address, addresses)
         mapper(User, users, properties = dict(
             addresses = relationship(Address,
-                                        lazy='subquery',
+                                        lazy=self.lazy,
                                         order_by=addresses.c.id),
         ))
 
@@ -331,7 +342,7 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
 
         mapper(Address, addresses)
         mapper(User, users, properties = dict(
-            addresses = relationship(Address, lazy='subquery',
+            addresses = relationship(Address, lazy=self.lazy,
                                  order_by=[
                                     sa.desc(addresses.c.email_address)
                                 ]),
@@ -354,12 +365,12 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
 
     _pathing_runs = [
         ( "lazyload", "lazyload", "lazyload", 15 ),
-        ("subqueryload", "lazyload", "lazyload", 12),
-        ("subqueryload", "subqueryload", "lazyload", 8),
-        ("joinedload", "subqueryload", "lazyload", 7),
-        ("lazyload", "lazyload", "subqueryload", 12),
-        ("subqueryload", "subqueryload", "subqueryload", 4),
-        ("subqueryload", "subqueryload", "joinedload", 3),
+        ("loader", "lazyload", "lazyload", 12),
+        ("loader", "loader", "lazyload", 8),
+        ("joinedload", "loader", "lazyload", 7),
+        ("lazyload", "lazyload", "loader", 12),
+        ("loader", "loader", "loader", 4),
+        ("loader", "loader", "joinedload", 3),
     ]
 
     def test_options_pathing(self):
@@ -396,7 +407,7 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
 
         callables = {
                         'joinedload':joinedload,
-                    'subqueryload':subqueryload
+                    'loader':self.loader
                 }
 
         for o, i, k, count in configs:
@@ -425,7 +436,7 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
         opts = {
             'lazyload':'select',
             'joinedload':'joined',
-            'subqueryload':'subquery',
+            'loader':self.lazy,
         }
 
         for o, i, k, count in configs:
@@ -486,12 +497,12 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
 
         mapper(Address, addresses)
         mapper(User, users, properties = dict(
-            addresses = relationship(Address, lazy='subquery',
-                                 backref=sa.orm.backref('user', lazy='subquery'),
+            addresses = relationship(Address, lazy=self.lazy,
+                                 backref=sa.orm.backref('user', lazy=self.lazy),
                                             order_by=Address.id)
         ))
-        is_(sa.orm.class_mapper(User).get_property('addresses').lazy, 'subquery')
-        is_(sa.orm.class_mapper(Address).get_property('user').lazy, 'subquery')
+        is_(sa.orm.class_mapper(User).get_property('addresses').lazy, self.lazy)
+        is_(sa.orm.class_mapper(Address).get_property('user').lazy, self.lazy)
 
         sess = create_session()
         eq_(self.static.user_address_result, sess.query(User).order_by(User.id).all())
@@ -518,18 +529,18 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
         closed_mapper = mapper(Order, closedorders, non_primary=True)
 
         mapper(User, users, properties = dict(
-            addresses = relationship(Address, lazy='subquery',
+            addresses = relationship(Address, lazy=self.lazy,
                                         order_by=addresses.c.id),
             open_orders = relationship(
                 open_mapper,
                 primaryjoin=sa.and_(openorders.c.isopen == 1,
                                  users.c.id==openorders.c.user_id),
-                lazy='subquery', order_by=openorders.c.id),
+                lazy=self.lazy, order_by=openorders.c.id),
             closed_orders = relationship(
                 closed_mapper,
                 primaryjoin=sa.and_(closedorders.c.isopen == 0,
                                  users.c.id==closedorders.c.user_id),
-                lazy='subquery', order_by=closedorders.c.id)))
+                lazy=self.lazy, order_by=closedorders.c.id)))
 
         q = create_session().query(User).order_by(User.id)
 
@@ -575,21 +586,21 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
 
         mapper(Address, addresses)
         mapper(Order, orders, properties={
-            'items': relationship(Item, secondary=order_items, lazy='subquery',
+            'items': relationship(Item, secondary=order_items, lazy=self.lazy,
                               order_by=items.c.id)})
         mapper(Item, items)
         mapper(User, users, properties=dict(
-            addresses=relationship(Address, lazy='subquery', order_by=addresses.c.id),
+            addresses=relationship(Address, lazy=self.lazy, order_by=addresses.c.id),
             open_orders=relationship(
                 Order,
                 primaryjoin=sa.and_(orders.c.isopen == 1,
                                  users.c.id==orders.c.user_id),
-                lazy='subquery', order_by=orders.c.id),
+                lazy=self.lazy, order_by=orders.c.id),
             closed_orders=relationship(
                 Order,
                 primaryjoin=sa.and_(orders.c.isopen == 0,
                                  users.c.id==orders.c.user_id),
-                lazy='subquery', order_by=orders.c.id)))
+                lazy=self.lazy, order_by=orders.c.id)))
         q = create_session().query(User).order_by(User.id)
 
         def go():
@@ -651,12 +662,12 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
 
         mapper(Item, items)
         mapper(Order, orders, properties={
-            'items':relationship(Item, secondary=order_items, lazy='subquery',
+            'items':relationship(Item, secondary=order_items, lazy=self.lazy,
                 order_by=items.c.id)
         })
         mapper(User, users, properties={
             'addresses':relationship(mapper(Address, addresses),
-                            lazy='subquery',
+                            lazy=self.lazy,
                             order_by=addresses.c.id),
             'orders':relationship(Order, lazy='select', order_by=orders.c.id)
         })
@@ -680,7 +691,7 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
         mapper(Address, addresses)
         mapper(User, users, properties={
             'addresses':relationship(Address,
-                            lazy='subquery',
+                            lazy=self.lazy,
                             order_by=addresses.c.id),
         },order_by=users.c.id.desc())
 
@@ -699,7 +710,7 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
 
         mapper(User, users, properties = dict(
             address = relationship(mapper(Address, addresses),
-                                    lazy='subquery', uselist=False)
+                                    lazy=self.lazy, uselist=False)
         ))
         q = create_session().query(User)
 
@@ -715,7 +726,7 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
                                 self.classes.User)
 
         mapper(Address, addresses, properties = dict(
-            user = relationship(mapper(User, users), lazy='subquery')
+            user = relationship(mapper(User, users), lazy=self.lazy)
         ))
         sess = create_session()
         q = sess.query(Address)
@@ -742,11 +753,11 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
 
         mapper(Order, orders)
         mapper(User, users, properties={
-               'orders':relationship(Order, backref='user', lazy='subquery',
+               'orders':relationship(Order, backref='user', lazy=self.lazy,
                                             order_by=orders.c.id),
                'max_order':relationship(
                                 mapper(Order, max_orders, non_primary=True),
-                                lazy='subquery', uselist=False)
+                                lazy=self.lazy, uselist=False)
                })
 
         q = create_session().query(User)
@@ -784,9 +795,14 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
         mapper(Order, orders)
         s = create_session()
         assert_raises(sa.exc.SAWarning,
-                s.query(User).options(subqueryload(User.order)).all)
+                s.query(User).options(self.loader(User.order)).all)
+
+
+class EagerTest(_SubqueryLoader, _EagerTest):
+    pass
+
 
-class LoadOnExistingTest(_fixtures.FixtureTest):
+class _LoadOnExistingTest(_fixtures.FixtureTest):
     """test that loaders from a base Query fully populate."""
 
     run_inserts = 'once'
@@ -823,7 +839,7 @@ class LoadOnExistingTest(_fixtures.FixtureTest):
     def _eager_config_fixture(self):
         User, Address = self.classes.User, self.classes.Address
         mapper(User, self.tables.users, properties={
-            'addresses':relationship(Address, lazy="subquery"),
+            'addresses':relationship(Address, lazy=self.lazy),
         })
         mapper(Address, self.tables.addresses)
         sess = Session(autoflush=False)
@@ -833,7 +849,7 @@ class LoadOnExistingTest(_fixtures.FixtureTest):
         User, Address = self.classes.User, self.classes.Address
         mapper(User, self.tables.users, properties={
             'name':deferred(self.tables.users.c.name),
-            'addresses':relationship(Address, lazy="subquery"),
+            'addresses':relationship(Address, lazy=self.lazy),
         })
         mapper(Address, self.tables.addresses)
         sess = Session(autoflush=False)
@@ -880,7 +896,7 @@ class LoadOnExistingTest(_fixtures.FixtureTest):
         u1.addresses.append(a1)
         a2 = u1.addresses[0]
         a2.email_address = 'foo'
-        sess.query(User).options(subqueryload_all("addresses.dingaling")).\
+        sess.query(User).options(self.loader_all("addresses.dingaling")).\
                             filter_by(id=8).all()
         assert u1.addresses[-1] is a1
         for a in u1.addresses:
@@ -898,7 +914,7 @@ class LoadOnExistingTest(_fixtures.FixtureTest):
         u1.orders
         o1 = Order()
         u1.orders.append(o1)
-        sess.query(User).options(subqueryload_all("orders.items")).\
+        sess.query(User).options(self.loader_all("orders.items")).\
                             filter_by(id=7).all()
         for o in u1.orders:
             if o is not o1:
@@ -909,18 +925,23 @@ class LoadOnExistingTest(_fixtures.FixtureTest):
     def test_load_two_levels_collection_to_scalar(self):
         User, Address, Dingaling, sess = self._collection_to_scalar_fixture()
 
-        u1 = sess.query(User).filter_by(id=8).options(subqueryload("addresses")).one()
-        sess.query(User).filter_by(id=8).options(subqueryload_all("addresses.dingaling")).first()
+        u1 = sess.query(User).filter_by(id=8).options(self.loader("addresses")).one()
+        sess.query(User).filter_by(id=8).options(self.loader_all("addresses.dingaling")).first()
         assert 'dingaling' in u1.addresses[0].__dict__
 
     def test_load_two_levels_collection_to_collection(self):
         User, Order, Item, sess = self._collection_to_collection_fixture()
 
-        u1 = sess.query(User).filter_by(id=7).options(subqueryload("orders")).one()
-        sess.query(User).filter_by(id=7).options(subqueryload_all("orders.items")).first()
+        u1 = sess.query(User).filter_by(id=7).options(self.loader("orders")).one()
+        sess.query(User).filter_by(id=7).options(self.loader_all("orders.items")).first()
         assert 'items' in u1.orders[0].__dict__
 
-class OrderBySecondaryTest(fixtures.MappedTest):
+
+class LoadOnExistingTest(_SubqueryLoader, _LoadOnExistingTest):
+    pass
+
+
+class _OrderBySecondaryTest(fixtures.MappedTest):
     @classmethod
     def define_tables(cls, metadata):
         Table('m2m', metadata,
@@ -965,7 +986,7 @@ class OrderBySecondaryTest(fixtures.MappedTest):
         class B(fixtures.ComparableEntity):pass
 
         mapper(A, a, properties={
-            'bs':relationship(B, secondary=m2m, lazy='subquery', order_by=m2m.c.id)
+            'bs':relationship(B, secondary=m2m, lazy=self.lazy, order_by=m2m.c.id)
         })
         mapper(B, b)
 
@@ -978,10 +999,14 @@ class OrderBySecondaryTest(fixtures.MappedTest):
         self.assert_sql_count(testing.db, go, 2)
 
 
+class OrderBySecondaryTest(_SubqueryLoader, _OrderBySecondaryTest):
+    pass
+
+
 from .inheritance._poly_fixtures import _Polymorphic, Person, Engineer, \
                 Paperwork, Machine, MachineType, Company
 
-class BaseRelationFromJoinedSubclassTest(_Polymorphic):
+class _BaseRelationFromJoinedSubclassTest(_Polymorphic):
     @classmethod
     def define_tables(cls, metadata):
         people = Table('people', metadata,
@@ -1038,13 +1063,13 @@ class BaseRelationFromJoinedSubclassTest(_Polymorphic):
         sess.add_all([e1, e2])
         sess.flush()
 
-    def test_correct_subquery_nofrom(self):
+    def test_correct_select_nofrom(self):
         sess = create_session()
         # use Person.paperwork here just to give the least
         # amount of context
         q = sess.query(Engineer).\
                 filter(Engineer.primary_language == 'java').\
-                options(subqueryload(Person.paperwork))
+                options(self.loader(Person.paperwork))
         def go():
             eq_(q.all()[0].paperwork,
                     [Paperwork(description="tps report #1"),
@@ -1064,28 +1089,10 @@ class BaseRelationFromJoinedSubclassTest(_Polymorphic):
                     "WHERE engineers.primary_language = :primary_language_1",
                     {"primary_language_1": "java"}
                 ),
-                # ensure we get "people JOIN engineer" here, even though
-                # primary key "people.person_id" is against "Person"
-                # *and* the path comes out as "Person.paperwork", still
-                # want to select from "Engineer" entity
-                CompiledSQL(
-                    "SELECT paperwork.paperwork_id AS paperwork_paperwork_id, "
-                    "paperwork.description AS paperwork_description, "
-                    "paperwork.person_id AS paperwork_person_id, "
-                    "anon_1.people_person_id AS anon_1_people_person_id "
-                    "FROM (SELECT people.person_id AS people_person_id "
-                        "FROM people JOIN engineers "
-                        "ON people.person_id = engineers.engineer_id "
-                        "WHERE engineers.primary_language = "
-                            ":primary_language_1) AS anon_1 "
-                    "JOIN paperwork "
-                        "ON anon_1.people_person_id = paperwork.person_id "
-                    "ORDER BY anon_1.people_person_id, paperwork.paperwork_id",
-                    {"primary_language_1": "java"}
-                )
+                self._paperwork_sql('nofrom')
         )
 
-    def test_correct_subquery_existingfrom(self):
+    def test_correct_select_existingfrom(self):
         sess = create_session()
         # use Person.paperwork here just to give the least
         # amount of context
@@ -1093,7 +1100,7 @@ class BaseRelationFromJoinedSubclassTest(_Polymorphic):
                 filter(Engineer.primary_language == 'java').\
                 join(Engineer.paperwork).\
                 filter(Paperwork.description == "tps report #2").\
-                options(subqueryload(Person.paperwork))
+                options(self.loader(Person.paperwork))
         def go():
             eq_(q.one().paperwork,
                     [Paperwork(description="tps report #1"),
@@ -1116,32 +1123,16 @@ class BaseRelationFromJoinedSubclassTest(_Polymorphic):
                 {"primary_language_1": "java",
                     "description_1": "tps report #2"}
             ),
-            CompiledSQL(
-                "SELECT paperwork.paperwork_id AS paperwork_paperwork_id, "
-                "paperwork.description AS paperwork_description, "
-                "paperwork.person_id AS paperwork_person_id, "
-                "anon_1.people_person_id AS anon_1_people_person_id "
-                "FROM (SELECT people.person_id AS people_person_id "
-                "FROM people JOIN engineers ON people.person_id = "
-                "engineers.engineer_id JOIN paperwork "
-                "ON people.person_id = paperwork.person_id "
-                "WHERE engineers.primary_language = :primary_language_1 AND "
-                "paperwork.description = :description_1) AS anon_1 "
-                "JOIN paperwork ON anon_1.people_person_id = "
-                "paperwork.person_id "
-                "ORDER BY anon_1.people_person_id, paperwork.paperwork_id",
-                {"primary_language_1": "java",
-                    "description_1": "tps report #2"}
-            )
+            self._paperwork_sql('existingfrom')
         )
 
-    def test_correct_subquery_with_polymorphic_no_alias(self):
+    def test_correct_select_with_polymorphic_no_alias(self):
         # test #3106
         sess = create_session()
 
         wp = with_polymorphic(Person, [Engineer])
         q = sess.query(wp).\
-                options(subqueryload(wp.paperwork)).\
+                options(self.loader(wp.paperwork)).\
                 order_by(Engineer.primary_language.desc())
 
         def go():
@@ -1165,26 +1156,16 @@ class BaseRelationFromJoinedSubclassTest(_Polymorphic):
                 "FROM people LEFT OUTER JOIN engineers ON people.person_id = "
                 "engineers.engineer_id ORDER BY engineers.primary_language "
                 "DESC LIMIT :param_1"),
-            CompiledSQL(
-                "SELECT paperwork.paperwork_id AS paperwork_paperwork_id, "
-                "paperwork.description AS paperwork_description, "
-                "paperwork.person_id AS paperwork_person_id, "
-                "anon_1.people_person_id AS anon_1_people_person_id FROM "
-                "(SELECT people.person_id AS people_person_id FROM people "
-                "LEFT OUTER JOIN engineers ON people.person_id = "
-                "engineers.engineer_id ORDER BY engineers.primary_language "
-                "DESC LIMIT :param_1) AS anon_1 JOIN paperwork "
-                "ON anon_1.people_person_id = paperwork.person_id "
-                "ORDER BY anon_1.people_person_id, paperwork.paperwork_id")
+            self._paperwork_sql('with_polymorphic_no_alias')
         )
 
-    def test_correct_subquery_with_polymorphic_alias(self):
+    def test_correct_select_with_polymorphic_alias(self):
         # test #3106
         sess = create_session()
 
         wp = with_polymorphic(Person, [Engineer], aliased=True)
         q = sess.query(wp).\
-                options(subqueryload(wp.paperwork)).\
+                options(self.loader(wp.paperwork)).\
                 order_by(wp.Engineer.primary_language.desc())
 
         def go():
@@ -1215,37 +1196,16 @@ class BaseRelationFromJoinedSubclassTest(_Polymorphic):
                 "engineers.engineer_id) AS anon_1 "
                 "ORDER BY anon_1.engineers_primary_language DESC "
                 "LIMIT :param_1"),
-            CompiledSQL(
-                "SELECT paperwork.paperwork_id AS paperwork_paperwork_id, "
-                "paperwork.description AS paperwork_description, "
-                "paperwork.person_id AS paperwork_person_id, "
-                "anon_1.anon_2_people_person_id AS "
-                "anon_1_anon_2_people_person_id FROM "
-                "(SELECT DISTINCT anon_2.people_person_id AS "
-                "anon_2_people_person_id, "
-                "anon_2.engineers_primary_language AS "
-                "anon_2_engineers_primary_language FROM "
-                "(SELECT people.person_id AS people_person_id, "
-                "people.name AS people_name, people.type AS people_type, "
-                "engineers.engineer_id AS engineers_engineer_id, "
-                "engineers.primary_language AS engineers_primary_language "
-                "FROM people LEFT OUTER JOIN engineers ON people.person_id = "
-                "engineers.engineer_id) AS anon_2 "
-                "ORDER BY anon_2.engineers_primary_language "
-                "DESC LIMIT :param_1) AS anon_1 "
-                "JOIN paperwork "
-                "ON anon_1.anon_2_people_person_id = paperwork.person_id "
-                "ORDER BY anon_1.anon_2_people_person_id, "
-                "paperwork.paperwork_id")
+            self._paperwork_sql('with_polymorphic_alias')
         )
 
-    def test_correct_subquery_with_polymorphic_flat_alias(self):
+    def test_correct_select_with_polymorphic_flat_alias(self):
         # test #3106
         sess = create_session()
 
         wp = with_polymorphic(Person, [Engineer], aliased=True, flat=True)
         q = sess.query(wp).\
-                options(subqueryload(wp.paperwork)).\
+                options(self.loader(wp.paperwork)).\
                 order_by(wp.Engineer.primary_language.desc())
 
         def go():
@@ -1271,7 +1231,84 @@ class BaseRelationFromJoinedSubclassTest(_Polymorphic):
                 "LEFT OUTER JOIN engineers AS engineers_1 "
                 "ON people_1.person_id = engineers_1.engineer_id "
                 "ORDER BY engineers_1.primary_language DESC LIMIT :param_1"),
-            CompiledSQL(
+            self._paperwork_sql('with_polymorphic_flat_alias')
+        )
+
+
+class BaseRelationFromJoinedSubclassTest(
+        _SubqueryLoader, _BaseRelationFromJoinedSubclassTest):
+    def _paperwork_sql(self, test):
+        return {
+            # ensure we get "people JOIN engineer" here, even though
+            # primary key "people.person_id" is against "Person"
+            # *and* the path comes out as "Person.paperwork", still
+            # want to select from "Engineer" entity
+            'nofrom': CompiledSQL(
+                "SELECT paperwork.paperwork_id AS paperwork_paperwork_id, "
+                "paperwork.description AS paperwork_description, "
+                "paperwork.person_id AS paperwork_person_id, "
+                "anon_1.people_person_id AS anon_1_people_person_id "
+                "FROM (SELECT people.person_id AS people_person_id "
+                "FROM people JOIN engineers "
+                "ON people.person_id = engineers.engineer_id "
+                "WHERE engineers.primary_language = "
+                ":primary_language_1) AS anon_1 "
+                "JOIN paperwork "
+                "ON anon_1.people_person_id = paperwork.person_id "
+                "ORDER BY anon_1.people_person_id, paperwork.paperwork_id",
+                {"primary_language_1": "java"}
+            ),
+            'existingfrom': CompiledSQL(
+                "SELECT paperwork.paperwork_id AS paperwork_paperwork_id, "
+                "paperwork.description AS paperwork_description, "
+                "paperwork.person_id AS paperwork_person_id, "
+                "anon_1.people_person_id AS anon_1_people_person_id "
+                "FROM (SELECT people.person_id AS people_person_id "
+                "FROM people JOIN engineers ON people.person_id = "
+                "engineers.engineer_id JOIN paperwork "
+                "ON people.person_id = paperwork.person_id "
+                "WHERE engineers.primary_language = :primary_language_1 AND "
+                "paperwork.description = :description_1) AS anon_1 "
+                "JOIN paperwork ON anon_1.people_person_id = "
+                "paperwork.person_id "
+                "ORDER BY anon_1.people_person_id, paperwork.paperwork_id",
+                {"primary_language_1": "java",
+                 "description_1": "tps report #2"}
+            ),
+            'with_polymorphic_no_alias': CompiledSQL(
+                "SELECT paperwork.paperwork_id AS paperwork_paperwork_id, "
+                "paperwork.description AS paperwork_description, "
+                "paperwork.person_id AS paperwork_person_id, "
+                "anon_1.people_person_id AS anon_1_people_person_id FROM "
+                "(SELECT people.person_id AS people_person_id FROM people "
+                "LEFT OUTER JOIN engineers ON people.person_id = "
+                "engineers.engineer_id ORDER BY engineers.primary_language "
+                "DESC LIMIT :param_1) AS anon_1 JOIN paperwork "
+                "ON anon_1.people_person_id = paperwork.person_id "
+                "ORDER BY anon_1.people_person_id, paperwork.paperwork_id"),
+            'with_polymorphic_alias': CompiledSQL(
+                "SELECT paperwork.paperwork_id AS paperwork_paperwork_id, "
+                "paperwork.description AS paperwork_description, "
+                "paperwork.person_id AS paperwork_person_id, "
+                "anon_1.anon_2_people_person_id AS "
+                "anon_1_anon_2_people_person_id FROM "
+                "(SELECT DISTINCT anon_2.people_person_id AS "
+                "anon_2_people_person_id, "
+                "anon_2.engineers_primary_language AS "
+                "anon_2_engineers_primary_language FROM "
+                "(SELECT people.person_id AS people_person_id, "
+                "people.name AS people_name, people.type AS people_type, "
+                "engineers.engineer_id AS engineers_engineer_id, "
+                "engineers.primary_language AS engineers_primary_language "
+                "FROM people LEFT OUTER JOIN engineers ON people.person_id = "
+                "engineers.engineer_id) AS anon_2 "
+                "ORDER BY anon_2.engineers_primary_language "
+                "DESC LIMIT :param_1) AS anon_1 "
+                "JOIN paperwork "
+                "ON anon_1.anon_2_people_person_id = paperwork.person_id "
+                "ORDER BY anon_1.anon_2_people_person_id, "
+                "paperwork.paperwork_id"),
+            'with_polymorphic_flat_alias': CompiledSQL(
                 "SELECT paperwork.paperwork_id AS paperwork_paperwork_id, "
                 "paperwork.description AS paperwork_description, "
                 "paperwork.person_id AS paperwork_person_id, "
@@ -1284,10 +1321,11 @@ class BaseRelationFromJoinedSubclassTest(_Polymorphic):
                 "AS anon_1 JOIN paperwork ON anon_1.people_1_person_id = "
                 "paperwork.person_id ORDER BY anon_1.people_1_person_id, "
                 "paperwork.paperwork_id"
-            )
-        )
+            ),
+        }[test]
+
 
-class SubRelationFromJoinedSubclassMultiLevelTest(_Polymorphic):
+class _SubRelationFromJoinedSubclassMultiLevelTest(_Polymorphic):
     @classmethod
     def define_tables(cls, metadata):
         Table('companies', metadata,
@@ -1385,9 +1423,8 @@ class SubRelationFromJoinedSubclassMultiLevelTest(_Polymorphic):
     def test_chained_subq_subclass(self):
         s = Session()
         q = s.query(Company).options(
-                        subqueryload(Company.employees.of_type(Engineer)).
-                            subqueryload(Engineer.machines).
-                            subqueryload(Machine.type)
+                        self.loader_all(Company.employees.of_type(Engineer),
+                                        Engineer.machines, Machine.type)
                     )
 
         def go():
@@ -1398,7 +1435,12 @@ class SubRelationFromJoinedSubclassMultiLevelTest(_Polymorphic):
         self.assert_sql_count(testing.db, go, 4)
 
 
-class SelfReferentialTest(fixtures.MappedTest):
+class SubRelationFromJoinedSubclassMultiLevelTest(
+        _SubqueryLoader, _SubRelationFromJoinedSubclassMultiLevelTest):
+    pass
+
+
+class _SelfReferentialTest(fixtures.MappedTest):
     @classmethod
     def define_tables(cls, metadata):
         Table('nodes', metadata,
@@ -1415,7 +1457,7 @@ class SelfReferentialTest(fixtures.MappedTest):
 
         mapper(Node, nodes, properties={
             'children':relationship(Node,
-                                        lazy='subquery',
+                                        lazy=self.lazy,
                                         join_depth=3, order_by=nodes.c.id)
         })
         sess = create_session()
@@ -1466,7 +1508,7 @@ class SelfReferentialTest(fixtures.MappedTest):
                 self.children.append(node)
 
         mapper(Node, nodes, properties={
-            'children':relationship(Node, lazy='subquery', join_depth=1,
+            'children':relationship(Node, lazy=self.lazy, join_depth=1,
                                     order_by=nodes.c.id)
         })
         sess = create_session()
@@ -1490,7 +1532,7 @@ class SelfReferentialTest(fixtures.MappedTest):
                 Node(data='n122'),
                 Node(data='n123')
             ], list(n12.children))
-        self.assert_sql_count(testing.db, go, 4)
+        self.assert_sql_count(testing.db, go, self.lazy_fallback_sql_count)
 
     def test_with_deferred(self):
         nodes = self.tables.nodes
@@ -1500,7 +1542,7 @@ class SelfReferentialTest(fixtures.MappedTest):
                 self.children.append(node)
 
         mapper(Node, nodes, properties={
-            'children':relationship(Node, lazy='subquery', join_depth=3,
+            'children':relationship(Node, lazy=self.lazy, join_depth=3,
                                     order_by=nodes.c.id),
             'data':deferred(nodes.c.data)
         })
@@ -1558,7 +1600,7 @@ class SelfReferentialTest(fixtures.MappedTest):
         sess.expunge_all()
         def go():
             d = sess.query(Node).filter_by(data='n1').\
-                        options(subqueryload_all('children.children')).first()
+                        options(self.loader_all('children.children')).first()
             eq_(Node(data='n1', children=[
                 Node(data='n11'),
                 Node(data='n12', children=[
@@ -1580,7 +1622,7 @@ class SelfReferentialTest(fixtures.MappedTest):
                 self.children.append(node)
 
         mapper(Node, nodes, properties={
-            'children':relationship(Node, lazy='subquery')
+            'children':relationship(Node, lazy=self.lazy)
         })
         sess = create_session()
         n1 = Node(data='n1')
@@ -1614,7 +1656,12 @@ class SelfReferentialTest(fixtures.MappedTest):
             ], d)
         self.assert_sql_count(testing.db, go, 4)
 
-class InheritanceToRelatedTest(fixtures.MappedTest):
+
+class SelfReferentialTest(_SubqueryLoader, _SelfReferentialTest):
+    lazy_fallback_sql_count = 4
+
+
+class _InheritanceToRelatedTest(fixtures.MappedTest):
     @classmethod
     def define_tables(cls, metadata):
         Table('foo', metadata,
@@ -1688,7 +1735,7 @@ class InheritanceToRelatedTest(fixtures.MappedTest):
             eq_(
                 s.query(Foo).with_polymorphic([Bar, Baz]).\
                             order_by(Foo.id).\
-                            options(subqueryload(Foo.related)).all(),
+                            options(self.loader(Foo.related)).all(),
                 [
                     Bar(id=1, related=Related(id=1)),
                     Bar(id=2, related=Related(id=2)),
@@ -1717,7 +1764,12 @@ class InheritanceToRelatedTest(fixtures.MappedTest):
             )
         self.assert_sql_count(testing.db, go, 1)
 
-class CyclicalInheritingEagerTestOne(fixtures.MappedTest):
+
+class InheritanceToRelatedTest(_SubqueryLoader, _InheritanceToRelatedTest):
+    pass
+
+
+class _CyclicalInheritingEagerTestOne(fixtures.MappedTest):
 
     @classmethod
     def define_tables(cls, metadata):
@@ -1750,8 +1802,8 @@ class CyclicalInheritingEagerTestOne(fixtures.MappedTest):
 
         mapper(T, t1, polymorphic_on=t1.c.type, polymorphic_identity='t1')
         mapper(SubT, None, inherits=T, polymorphic_identity='subt1', properties={
-            't2s': relationship(SubT2, lazy='subquery',
-                    backref=sa.orm.backref('subt', lazy='subquery'))
+            't2s': relationship(SubT2, lazy=self.lazy,
+                    backref=sa.orm.backref('subt', lazy=self.lazy))
         })
         mapper(T2, t2, polymorphic_on=t2.c.type, polymorphic_identity='t2')
         mapper(SubT2, None, inherits=T2, polymorphic_identity='subt2')
@@ -1759,7 +1811,13 @@ class CyclicalInheritingEagerTestOne(fixtures.MappedTest):
         # testing a particular endless loop condition in eager load setup
         create_session().query(SubT).all()
 
-class CyclicalInheritingEagerTestTwo(fixtures.DeclarativeMappedTest,
+
+class CyclicalInheritingEagerTestOne(
+        _SubqueryLoader, _CyclicalInheritingEagerTestOne):
+    pass
+
+
+class _CyclicalInheritingEagerTestTwo(fixtures.DeclarativeMappedTest,
                         testing.AssertsCompiledSQL):
     __dialect__ = 'default'
 
@@ -1783,6 +1841,26 @@ class CyclicalInheritingEagerTestTwo(fixtures.DeclarativeMappedTest,
             name = Column(String(50))
 
 
+    def test_integrate(self):
+        Director = self.classes.Director
+        Movie = self.classes.Movie
+
+        session = Session(testing.db)
+        rscott = Director(name="Ridley Scott")
+        alien = Movie(title="Alien")
+        brunner = Movie(title="Blade Runner")
+        rscott.movies.append(brunner)
+        rscott.movies.append(alien)
+        session.add_all([rscott, alien, brunner])
+        session.commit()
+
+        session.close_all()
+        d = session.query(Director).options(self.loader('*')).first()
+        assert len(list(session)) == 3
+
+
+class CyclicalInheritingEagerTestTwo(
+        _SubqueryLoader, _CyclicalInheritingEagerTestTwo):
     def test_from_subclass(self):
         Director = self.classes.Director
 
@@ -1806,23 +1884,6 @@ class CyclicalInheritingEagerTestTwo(fixtures.DeclarativeMappedTest,
             dialect="default"
         )
 
-    def test_integrate(self):
-        Director = self.classes.Director
-        Movie = self.classes.Movie
-
-        session = Session(testing.db)
-        rscott = Director(name="Ridley Scott")
-        alien = Movie(title="Alien")
-        brunner = Movie(title="Blade Runner")
-        rscott.movies.append(brunner)
-        rscott.movies.append(alien)
-        session.add_all([rscott, alien, brunner])
-        session.commit()
-
-        session.close_all()
-        d = session.query(Director).options(subqueryload('*')).first()
-        assert len(list(session)) == 3
-
 
 class SubqueryloadDistinctTest(fixtures.DeclarativeMappedTest,
                                testing.AssertsCompiledSQL):
@@ -2020,7 +2081,7 @@ class SubqueryloadDistinctTest(fixtures.DeclarativeMappedTest,
         )
 
 
-class JoinedNoLoadConflictTest(fixtures.DeclarativeMappedTest):
+class _JoinedNoLoadConflictTest(fixtures.DeclarativeMappedTest):
     """test for [ticket:2887]"""
 
     @classmethod
@@ -2056,18 +2117,23 @@ class JoinedNoLoadConflictTest(fixtures.DeclarativeMappedTest):
         s.add(Parent(name='parent', children=[Child(name='c1')]))
         s.commit()
 
-    def test_subqueryload_on_joined_noload(self):
+    def test_eager_load_on_joined_noload(self):
         Parent = self.classes.Parent
         Child = self.classes.Child
 
         s = Session()
 
-        # here we have Parent->subqueryload->Child->joinedload->parent->noload->children.
-        # the actual subqueryload has to emit *after* we've started populating
-        # Parent->subqueryload->child.
-        parent = s.query(Parent).options([subqueryload('children')]).first()
+        # here we have Parent->eager load->Child->joinedload->parent->noload->children.
+        # the actual eager load has to emit *after* we've started populating
+        # Parent->eager load->child.
+        parent = s.query(Parent).options([self.loader('children')]).first()
         eq_(
             parent.children,
             [Child(name='c1')]
         )
 
+
+class JoinedNoLoadConflictTest(_SubqueryLoader, _JoinedNoLoadConflictTest):
+    pass
+
+
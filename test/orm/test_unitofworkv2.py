@@ -5,11 +5,11 @@ from sqlalchemy.testing.schema import Table, Column
 from test.orm import _fixtures
 from sqlalchemy import exc
 from sqlalchemy.testing import fixtures
-from sqlalchemy import Integer, String, ForeignKey, func
+from sqlalchemy import Integer, String, ForeignKey, Sequence, func
 from sqlalchemy.orm import mapper, relationship, backref, \
     create_session, unitofwork, attributes,\
     Session, exc as orm_exc
-from sqlalchemy.testing.mock import Mock
+from sqlalchemy.testing.mock import Mock, patch
 from sqlalchemy.testing.assertsql import AllOf, CompiledSQL
 from sqlalchemy import event
 
@@ -1581,6 +1581,398 @@ class BatchInsertsTest(fixtures.MappedTest, testing.AssertsExecutionResults):
         )
 
 
+class BatchInsertReturningTest(
+        fixtures.MappedTest, testing.AssertsExecutionResults):
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('t', metadata,
+              Column('id', Integer, primary_key=True,
+                     test_needs_autoincrement=True),
+              Column('data', String(50)),
+              Column('def_', String(50), server_default='def1')
+              )
+
+    @classmethod
+    def setup_classes(cls):
+        class T(cls.Comparable):
+            pass
+
+    def _assert_flush(self, bind):
+        T = self.classes.T
+        sess = Session(bind)
+        objects = [T(data='t%d' % i) for i in range(5)]
+        objects.append(T(id=100, data='t100'))
+        sess.add_all(objects)
+        sess.flush()
+
+        ids = [obj.id for obj in objects[0:5]]
+        eq_(ids, sorted(ids))
+        eq_(len(set(ids)), 5)
+        eq_(
+            sess.query(T.id, T.data).order_by(T.id).all(),
+            [(obj.id, obj.data) for obj in objects]
+        )
+        # server defaults are expired, rather than returned
+        assert 'def_' not in objects[0].__dict__
+        eq_(objects[0].def_, 'def1')
+        sess.close()
+
+    def _emulated_flush(self):
+        from sqlalchemy.dialects.sqlite.base import SQLiteCompiler
+
+        def returning_clause(compiler, stmt, returning_cols):
+            return "RETURNING " + ", ".join(
+                compiler.preparer.format_column(c) for c in returning_cols)
+
+        # share the pool so that the tables are visible on an
+        # in-memory database
+        eng = engines.testing_engine(
+            options={'pool': testing.db.pool, 'use_reaper': False,
+                     'implicit_returning': True})
+        eng.dialect.insert_executemany_returning = True
+
+        # record statements as sent to the cursor, including those
+        # rewritten into multi-row VALUES after before_cursor_execute
+        statements = []
+
+        class CursorProxy(object):
+            def __init__(self, cursor):
+                self._cursor = cursor
+
+            def execute(self, statement, parameters):
+                statements.append((statement, parameters))
+                return self._cursor.execute(statement, parameters)
+
+            def __getattr__(self, key):
+                return getattr(self._cursor, key)
+
+        do_executemany_values = eng.dialect._do_executemany_values
+
+        def _do_executemany_values(cursor, statement, parameters, context):
+            do_executemany_values(
+                CursorProxy(cursor), statement, parameters, context)
+
+        @event.listens_for(eng, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, parameters,
+                                  context, executemany):
+            if statement.startswith("INSERT") and \
+                    not context._executemany_values:
+                statements.append((statement, parameters))
+
+        with patch.object(
+                SQLiteCompiler, "returning_clause", returning_clause), \
+                patch.object(
+                    eng.dialect, "_do_executemany_values",
+                    _do_executemany_values):
+            self._assert_flush(eng)
+        return statements
+
+    @testing.only_on('sqlite >= 3.35')
+    def test_emulated_returning(self):
+        mapper(self.classes.T, self.tables.t, batch_insert_returning=True)
+        statements = self._emulated_flush()
+
+        # the five rows without a primary key are sent as a single
+        # INSERT..RETURNING, rendered as multi-row VALUES
+        eq_(
+            statements,
+            [
+                ("INSERT INTO t (data) VALUES (?), (?), (?), (?), (?) "
+                 "RETURNING id",
+                 ('t0', 't1', 't2', 't3', 't4')),
+                ("INSERT INTO t (id, data) VALUES (?, ?)", (100, 't100'))
+            ]
+        )
+
+    @testing.only_on('sqlite >= 3.35')
+    def test_emulated_returning_not_enabled(self):
+        mapper(self.classes.T, self.tables.t)
+        statements = self._emulated_flush()
+
+        eq_(
+            statements,
+            [
+                ("INSERT INTO t (data) VALUES (?) RETURNING id", ('t%d' % i, ))
+                for i in range(5)
+            ] + [
+                ("INSERT INTO t (id, data) VALUES (?, ?)", (100, 't100'))
+            ]
+        )
+
+    @testing.only_on('postgresql')
+    def test_returning(self):
+        mapper(self.classes.T, self.tables.t, batch_insert_returning=True)
+        self._assert_flush(testing.db)
+
+
+class UpdatePrimaryKeyHistoryTest(
+        fixtures.MappedTest, testing.AssertsExecutionResults):
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('t', metadata,
+              Column('id', Integer, primary_key=True),
+              Column('data', String(50))
+              )
+
+    @classmethod
+    def setup_classes(cls):
+        class T(cls.Comparable):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        mapper(cls.classes.T, cls.tables.t)
+
+    def _fixture(self):
+        T = self.classes.T
+        sess = Session(expire_on_commit=False)
+        t1 = T(id=1, data='t1')
+        sess.add(t1)
+        sess.commit()
+        return sess, t1
+
+    def _assert_update(self, sess, t1):
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "UPDATE t SET data=:data WHERE t.id = :t_id",
+                {'data': 't1new', 't_id': 1}
+            )
+        )
+
+    def test_unchanged_pk_no_history(self):
+        sess, t1 = self._fixture()
+        t1.data = 't1new'
+
+        canary = []
+        get_history = attributes.ScalarAttributeImpl.get_history
+
+        def _get_history(impl, state, dict_, passive=attributes.PASSIVE_OFF):
+            canary.append(impl.key)
+            return get_history(impl, state, dict_, passive)
+
+        with patch.object(
+                attributes.ScalarAttributeImpl, "get_history", _get_history):
+            self._assert_update(sess, t1)
+        assert 'id' not in canary
+
+    def test_expired_pk(self):
+        sess, t1 = self._fixture()
+        t1.data = 't1new'
+        sess.expire(t1, ['id'])
+        assert 'id' not in t1.__dict__
+
+        with self.sql_execution_asserter() as asserter:
+            sess.flush()
+        asserter.assert_(
+            CompiledSQL(
+                "SELECT t.id AS t_id FROM t WHERE t.id = :param_1",
+                {'param_1': 1}
+            ),
+            CompiledSQL(
+                "UPDATE t SET data=:data WHERE t.id = :t_id",
+                {'data': 't1new', 't_id': 1}
+            )
+        )
+
+
+class SequencePrefetchTest(
+        fixtures.MappedTest, testing.AssertsExecutionResults):
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('t', metadata,
+              Column('id', Integer, Sequence('t_id_seq'), primary_key=True),
+              Column('data', String(50))
+              )
+
+    @classmethod
+    def setup_classes(cls):
+        class T(cls.Comparable):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        mapper(cls.classes.T, cls.tables.t, sequence_prefetch=True)
+
+    def _fixture(self):
+        canary = []
+
+        def fetch_sequence_values(connection, sequence, count):
+            canary.append((sequence.name, count))
+            return list(range(10, 10 + count))
+
+        dialect = testing.db.dialect
+        return canary, patch.multiple(
+            dialect, supports_sequences=True,
+            fetch_sequence_values=fetch_sequence_values)
+
+    def test_flush_batched(self):
+        T = self.classes.T
+        canary, fixture = self._fixture()
+
+        sess = Session()
+        objects = [T(data='t1'), T(id=5, data='t2'), T(data='t3'),
+                   T(data='t4')]
+        sess.add_all(objects)
+        with fixture:
+            self.assert_sql_execution(
+                testing.db,
+                sess.flush,
+                CompiledSQL(
+                    "INSERT INTO t (id, data) VALUES (:id, :data)",
+                    [{'id': 10, 'data': 't1'}, {'id': 5, 'data': 't2'},
+                     {'id': 11, 'data': 't3'}, {'id': 12, 'data': 't4'}]
+                )
+            )
+        eq_(canary, [('t_id_seq', 3)])
+        eq_([obj.id for obj in objects], [10, 5, 11, 12])
+
+    def test_bulk_save_return_defaults(self):
+        T = self.classes.T
+        canary, fixture = self._fixture()
+
+        sess = Session()
+        objects = [T(data='t1'), T(data='t2')]
+        with fixture:
+            self.assert_sql_execution(
+                testing.db,
+                lambda: sess.bulk_save_objects(
+                    objects, return_defaults=True),
+                CompiledSQL(
+                    "INSERT INTO t (id, data) VALUES (:id, :data)",
+                    [{'id': 10, 'data': 't1'}, {'id': 11, 'data': 't2'}]
+                )
+            )
+        eq_(canary, [('t_id_seq', 2)])
+        eq_([obj.id for obj in objects], [10, 11])
+
+    @testing.requires.sequences
+    def test_round_trip(self):
+        T = self.classes.T
+
+        sess = Session()
+        objects = [T(data='t%d' % i) for i in range(5)]
+        sess.add_all(objects)
+        sess.flush()
+
+        ids = [obj.id for obj in objects]
+        eq_(len(set(ids)), 5)
+        eq_(
+            sess.query(T.id, T.data).order_by(T.data).all(),
+            [(obj.id, obj.data) for obj in objects]
+        )
+
+
+class BatchUpdatesTest(fixtures.MappedTest, testing.AssertsExecutionResults):
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('t', metadata,
+              Column('id', Integer, primary_key=True),
+              Column('data', String(50)),
+              Column('status', String(50))
+              )
+
+    @classmethod
+    def setup_classes(cls):
+        class T(cls.Basic):
+            pass
+
+    def _fixture(self, **kw):
+        T, t = self.classes.T, self.tables.t
+        mapper(T, t, **kw)
+        sess = Session()
+        sess.add_all([T(id=i, data='d%d' % i, status='s%d' % i)
+                      for i in range(1, 6)])
+        sess.flush()
+        objects = sess.query(T).order_by(T.id).all()
+        for obj in objects[0::2]:
+            obj.data = 'new %s' % obj.data
+        for obj in objects[1::2]:
+            obj.status = 'new %s' % obj.status
+        return sess, objects
+
+    def test_default_per_object(self):
+        sess, objects = self._fixture()
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "UPDATE t SET data=:data WHERE t.id = :t_id",
+                {'data': 'new d1', 't_id': 1}
+            ),
+            CompiledSQL(
+                "UPDATE t SET status=:status WHERE t.id = :t_id",
+                {'status': 'new s2', 't_id': 2}
+            ),
+            CompiledSQL(
+                "UPDATE t SET data=:data WHERE t.id = :t_id",
+                {'data': 'new d3', 't_id': 3}
+            ),
+            CompiledSQL(
+                "UPDATE t SET status=:status WHERE t.id = :t_id",
+                {'status': 'new s4', 't_id': 4}
+            ),
+            CompiledSQL(
+                "UPDATE t SET data=:data WHERE t.id = :t_id",
+                {'data': 'new d5', 't_id': 5}
+            ),
+        )
+
+    def test_batch_updates(self):
+        sess, objects = self._fixture(batch_updates=True)
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "UPDATE t SET data=:data WHERE t.id = :t_id",
+                [{'data': 'new d1', 't_id': 1},
+                 {'data': 'new d3', 't_id': 3},
+                 {'data': 'new d5', 't_id': 5}]
+            ),
+            CompiledSQL(
+                "UPDATE t SET status=:status WHERE t.id = :t_id",
+                [{'status': 'new s2', 't_id': 2},
+                 {'status': 'new s4', 't_id': 4}]
+            ),
+        )
+        eq_(
+            sess.query(self.classes.T.data, self.classes.T.status).
+            order_by(self.classes.T.id).all(),
+            [('new d1', 's1'), ('d2', 'new s2'), ('new d3', 's3'),
+             ('d4', 'new s4'), ('new d5', 's5')]
+        )
+
+    def test_batch_updates_sql_expression(self):
+        sess, objects = self._fixture(batch_updates=True)
+        objects[1].data = func.lower('D2')
+        objects[3].data = func.lower('D4')
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "UPDATE t SET data=:data WHERE t.id = :t_id",
+                [{'data': 'new d1', 't_id': 1},
+                 {'data': 'new d3', 't_id': 3},
+                 {'data': 'new d5', 't_id': 5}]
+            ),
+            CompiledSQL(
+                "UPDATE t SET data=lower(:lower_1), status=:status "
+                "WHERE t.id = :t_id",
+                {'lower_1': 'D2', 'status': 'new s2', 't_id': 2}
+            ),
+            CompiledSQL(
+                "UPDATE t SET data=lower(:lower_1), status=:status "
+                "WHERE t.id = :t_id",
+                {'lower_1': 'D4', 'status': 'new s4', 't_id': 4}
+            ),
+        )
+
+
 class LoadersUsingCommittedTest(UOWTest):
 
     """Test that events which occur within a flush()
@@ -678,6 +678,18 @@ class DefaultRequirements(SuiteRequirements):
                 "Python version 3.xx is required."
                 )
 
+    @property
+    def asyncio(self):
+        def check():
+            try:
+                import asyncio
+                import concurrent.futures
+            except ImportError:
+                return False
+            else:
+                return True
+        return only_if(check, "asyncio and concurrent.futures required")
+
     @property
     def cpython(self):
         return only_if(lambda: util.cpython,
@@ -0,0 +1,235 @@
+"""Test structural cache key generation for SQL expression constructs."""
+
+from sqlalchemy.testing import eq_, is_, is_not_
+from sqlalchemy import *
+from sqlalchemy.testing import fixtures
+from sqlalchemy.sql import table, column, visitors, functions
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.schema import CreateTable, DDL
+from sqlalchemy.ext.compiler import compiles
+import itertools
+
+metadata = MetaData()
+table_a = Table('a', metadata,
+                Column('id', Integer, primary_key=True),
+                Column('data', String(20)),
+                Column('x', Integer))
+
+table_b = Table('b', metadata,
+                Column('id', Integer, primary_key=True),
+                Column('a_id', Integer, ForeignKey('a.id')),
+                Column('data', String(20)))
+
+table_c = table('c', column('q'), column('p'))
+
+seq = Sequence('some_seq')
+
+
+class CacheKeyTest(fixtures.TestBase):
+
+    # each fixture produces a new but equivalent construct each time
+    # it is called; constructs from different fixtures are all distinct.
+    fixtures = [
+        lambda: table_a.c.id == 5,
+        lambda: table_a.c.id == table_b.c.a_id,
+        lambda: table_a.c.id != 5,
+        lambda: table_a.c.id.op('@@')(5),
+        lambda: table_a.c.id.op('@@', precedence=5)(5),
+        lambda: table_a.c.data.like('x'),
+        lambda: table_a.c.data.like('x', escape='/'),
+        lambda: table_a.c.id.in_([1, 2]),
+        lambda: table_a.c.id.in_([1, 2, 3]),
+        lambda: table_a.c.id.between(1, 5),
+        lambda: -table_a.c.x,
+        lambda: ~table_a.c.x,
+        lambda: table_a.c.id.desc(),
+        lambda: table_a.c.id.asc(),
+        lambda: table_a.c.id.desc().nullsfirst(),
+        lambda: table_a.c.x.distinct(),
+        lambda: table_a.c.x.label('foo'),
+        lambda: table_a.c.x.label('bar'),
+        lambda: table_a.c.x.label(None),
+        lambda: cast(table_a.c.x, String),
+        lambda: cast(table_a.c.x, String(10)),
+        lambda: cast(table_a.c.x, String(20)),
+        lambda: extract('year', table_a.c.x),
+        lambda: extract('month', table_a.c.x),
+        lambda: and_(table_a.c.id == 5, table_a.c.x == 7),
+        lambda: or_(table_a.c.id == 5, table_a.c.x == 7),
+        lambda: tuple_(table_a.c.id, table_a.c.x),
+        lambda: case([(table_a.c.id == 5, 'five')]),
+        lambda: case([(table_a.c.id == 5, 'five')], else_='other'),
+        lambda: case({'five': 5}, value=table_a.c.data),
+        lambda: func.foo(table_a.c.x),
+        lambda: func.bar(table_a.c.x),
+        lambda: func.foo.bar(table_a.c.x),
+        lambda: func.count(table_a.c.x),
+        lambda: func.count(table_a.c.x).over(order_by=table_a.c.id),
+        lambda: func.count(table_a.c.x).over(partition_by=table_a.c.id),
+        lambda: func.count(table_a.c.x).filter(table_a.c.id > 5),
+        lambda: func.percentile_cont(0.5).within_group(table_a.c.x),
+        lambda: func.next_value(seq),
+        lambda: null(),
+        lambda: true(),
+        lambda: false(),
+        lambda: literal_column('q'),
+        lambda: column('q'),
+        lambda: text("select 1"),
+        lambda: text("select :x").bindparams(x=5),
+        lambda: text("select :x").bindparams(bindparam('x', type_=String)),
+        lambda: text("select a from b").columns(column('a')),
+        lambda: select([table_a]),
+        lambda: select([table_a.c.id]),
+        lambda: select([table_a.c.id]).where(table_a.c.x == 5),
+        lambda: select([table_a.c.id]).where(table_a.c.x == 5).
+        order_by(table_a.c.id),
+        lambda: select([table_a.c.id]).where(table_a.c.x == 5).
+        group_by(table_a.c.id),
+        lambda: select([table_a.c.id]).having(table_a.c.x == 5),
+        lambda: select([table_a.c.id]).distinct(),
+        lambda: select([table_a.c.id]).distinct(table_a.c.x),
+        lambda: select([table_a.c.id]).limit(5),
+        lambda: select([table_a.c.id]).limit(6),
+        lambda: select([table_a.c.id]).offset(5),
+        lambda: select([table_a.c.id]).with_for_update(),
+        lambda: select([table_a.c.id]).with_for_update(nowait=True),
+        lambda: select([table_a.c.id]).prefix_with('FOO'),
+        lambda: select([table_a.c.id]).suffix_with('FOO'),
+        lambda: select([table_a.c.id]).with_hint(table_a, 'hint'),
+        lambda: select([table_a.c.id]).apply_labels(),
+        lambda: select([table_a.c.id]).select_from(
+            table_a.join(table_b)),
+        lambda: select([table_a.c.id]).select_from(
+            table_a.outerjoin(table_b)),
+        lambda: select([table_a.c.id]).select_from(
+            table_a.join(table_b, table_a.c.x == table_b.c.id)),
+        lambda: select([table_c.c.q]),
+        lambda: select([table_c.c.p]),
+        lambda: select([table_a.c.id]).alias(),
+        lambda: select([table_a.c.id]).alias('foo'),
+        lambda: select([table_a.c.id]).cte(),
+        lambda: select([table_a.c.id]).cte(recursive=True),
+        lambda: select([table_a.c.id]).as_scalar(),
+        lambda: exists().where(table_a.c.id == 5),
+        lambda: union(select([table_a.c.id]), select([table_b.c.id])),
+        lambda: union_all(select([table_a.c.id]), select([table_b.c.id])),
+        lambda: select([table_a.c.id]).where(
+            table_a.c.id == select([table_b.c.a_id]).as_scalar()),
+        lambda: select([table_a.c.id]).where(
+            table_a.c.id == select([table_b.c.a_id]).
+            correlate(table_a).as_scalar()),
+        lambda: table_a.insert(),
+        lambda: table_a.insert().values(data='x'),
+        lambda: table_a.insert().values(data='y'),
+        lambda: table_a.insert().values(x=1),
+        lambda: table_a.insert().values(x=True),
+        lambda: table_a.insert().values(x=func.foo()),
+        lambda: table_a.insert().values([{'x': 1}, {'x': 2}]),
+        lambda: table_a.insert().returning(table_a.c.id),
+        lambda: table_a.insert().return_defaults(),
+        lambda: table_a.insert().from_select(
+            ['x'], select([table_b.c.id])),
+        lambda: table_a.insert().prefix_with('IGNORE'),
+        lambda: table_a.update(),
+        lambda: table_a.update().where(table_a.c.id == 5),
+        lambda: table_a.update().values(data='x'),
+        lambda: table_a.delete(),
+        lambda: table_a.delete().where(table_a.c.id == 5),
+        lambda: table_b.delete(),
+    ]
+
+    def _run_fixtures(self):
+        return [
+            (fixture(), fixture()) for fixture in self.fixtures
+        ]
+
+    def test_equivalent_constructs(self):
+        for idx, (a, b) in enumerate(self._run_fixtures()):
+            key_a, key_b = a._generate_cache_key(), b._generate_cache_key()
+            is_not_(key_a, None, "fixture %d" % idx)
+            eq_(key_a[0], key_b[0], "fixture %d" % idx)
+            eq_(hash(key_a[0]), hash(key_b[0]))
+
+    def test_distinct_constructs(self):
+        keys = [
+            (idx, a._generate_cache_key()[0])
+            for idx, (a, b) in enumerate(self._run_fixtures())
+        ]
+        for (idx_a, key_a), (idx_b, key_b) in \
+                itertools.combinations(keys, 2):
+            assert key_a != key_b, \
+                "fixtures %d and %d have the same key" % (idx_a, idx_b)
+
+    def test_elements_correspond(self):
+        for a, b in self._run_fixtures():
+            elements_a = a._generate_cache_key()[1]
+            elements_b = b._generate_cache_key()[1]
+            eq_(len(elements_a), len(elements_b))
+            for elem_a, elem_b in zip(elements_a, elements_b):
+                eq_(elem_a.__class__, elem_b.__class__)
+
+    def test_bind_values_not_in_key(self):
+        s1 = select([table_a.c.id]).where(table_a.c.x == 5)
+        s2 = select([table_a.c.id]).where(table_a.c.x == 10)
+        eq_(s1._generate_cache_key()[0], s2._generate_cache_key()[0])
+
+    def test_bind_names_in_key(self):
+        s1 = select([table_a]).where(table_a.c.x == bindparam('q'))
+        s2 = select([table_a]).where(table_a.c.x == bindparam('p'))
+        assert s1._generate_cache_key()[0] != s2._generate_cache_key()[0]
+
+    def test_shared_element_differs_from_copies(self):
+        a1 = table_a.alias()
+        a2, a3 = table_a.alias(), table_a.alias()
+        s1 = select([a1.c.id]).where(a1.c.x == 5)
+        s2 = select([a2.c.id]).where(a3.c.x == 5)
+        assert s1._generate_cache_key()[0] != s2._generate_cache_key()[0]
+
+    def test_tables_keyed_on_identity(self):
+        m2 = MetaData()
+        other_a = Table('a', m2,
+                        Column('id', Integer, primary_key=True),
+                        Column('data', String(20)),
+                        Column('x', Integer))
+        assert select([table_a])._generate_cache_key()[0] != \
+            select([other_a])._generate_cache_key()[0]
+
+    def test_ddl_not_cacheable(self):
+        is_(CreateTable(table_a)._generate_cache_key(), None)
+        is_(DDL("drop table foo")._generate_cache_key(), None)
+
+    def test_unknown_element_not_cacheable(self):
+        class MyElement(ColumnElement):
+            __visit_name__ = 'my_element'
+
+        is_(
+            select([table_a.c.id]).where(
+                table_a.c.x == MyElement())._generate_cache_key(),
+            None
+        )
+
+    def test_compiles_subclass_not_cacheable(self):
+        class MyFunc(functions.GenericFunction):
+            name = 'my_func_for_caching'
+
+        assert MyFunc._cache_key_traversal is not None
+
+        class MyOtherFunc(functions.GenericFunction):
+            name = 'my_other_func_for_caching'
+
+        @compiles(MyOtherFunc)
+        def visit_my_other_func(element, compiler, **kw):
+            return "MY_OTHER()"
+
+        is_(select([MyOtherFunc()])._generate_cache_key(), None)
+        is_not_(select([MyFunc()])._generate_cache_key(), None)
+
+    def test_unhashable_literal_not_cacheable(self):
+        is_(
+            table_a.insert().values(data=['x'])._generate_cache_key(),
+            None
+        )
+
+    def test_generate_cache_key_function(self):
+        stmt = select([table_a.c.id]).where(table_a.c.x == 5)
+        eq_(visitors.generate_cache_key(stmt), stmt._generate_cache_key())
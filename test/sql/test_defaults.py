@@ -754,6 +754,15 @@ class SequenceExecTest(fixtures.TestBase):
         s = Sequence("my_sequence", optional=True)
         self._assert_seq_result(s.execute(testing.db))
 
+    def test_fetch_sequence_values(self):
+        s = Sequence("my_sequence")
+        with testing.db.connect() as conn:
+            values = conn.dialect.fetch_sequence_values(conn, s, 5)
+        eq_(len(values), 5)
+        eq_(len(set(values)), 5)
+        for ret in values:
+            self._assert_seq_result(ret)
+
     def test_func_implicit_connectionless_execute(self):
         """test func.next_value().execute()/.scalar() works
         with connectionless execution. """
@@ -5,7 +5,7 @@ from sqlalchemy import Column, Integer, MetaData, String, Table,\
 from sqlalchemy.dialects import mysql, postgresql
 from sqlalchemy.engine import default
 from sqlalchemy.testing import AssertsCompiledSQL,\
-    assert_raises_message, fixtures
+    assert_raises_message, fixtures, eq_
 
 
 class _InsertTestBase(object):
@@ -705,3 +705,45 @@ class MultirowTest(_InsertTestBase, fixtures.TablesTest, AssertsCompiledSQL):
             '(%(id_2)s, %(data_2)s, %(foo_2)s)',
             checkparams=checkparams,
             dialect=postgresql.dialect())
+
+
+class SingleValuesExprTest(_InsertTestBase, fixtures.TablesTest):
+
+    def _compile(self, stmt, dialect=None):
+        if dialect is None:
+            dialect = default.DefaultDialect()
+            dialect.supports_multivalues_insert = True
+        return stmt.compile(dialect=dialect)
+
+    def test_single_row(self):
+        table1 = self.tables.mytable
+        compiled = self._compile(table1.insert())
+        eq_(compiled.insert_single_values_expr,
+            ":myid, :name, :description")
+
+    def test_single_row_sql_expression(self):
+        table1 = self.tables.mytable
+        compiled = self._compile(
+            table1.insert().values(name=func.lower(bindparam('name'))),
+            dialect=postgresql.dialect())
+        eq_(compiled.insert_single_values_expr, "lower(%(name)s)")
+
+    def test_positional(self):
+        table1 = self.tables.mytable
+        dialect = default.DefaultDialect(paramstyle='qmark')
+        compiled = self._compile(table1.insert(), dialect=dialect)
+        eq_(compiled.insert_single_values_expr, "?, ?, ?")
+
+    def test_multirow(self):
+        table1 = self.tables.mytable
+        compiled = self._compile(
+            table1.insert().values([{'myid': 1}, {'myid': 2}]))
+        eq_(compiled.insert_single_values_expr, None)
+
+    def test_from_select(self):
+        table1 = self.tables.mytable
+        compiled = self._compile(
+            self.tables.myothertable.insert().from_select(
+                ("otherid", "othername"),
+                select([table1.c.myid, table1.c.name])))
+        eq_(compiled.insert_single_values_expr, None)
@@ -9,6 +9,7 @@ from sqlalchemy import (
     TypeDecorator, or_, cast, table, column)
 from sqlalchemy.engine import default, result as _result
 from sqlalchemy.testing.schema import Table, Column
+import threading
 
 # ongoing - these are old tests.  those which are of general use
 # to test a dialect are being slowly migrated to
@@ -1815,6 +1816,145 @@ class KeyTargetingTest(fixtures.TablesTest):
         assert stmt.c.keyed2_b in row
 
 
+class WideResultTest(fixtures.TablesTest):
+    run_inserts = 'once'
+    run_deletes = None
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            'wide', metadata,
+            *[Column('c%d' % i, Integer) for i in range(60)]
+        )
+        Table('other', metadata, Column('c1', Integer), Column('q', Integer))
+
+    @classmethod
+    def insert_data(cls):
+        cls.tables.wide.insert().execute(
+            dict(('c%d' % i, i) for i in range(60)))
+        cls.tables.other.insert().execute(c1=100, q=101)
+
+    def test_keymap_deferred(self):
+        wide = self.tables.wide
+        # a statement not otherwise used, as the keymap is memoized
+        # on the compiled form
+        result = testing.db.execute(select([wide]).where(wide.c.c0 == 0))
+        metadata = result._metadata
+        assert metadata._pending is not None
+        row = result.first()
+        eq_(row[5], 5)
+        assert metadata._pending is not None
+
+        eq_(row['c7'], 7)
+        assert metadata._pending is None
+        eq_(row[wide.c.c9], 9)
+        eq_(row.c11, 11)
+        eq_(len(row), 60)
+
+    def test_keymap_deferred_threaded(self):
+        wide = self.tables.wide
+        # rows of each execution of the same compiled share one metadata
+        compiled = select([wide]).where(wide.c.c1 == 1).compile(testing.db)
+        rows = [testing.db.execute(compiled).first() for i in range(8)]
+        metadata = rows[0]._parent
+        for row in rows:
+            assert row._parent is metadata
+        assert metadata._pending is not None
+
+        start = threading.Event()
+        errors = []
+
+        def access(row):
+            start.wait()
+            try:
+                for i in reversed(range(60)):
+                    eq_(row['c%d' % i], i)
+            except Exception as err:
+                errors.append(err)
+
+        threads = [
+            threading.Thread(target=access, args=(row, )) for row in rows]
+        for th in threads:
+            th.start()
+        start.set()
+        for th in threads:
+            th.join(10)
+
+        eq_(errors, [])
+        assert metadata._pending is None
+
+    def test_column_key(self):
+        wide = self.tables.wide
+        row = testing.db.execute(select([wide])).first()
+        eq_(row[wide.c.c9], 9)
+        assert wide.c.c10 in row
+        assert 'c10' in row
+        assert 'nonexistent' not in row
+
+    def test_ambiguous(self):
+        wide, other = self.tables.wide, self.tables.other
+        stmt = select([wide, other]).select_from(wide.join(other, sql.true()))
+        row = testing.db.execute(stmt).first()
+        eq_(row['q'], 101)
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "Ambiguous column name",
+            lambda: row['c1']
+        )
+
+        stmt = stmt.apply_labels()
+        row = testing.db.execute(stmt).first()
+        eq_(row[other.c.c1], 100)
+        eq_(row[wide.c.c1], 1)
+        eq_(row['other_c1'], 100)
+
+    def test_no_such_column(self):
+        wide = self.tables.wide
+        row = testing.db.execute(select([wide])).first()
+        assert_raises_message(
+            exc.NoSuchColumnError,
+            "Could not locate column in row for column 'nonexistent'",
+            lambda: row['nonexistent']
+        )
+
+    def test_pickle(self):
+        wide = self.tables.wide
+        row = testing.db.execute(select([wide])).first()
+        for loads, dumps in testing.util.picklers():
+            unpickled = loads(dumps(row))
+            eq_(unpickled['c3'], 3)
+            eq_(unpickled[4], 4)
+
+    def test_positional_rows(self):
+        other = self.tables.other
+        result = testing.db.execute(
+            select([other]).execution_options(positional_rows=True))
+        eq_(result.keys(), ['c1', 'q'])
+        row = result.first()
+        eq_(row[0], 100)
+        # integer lookups are memoized for the Python version of RowProxy
+        eq_(result._metadata._key_fallback(1)[2], 1)
+        assert 1 in result._metadata._keymap
+        eq_(row[0:2], (100, 101))
+        eq_(tuple(row), (100, 101))
+        assert 'c1' not in row
+        for key in ('c1', other.c.c1):
+            assert_raises_message(
+                exc.InvalidRequestError,
+                "Rows of this result are accessible by integer position only",
+                lambda: row[key]
+            )
+
+    def test_positional_rows_not_shared(self):
+        other = self.tables.other
+        stmt = select([other])
+        row = testing.db.execute(
+            stmt.execution_options(positional_rows=True)).first()
+        eq_(row[1], 101)
+        eq_(testing.db.execute(stmt).first()['q'], 101)
+
+
 class LimitTest(fixtures.TestBase):
     __backend__ = True
 